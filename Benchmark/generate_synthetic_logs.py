@@ -0,0 +1,280 @@
+import argparse
+import os
+import numpy as np
+import pandas as pd
+
+# Header names exactly as the drive-test exports (and therefore the analyzers) spell them
+HTTP_EVENT_COLUMN = '[Call Test] [HTTP Transfer] HTTP Transfer Call Event'
+IPERF_EVENT_COLUMN = '[Event][Data call test detail events]IPERF Call Event'
+PING_EVENT_COLUMN = '[Event] [Data call test detail events] Ping Call Event'
+PING_RTT_COLUMN = '[Call Test] [PING] [RTT] RTT'
+DL_TP_COLUMN = '[Call Test] [Throughput] Application DL TP'
+UL_TP_COLUMN = '[Call Test] [Throughput] Application UL TP'
+PDSCH_TP_COLUMN = '[NR5G] [(NR + LTE)] [Throughput] PDSCH TP'
+DL_JITTER_COLUMN = '[Call Test] [iPerf] [Throughput] DL Jitter'
+DL_ERROR_RATIO_COLUMN = '[Call Test] [iPerf] [Throughput] DL Error Ratio'
+VOICE_CALL_EVENT_COLUMN = '[Event] Voice Call Event'
+SIP_REQUEST_METHOD_COLUMN = '[Packet Data] [SIP] Request Method'
+SIP_STATUS_COLUMN = '[Packet Data] [SIP] Status'
+SIP_SETUP_DURATION_COLUMN = '[Call Test] [VoNR VoLTE] [Duration] SIP Setup Duration (Invite~200OK)'
+CALL_TYPE_COLUMN = '[Call Test] Call Type'
+REAL_SERVICE_COLUMN = '[Call Test] [Voice or Video Call] Real Service'
+CALL_RESULT_COLUMN = '[Call Test] Call Result'
+LATITUDE_COLUMN = '[General] [GPS] Latitude'
+LONGITUDE_COLUMN = '[General] [GPS] Longitude'
+SERVING_NETWORK_COLUMN = '[General] Serving Network'
+RSRP_COLUMN = '[NR5G] [RF] RSRP'
+TX_POWER_COLUMN = '[NR5G] [Power] Tx power (Total Actual)'
+MOS_VALUE_COLUMN = '[Call Test] [Voice Quality] [Per Rx Clip] MOS Value'
+CALL_DROP_EVENT = '[Tool] Voice - Call Result : Drop'
+
+# Base station of the coverage tests (see Coverage/coverage_coordinate_analyzer.py)
+BASE_STATION_LATITUDE = 47.128234
+BASE_STATION_LONGITUDE = -122.356792
+
+# Real exports carry a few hundred columns; the filler columns keep parsing costs realistic
+DEFAULT_FILLER_COLUMN_COUNT = 40
+
+def _interval_bounds(row_count, interval_count, rng, gap_rows=1):
+    """
+    Splits row_count rows into interval_count disjoint (start, end) row ranges with at least
+    gap_rows rows between them, with random lengths. Returns a list of (start, end) tuples (end inclusive).
+    """
+    interval_count = max(1, min(interval_count, row_count // (gap_rows + 2)))
+    slot_rows = row_count // interval_count
+    bounds = []
+    for slot in range(interval_count):
+        slot_start = slot * slot_rows
+        length = int(rng.integers(max(2, slot_rows // 2), max(3, slot_rows - gap_rows)))
+        bounds.append((slot_start, slot_start + length - 1))
+    return bounds
+
+def _sparse(values, rng, missing_ratio):
+    """
+    Blanks out a random share of the values, like the sparsely sampled metric columns of the exports.
+    """
+    values = np.asarray(values, dtype=float).copy()
+    values[rng.random(len(values)) < missing_ratio] = np.nan
+    return values
+
+def _write_log(file_path, columns, row_count, rng, filler_column_count):
+    """
+    Adds the filler columns and writes the log as CSV.
+    """
+    for filler_index in range(filler_column_count):
+        columns[f'[Filler] [Metric {filler_index}] Value {filler_index}'] = _sparse(rng.normal(0, 1, row_count), rng, 0.5)
+    os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+    # Six decimals, like the exports
+    data = pd.DataFrame(columns).round(6)
+    data.to_csv(file_path, index=False)
+    return file_path
+
+def generate_http_throughput_log(file_path, row_count=100000, interval_count=20, direction="DL", seed=0, filler_column_count=DEFAULT_FILLER_COLUMN_COUNT):
+    """
+    Writes an HTTP transfer log with Download/Upload Started and Ended events around each transfer.
+
+    Args:
+        file_path (str): The CSV file to write.
+        row_count (int): Number of data rows.
+        interval_count (int): Number of transfers (start/end event pairs).
+        direction (str): "DL" or "UL".
+        seed (int): Random seed, so fixtures are reproducible.
+        filler_column_count (int): Number of unrelated columns to add.
+
+    Returns:
+        str: The file path.
+    """
+    rng = np.random.default_rng(seed)
+    verb = "Download" if direction == "DL" else "Upload"
+    events = np.full(row_count, None, dtype=object)
+    throughput = np.full(row_count, np.nan)
+    for start, end in _interval_bounds(row_count, interval_count, rng):
+        events[start] = f"{verb} Started"
+        events[end] = f"{verb} Ended"
+        throughput[start:end + 1] = rng.normal(400 if direction == "DL" else 80, 40, end - start + 1)
+    columns = {
+        HTTP_EVENT_COLUMN: events,
+        DL_TP_COLUMN if direction == "DL" else UL_TP_COLUMN: _sparse(throughput, rng, 0.2),
+        PDSCH_TP_COLUMN: _sparse(rng.normal(420, 50, row_count), rng, 0.3),
+    }
+    return _write_log(file_path, columns, row_count, rng, filler_column_count)
+
+def generate_udp_log(file_path, row_count=100000, interval_count=20, seed=0, filler_column_count=DEFAULT_FILLER_COLUMN_COUNT):
+    """
+    Writes a DL UDP (iPerf) log with IPERF_T_Start/IPERF_T_End events, throughput, jitter and error ratio.
+    Arguments as for generate_http_throughput_log.
+    """
+    rng = np.random.default_rng(seed)
+    events = np.full(row_count, None, dtype=object)
+    throughput = np.full(row_count, np.nan)
+    for start, end in _interval_bounds(row_count, interval_count, rng):
+        events[start] = "IPERF_T_Start"
+        events[end] = "IPERF_T_End"
+        throughput[start:end + 1] = rng.normal(300, 30, end - start + 1)
+    columns = {
+        IPERF_EVENT_COLUMN: events,
+        DL_TP_COLUMN: _sparse(throughput, rng, 0.2),
+        DL_JITTER_COLUMN: _sparse(rng.gamma(2.0, 0.5, row_count), rng, 0.9),
+        DL_ERROR_RATIO_COLUMN: _sparse(rng.random(row_count) * 0.02, rng, 0.9),
+    }
+    return _write_log(file_path, columns, row_count, rng, filler_column_count)
+
+def generate_ping_log(file_path, row_count=100000, interval_count=20, seed=0, filler_column_count=DEFAULT_FILLER_COLUMN_COUNT):
+    """
+    Writes a PING log with PING Traffic Start/End blocks and RTT samples inside them.
+    Arguments as for generate_http_throughput_log.
+    """
+    rng = np.random.default_rng(seed)
+    events = np.full(row_count, None, dtype=object)
+    rtt = _sparse(rng.gamma(9.0, 3.0, row_count), rng, 0.5)
+    for start, end in _interval_bounds(row_count, interval_count, rng):
+        events[start] = "PING Traffic Start"
+        events[end] = "PING Traffic End"
+    columns = {PING_EVENT_COLUMN: events, PING_RTT_COLUMN: rtt}
+    return _write_log(file_path, columns, row_count, rng, filler_column_count)
+
+def generate_mrab_log(file_path, row_count=100000, interval_count=30, seed=0, filler_column_count=DEFAULT_FILLER_COLUMN_COUNT):
+    """
+    Writes an MRAB log whose DL throughput bursts are separated by more than 10 blank rows,
+    the default gap that mrab_statistics.extract_intervals_and_values splits intervals on.
+    Arguments as for generate_http_throughput_log; interval_count is best kept a multiple of 3
+    (pre call, in call and post call groups).
+    """
+    rng = np.random.default_rng(seed)
+    throughput = np.full(row_count, np.nan)
+    for start, end in _interval_bounds(row_count, interval_count, rng, gap_rows=12):
+        throughput[start:end + 1] = rng.normal(50, 10, end - start + 1)
+        # Short gaps inside a burst must not split it
+        short_gap_start = int(rng.integers(start, end + 1))
+        throughput[short_gap_start:min(end, short_gap_start + 5)] = np.nan
+    columns = {DL_TP_COLUMN: throughput}
+    return _write_log(file_path, columns, row_count, rng, filler_column_count)
+
+def generate_call_log(file_path, row_count=100000, call_count=50, seed=0, filler_column_count=DEFAULT_FILLER_COLUMN_COUNT):
+    """
+    Writes a voice call log: each call starts with 'Voice - Call Scheduling Start(Orig)' and reports its
+    call type, result, RAT and SIP setup duration; some calls are declined with a SIP 603.
+
+    Args:
+        file_path (str): The CSV file to write.
+        row_count (int): Number of data rows.
+        call_count (int): Number of call attempts.
+        seed (int): Random seed, so fixtures are reproducible.
+        filler_column_count (int): Number of unrelated columns to add.
+
+    Returns:
+        str: The file path.
+    """
+    rng = np.random.default_rng(seed)
+    voice_events = np.full(row_count, None, dtype=object)
+    sip_methods = np.full(row_count, None, dtype=object)
+    sip_statuses = np.full(row_count, None, dtype=object)
+    call_types = np.full(row_count, None, dtype=object)
+    real_services = np.full(row_count, None, dtype=object)
+    call_results = np.full(row_count, None, dtype=object)
+    setup_durations = np.full(row_count, np.nan)
+    for start, end in _interval_bounds(row_count, call_count, rng):
+        voice_events[start] = 'Voice - Call Scheduling Start(Orig)'
+        sip_methods[min(start + 1, end)] = 'INVITE'
+        if rng.random() < 0.05:
+            sip_statuses[min(start + 2, end)] = 'SIP/2.0 603 Declined'
+        else:
+            sip_statuses[min(start + 2, end)] = 'SIP/2.0 200 OK'
+            setup_durations[min(start + 2, end)] = rng.gamma(4.0, 0.4)
+        call_types[end] = rng.choice(['MO Voice', 'MT Voice'])
+        real_services[end] = rng.choice(['VoNR', 'VoLTE'], p=[0.8, 0.2])
+        call_results[end] = rng.choice(['Success', 'Orig. Fail', 'Drop'], p=[0.94, 0.03, 0.03])
+    columns = {
+        VOICE_CALL_EVENT_COLUMN: voice_events,
+        SIP_REQUEST_METHOD_COLUMN: sip_methods,
+        SIP_STATUS_COLUMN: sip_statuses,
+        SIP_SETUP_DURATION_COLUMN: setup_durations,
+        CALL_TYPE_COLUMN: call_types,
+        REAL_SERVICE_COLUMN: real_services,
+        CALL_RESULT_COLUMN: call_results,
+    }
+    return _write_log(file_path, columns, row_count, rng, filler_column_count)
+
+def generate_coverage_log(file_path, row_count=100000, seed=0, filler_column_count=DEFAULT_FILLER_COLUMN_COUNT):
+    """
+    Writes a coverage drive log moving away from the base station: sparse GPS fixes, throughput and
+    RSRP degrading with distance, a call drop and 'No service' towards the end of the drive.
+
+    Args:
+        file_path (str): The CSV file to write.
+        row_count (int): Number of data rows.
+        seed (int): Random seed, so fixtures are reproducible.
+        filler_column_count (int): Number of unrelated columns to add.
+
+    Returns:
+        str: The file path.
+    """
+    rng = np.random.default_rng(seed)
+    progress = np.linspace(0.0, 1.0, row_count)
+    latitudes = BASE_STATION_LATITUDE + progress * 0.05 + rng.normal(0, 1e-5, row_count)
+    longitudes = BASE_STATION_LONGITUDE - progress * 0.05 + rng.normal(0, 1e-5, row_count)
+    gps_missing = rng.random(row_count) < 0.7 # GPS fixes arrive far less often than radio samples
+    latitudes[gps_missing] = np.nan
+    longitudes[gps_missing] = np.nan
+
+    no_service_row = int(row_count * 0.9)
+    drop_row = int(row_count * 0.85)
+    serving_networks = np.where(np.arange(row_count) < no_service_row, '5G NR', 'No service').astype(object)
+    voice_events = np.full(row_count, None, dtype=object)
+    voice_events[drop_row] = CALL_DROP_EVENT
+
+    columns = {
+        VOICE_CALL_EVENT_COLUMN: voice_events,
+        MOS_VALUE_COLUMN: _sparse(4.2 - progress * 2.0 + rng.normal(0, 0.2, row_count), rng, 0.95),
+        DL_TP_COLUMN: _sparse(np.maximum(0.0, 50 * (1 - progress) + rng.normal(0, 2, row_count)), rng, 0.5),
+        UL_TP_COLUMN: _sparse(np.maximum(0.0, 10 * (1 - progress) + rng.normal(0, 1, row_count)), rng, 0.5),
+        LATITUDE_COLUMN: latitudes,
+        LONGITUDE_COLUMN: longitudes,
+        SERVING_NETWORK_COLUMN: serving_networks,
+        RSRP_COLUMN: _sparse(-70 - progress * 50 + rng.normal(0, 3, row_count), rng, 0.3),
+        TX_POWER_COLUMN: _sparse(np.minimum(26.0, 5 + progress * 25 + rng.normal(0, 1, row_count)), rng, 0.3),
+    }
+    return _write_log(file_path, columns, row_count, rng, filler_column_count)
+
+# Log kind -> (generator, file name); file names follow the Raw Data naming the analyzers parse
+LOG_GENERATORS = {
+    "http": (generate_http_throughput_log, "5G HTTP DL DUT.csv"),
+    "udp": (generate_udp_log, "5G UDP DL DUT.csv"),
+    "ping": (generate_ping_log, "5G PING DUT.csv"),
+    "mrab": (generate_mrab_log, "5G VoNR MRAB DUT.csv"),
+    "call": (generate_call_log, "DUT Call.csv"),
+    "coverage": (generate_coverage_log, "PC2.csv"),
+}
+
+def generate_logs(output_dir, row_count, interval_count, kinds=None, seed=0, filler_column_count=DEFAULT_FILLER_COLUMN_COUNT):
+    """
+    Writes one synthetic log of each requested kind to output_dir.
+
+    Returns:
+        dict: Log kind -> written file path.
+    """
+    written_files = {}
+    for kind in kinds or LOG_GENERATORS:
+        generator, file_name = LOG_GENERATORS[kind]
+        file_path = os.path.join(output_dir, file_name)
+        if kind == "coverage":
+            generator(file_path, row_count=row_count, seed=seed, filler_column_count=filler_column_count)
+        elif kind == "call":
+            generator(file_path, row_count=row_count, call_count=interval_count, seed=seed, filler_column_count=filler_column_count)
+        else:
+            generator(file_path, row_count=row_count, interval_count=interval_count, seed=seed, filler_column_count=filler_column_count)
+        written_files[kind] = file_path
+    return written_files
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate synthetic drive-test logs with the headers the analyzers expect.")
+    parser.add_argument("output_dir", help="Directory to write the CSV files to.")
+    parser.add_argument("--rows", type=int, default=100000, help="Number of data rows per log.")
+    parser.add_argument("--intervals", type=int, default=30, help="Number of intervals (transfers, ping blocks, MRAB bursts or calls) per log.")
+    parser.add_argument("--kinds", nargs="+", choices=sorted(LOG_GENERATORS), help="Log kinds to generate (default: all).")
+    parser.add_argument("--filler-columns", type=int, default=DEFAULT_FILLER_COLUMN_COUNT, help="Number of unrelated columns per log.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    args = parser.parse_args()
+
+    for kind, file_path in generate_logs(args.output_dir, args.rows, args.intervals, args.kinds, args.seed, args.filler_columns).items():
+        print(f"Generated {kind} log: {file_path}")
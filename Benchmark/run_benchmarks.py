@@ -0,0 +1,194 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import time
+
+# Add the 'Scripts' directory to sys.path so the analyzer packages can be imported
+scripts_parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if scripts_parent_dir not in sys.path:
+    sys.path.append(scripts_parent_dir)
+# The DataPerformance modules import each other as top-level modules, as when run_all_data_analysis.py runs them
+data_performance_dir = os.path.join(scripts_parent_dir, "DataPerformance")
+if data_performance_dir not in sys.path:
+    sys.path.append(data_performance_dir)
+
+import csv_loader
+import generate_synthetic_logs
+import data_performance_statics
+import ping_statics
+import mrab_statistics
+from CallPerformance import call_analyze
+from Coverage import coverage_coordinate_analyzer, coverage_performance_analyzer, n41_coverage_analyzer
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_FIXTURES_DIR = os.path.join(BENCHMARK_DIR, "fixtures")
+# Timings are machine specific, so the baselines stay local to the machine that recorded them
+DEFAULT_BASELINE_PATH = os.path.join(BENCHMARK_DIR, "baselines.json")
+DEFAULT_SIZES = [10000, 100000]
+# A benchmark is flagged when it is this much slower than its baseline...
+DEFAULT_SLOWDOWN_RATIO = 1.25
+# ...and slower by at least this many seconds, so timer noise on tiny runs is not reported
+MIN_SLOWDOWN_SECONDS = 0.05
+
+def _benchmark_http_throughput(file_path):
+    params = data_performance_statics._determine_analysis_parameters(file_path)
+    return data_performance_statics.analyze_throughput(
+        file_path,
+        params["column_to_analyze_throughput"],
+        params["event_col"],
+        params["start_event"],
+        params["end_event"],
+        params["column_to_analyze_throughput_fallback"],
+        params["event_col_fallback"],
+        params["column_to_analyze_throughput_third_fallback"]
+    )
+
+def _benchmark_udp_metrics(file_path):
+    params = data_performance_statics._determine_analysis_parameters(file_path)
+    return data_performance_statics.analyze_file_metrics(file_path, params)
+
+def _benchmark_ping_statistics(file_path):
+    return ping_statics.calculate_ping_statistics(file_path, "DUT")
+
+def _benchmark_mrab_statistics(file_path):
+    intervals = mrab_statistics.extract_intervals_and_values(file_path, generate_synthetic_logs.DL_TP_COLUMN)
+    return mrab_statistics.analyze_grouped_intervals(intervals)
+
+def _benchmark_n41_coverage(file_path):
+    return n41_coverage_analyzer.analyze_n41_coverage(os.path.dirname(file_path), device_type_filter="PC2")
+
+# Benchmark name -> (log kind from generate_synthetic_logs.LOG_GENERATORS, function timed on that log)
+BENCHMARKS = {
+    "analyze_throughput (HTTP DL)": ("http", _benchmark_http_throughput),
+    "analyze_file_metrics (UDP DL)": ("udp", _benchmark_udp_metrics),
+    "calculate_ping_statistics": ("ping", _benchmark_ping_statistics),
+    "mrab_statistics": ("mrab", _benchmark_mrab_statistics),
+    "analyze_call_data": ("call", call_analyze.analyze_call_data),
+    "analyze_coverage_coordinates": ("coverage", coverage_coordinate_analyzer.analyze_coverage_coordinates),
+    "coverage_performance analyze_csv": ("coverage", coverage_performance_analyzer.analyze_csv),
+    "analyze_n41_coverage": ("coverage", _benchmark_n41_coverage),
+}
+
+def prepare_fixtures(fixtures_dir, row_count, interval_count, seed, regenerate=False):
+    """
+    Returns the synthetic logs for one size, generating them only if they are not on disk yet.
+
+    Returns:
+        dict: Log kind -> file path.
+    """
+    size_dir = os.path.join(fixtures_dir, f"rows_{row_count}_intervals_{interval_count}_seed_{seed}")
+    file_paths = {kind: os.path.join(size_dir, file_name) for kind, (_, file_name) in generate_synthetic_logs.LOG_GENERATORS.items()}
+    if regenerate or not all(os.path.exists(file_path) for file_path in file_paths.values()):
+        print(f"Generating {row_count}-row fixtures in {size_dir} ...")
+        generate_synthetic_logs.generate_logs(size_dir, row_count, interval_count, seed=seed)
+    return file_paths
+
+def time_benchmark(benchmark_function, file_path, repeat):
+    """
+    Runs a benchmark `repeat` times with its console output suppressed.
+
+    Returns:
+        float: The best wall-clock time in seconds; the minimum is the least noisy estimate.
+    """
+    timings = []
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            started_at = time.perf_counter()
+            benchmark_function(file_path)
+            timings.append(time.perf_counter() - started_at)
+    return min(timings)
+
+def load_baselines(baseline_path):
+    """
+    Returns the stored baseline timings ({benchmark name: {row count: seconds}}), or {} if there are none.
+    """
+    try:
+        with open(baseline_path, 'r', encoding='utf-8') as f:
+            return json.load(f).get("timings", {})
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not read baselines from {baseline_path}: {e}")
+        return {}
+
+def save_baselines(baseline_path, timings):
+    """
+    Merges the given timings into the baseline file, keeping baselines of benchmarks and sizes that were not run.
+    """
+    baselines = load_baselines(baseline_path)
+    for benchmark_name, timings_by_size in timings.items():
+        baselines.setdefault(benchmark_name, {}).update(timings_by_size)
+    with open(baseline_path, 'w', encoding='utf-8') as f:
+        json.dump({"machine": platform.node(), "python": platform.python_version(), "timings": baselines}, f, indent=4)
+
+def compare_to_baselines(timings, baselines, slowdown_ratio=DEFAULT_SLOWDOWN_RATIO):
+    """
+    Compares timings with their baselines.
+
+    Returns:
+        list: One row per timing: (benchmark name, row count, seconds, baseline seconds or None, ratio or None, is_slowdown).
+    """
+    comparison = []
+    for benchmark_name, timings_by_size in timings.items():
+        for row_count, seconds in timings_by_size.items():
+            baseline_seconds = baselines.get(benchmark_name, {}).get(row_count)
+            ratio = seconds / baseline_seconds if baseline_seconds else None
+            is_slowdown = ratio is not None and ratio > slowdown_ratio and seconds - baseline_seconds > MIN_SLOWDOWN_SECONDS
+            comparison.append((benchmark_name, row_count, seconds, baseline_seconds, ratio, is_slowdown))
+    return comparison
+
+def print_comparison(comparison):
+    """
+    Prints the benchmark timings next to their baselines.
+    """
+    print(f"\n{'Benchmark':<36}{'Rows':>10}{'Time (s)':>11}{'Baseline (s)':>14}{'Ratio':>8}  Status")
+    for benchmark_name, row_count, seconds, baseline_seconds, ratio, is_slowdown in comparison:
+        baseline_text = f"{baseline_seconds:.3f}" if baseline_seconds is not None else "-"
+        ratio_text = f"{ratio:.2f}" if ratio is not None else "-"
+        status = "SLOWER" if is_slowdown else ("no baseline" if baseline_seconds is None else "ok")
+        print(f"{benchmark_name:<36}{row_count:>10}{seconds:>11.3f}{baseline_text:>14}{ratio_text:>8}  {status}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time the log analyzers on synthetic drive-test logs and flag slowdowns against stored baselines.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Row counts to benchmark.")
+    parser.add_argument("--intervals", type=int, default=30, help="Number of intervals (transfers, ping blocks, MRAB bursts or calls) per log.")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), metavar="BENCHMARK", help="Run only these benchmarks.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark; the best time is kept.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed of the synthetic logs.")
+    parser.add_argument("--fixtures-dir", default=DEFAULT_FIXTURES_DIR, help="Where the synthetic logs are generated and reused from.")
+    parser.add_argument("--regenerate", action="store_true", help="Regenerate the synthetic logs even if they exist.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH, help="JSON file holding the baseline timings.")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run's timings as the new baselines.")
+    parser.add_argument("--slowdown-ratio", type=float, default=DEFAULT_SLOWDOWN_RATIO, help="Flag benchmarks slower than this multiple of their baseline.")
+    parser.add_argument("--with-cache", action="store_true", help="Keep the parsed-log cache enabled (measures warm re-runs instead of CSV parsing).")
+    args = parser.parse_args()
+
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    csv_loader.configure_cache(enabled=args.with_cache)
+
+    timings = {}
+    for row_count in args.sizes:
+        file_paths = prepare_fixtures(args.fixtures_dir, row_count, args.intervals, args.seed, args.regenerate)
+        for benchmark_name in args.only or BENCHMARKS:
+            log_kind, benchmark_function = BENCHMARKS[benchmark_name]
+            seconds = time_benchmark(benchmark_function, file_paths[log_kind], args.repeat)
+            # JSON object keys are strings, so sizes are stored as strings too
+            timings.setdefault(benchmark_name, {})[str(row_count)] = seconds
+            print(f"{benchmark_name} ({row_count} rows): {seconds:.3f}s")
+
+    comparison = compare_to_baselines(timings, load_baselines(args.baseline), args.slowdown_ratio)
+    print_comparison(comparison)
+
+    if args.save_baseline:
+        save_baselines(args.baseline, timings)
+        print(f"\nBaselines saved to {args.baseline}")
+
+    slowdowns = [row for row in comparison if row[-1]]
+    if slowdowns:
+        print(f"\n{len(slowdowns)} benchmark(s) slower than {args.slowdown_ratio}x their baseline.")
+        sys.exit(1)
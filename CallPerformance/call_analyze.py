@@ -1,32 +1,19 @@
 import pandas as pd
 import sys
-import re
 import os
-from collections import defaultdict
 from scipy.stats import fisher_exact
 
-def _clean_header(header):
-    """
-    Removes content within square brackets (tags) and strips leading/trailing whitespace from a header string.
-    """
-    # Remove content within square brackets, including the brackets themselves
-    cleaned_header = re.sub(r'\[.*?\]', '', header)
-    # Strip leading/trailing whitespace
-    return cleaned_header.strip()
+# Add the 'Scripts' directory to sys.path so the shared csv_loader module can be imported
+scripts_parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if scripts_parent_dir not in sys.path:
+    sys.path.append(scripts_parent_dir)
 
-def analyze_call_data(file_path):
-    try:
-        df = pd.read_csv(file_path)
-    except FileNotFoundError:
-        print(f"Error: File not found at {file_path}")
-        return None, None, None, None, None
-    except Exception as e:
-        print(f"Error reading CSV file: {e}")
-        return None, None, None, None, None
+from csv_loader import read_projected_csv, load_cached_result, store_cached_result, _clean_header
 
-    # Apply the cleaning function to all column names in the DataFrame
-    df.columns = [_clean_header(col) for col in df.columns]
+# Name of the per-file call summaries memoized in the parsed-log cache; bump the version when analyze_call_data changes
+CALL_SUMMARY_RESULT_NAME = "call_summary_v1"
 
+def analyze_call_data(file_path):
     # Define cleaned header names
     packet_data_sip_request_method_col = _clean_header('[Packet Data] [SIP] Request Method')
     event_voice_call_event_col = _clean_header('[Event] Voice Call Event')
@@ -36,30 +23,35 @@ def analyze_call_data(file_path):
     call_test_real_service_col = _clean_header('[Call Test] [Voice or Video Call] Real Service')
     call_test_call_result_col = _clean_header('[Call Test] Call Result') # New cleaned header
 
-    # Initialize a column to mark rows for exclusion
-    df['exclude_from_stats'] = False
+    # Only the columns used below are parsed; text columns are read as strings and the setup duration as floats
+    # (it is still converted with pd.to_numeric further down, in case it falls back to an inferred dtype)
+    text_columns = [event_voice_call_event_col, packet_data_sip_status_col, call_test_call_type_col, call_test_real_service_col, call_test_call_result_col]
+    try:
+        df = read_projected_csv(
+            file_path,
+            text_columns + [sip_setup_duration_col],
+            dtypes={**{col: str for col in text_columns}, sip_setup_duration_col: 'float64'},
+            clean_headers=True
+        )
+    except FileNotFoundError:
+        print(f"Error: File not found at {file_path}")
+        return None, None, None, None, None, None, None, None, None
+    except Exception as e:
+        print(f"Error reading CSV file: {e}")
+        return None, None, None, None, None, None, None, None, None
 
-    # Find all occurrences of 'Voice - Call Scheduling Start(Orig)'
+    # Number the call sections once: every 'Voice - Call Scheduling Start(Orig)' row opens a new section that runs
+    # up to the row before the next one. Rows before the first start have section id 0 and belong to no section.
     # Escaping parentheses to treat them as literal characters, and using regex=True explicitly
-    start_indices = df[df[event_voice_call_event_col].astype(str).str.contains(r'Voice - Call Scheduling Start\(Orig\)', na=False, regex=True)].index.tolist()
-    # print(f"Found {len(start_indices)} 'Voice - Call Scheduling Start(Orig)' events at indices: {start_indices}") # Commented out for cleaner output
-
-    for i, start_idx in enumerate(start_indices):
-        # Determine the end of the current section
-        # The section ends at the row before the next 'Voice - Call Scheduling Start(Orig)'
-        # or at the end of the DataFrame if it's the last occurrence.
-        end_idx = start_indices[i+1] - 1 if i + 1 < len(start_indices) else len(df) - 1
-
-        # Ensure end_idx does not exceed DataFrame bounds
-        end_idx = min(end_idx, len(df) - 1)
-
-        # Check for '603 Declined' within the current section
-        section = df.loc[start_idx : end_idx]
-        if section[packet_data_sip_status_col].astype(str).str.contains('603 Declined', na=False).any():
-            df.loc[start_idx : end_idx, 'exclude_from_stats'] = True
-            # print(f"Marking rows from index {start_idx} to {end_idx} for exclusion due to '603 Declined' in section.") # Commented out
-        # else:
-            # print(f"Section from index {start_idx} to {end_idx} does not contain '603 Declined'.") # Commented out
+    is_section_start = df[event_voice_call_event_col].astype(str).str.contains(r'Voice - Call Scheduling Start\(Orig\)', na=False, regex=True)
+    section_ids = is_section_start.cumsum()
+
+    # A section is excluded as a whole if any of its rows contains '603 Declined'; a log without the SIP status column has none
+    if packet_data_sip_status_col in df.columns:
+        is_declined = df[packet_data_sip_status_col].astype(str).str.contains('603 Declined', na=False)
+    else:
+        is_declined = pd.Series(False, index=df.index)
+    df['exclude_from_stats'] = is_declined.groupby(section_ids).transform('any') & (section_ids > 0)
 
     # Filter out the rows marked for exclusion
     df_filtered = df[~df['exclude_from_stats']]
@@ -125,65 +117,117 @@ def analyze_call_data(file_path):
 
     return total_attempts, total_mo_attempts, initiation_failures, retention_failures, initiation_successes, call_result_distribution, rat_distribution, total_setup_duration, setup_duration_count
 
-def analyze_directory(directory_path):
-    total_attempts_sum = 0
-    total_mo_attempts_sum = 0
-    total_initiation_failures_sum = 0
-    total_retention_failures_sum = 0
-    total_initiation_successes_sum = 0
-    aggregated_call_results = defaultdict(int)
-    aggregated_rat_distribution = defaultdict(int)
-    aggregated_total_setup_duration = 0
-    aggregated_setup_duration_count = 0
-    
+def _empty_call_summary():
+    """
+    Returns the call summary of no files, the identity of _merge_call_summaries.
+    """
+    return {
+        "total_attempts": 0,
+        "total_mo_attempts": 0,
+        "total_initiation_failures": 0,
+        "total_retention_failures": 0,
+        "total_initiation_successes": 0,
+        "call_result_distribution": {},
+        "rat_distribution": {},
+        "total_setup_duration": 0,
+        "setup_duration_count": 0,
+    }
+
+def _merge_call_summaries(summary, other):
+    """
+    Adds two call summaries. The merge is associative, so per-file summaries can be computed in any
+    process and reduced afterwards; reducing them in file order gives the serial sums exactly,
+    including the key order of the distributions.
+    """
+    merged = {key: summary[key] + other[key] for key in summary if key not in ["call_result_distribution", "rat_distribution"]}
+    for distribution_key in ["call_result_distribution", "rat_distribution"]:
+        distribution = dict(summary[distribution_key])
+        for value, count in other[distribution_key].items():
+            distribution[value] = distribution.get(value, 0) + count
+        merged[distribution_key] = distribution
+    return merged
+
+def _analyze_call_file(file_path):
+    """
+    Analyzes one call log and returns its counts as a call summary,
+    or None if analyze_call_data could not read the log.
+    """
+    print(f"Analyzing file: {file_path}")
+    total_attempts, total_mo_attempts, initiation_failures, retention_failures, initiation_successes, call_result_distribution, rat_distribution, total_setup_duration, setup_duration_count = analyze_call_data(file_path)
+    if total_attempts is None:
+        return None
+    file_counts = {
+        "total_attempts": total_attempts,
+        "total_mo_attempts": total_mo_attempts,
+        "total_initiation_failures": initiation_failures,
+        "total_retention_failures": retention_failures,
+        "total_initiation_successes": initiation_successes,
+        "call_result_distribution": call_result_distribution,
+        "rat_distribution": rat_distribution,
+        "total_setup_duration": total_setup_duration,
+        "setup_duration_count": setup_duration_count,
+    }
+    summary = _empty_call_summary()
+    summary.update(file_counts)
+    # Plain ints and floats, so the summary can be memoized as JSON
+    summary["total_setup_duration"] = float(summary["total_setup_duration"])
+    summary["setup_duration_count"] = int(summary["setup_duration_count"])
+    return summary
+
+def analyze_directory(directory_path, executor=None):
+    """
+    Analyzes every call log under a directory and aggregates the counts.
+    The summary of each log is memoized in the parsed-log cache, so only new or changed logs are parsed again;
+    unchanged ones are merged from their stored summaries.
+
+    Args:
+        directory_path (str): The DUT or REF directory to walk.
+        executor (concurrent.futures.Executor, optional): If given, the files are analyzed in its workers.
+                                                          The result is identical to a serial run.
+
+    Returns:
+        dict: The aggregated call statistics.
+    """
+    file_paths = []
     for root, _, files in os.walk(directory_path):
         for file in files:
             if file.endswith('.csv'):
-                file_path = os.path.join(root, file)
-                print(f"Analyzing file: {file_path}")
-                total_attempts, total_mo_attempts, initiation_failures, retention_failures, initiation_successes, call_result_distribution, rat_distribution, total_setup_duration, setup_duration_count = analyze_call_data(file_path)
-                
-                if total_attempts is not None:
-                    total_attempts_sum += total_attempts
-                
-                if total_mo_attempts is not None:
-                    total_mo_attempts_sum += total_mo_attempts
-
-                if initiation_failures is not None:
-                    total_initiation_failures_sum += initiation_failures
-
-                if retention_failures is not None:
-                    total_retention_failures_sum += retention_failures
-
-                if initiation_successes is not None:
-                    total_initiation_successes_sum += initiation_successes
-
-                if call_result_distribution is not None:
-                    for result, count in call_result_distribution.items():
-                        aggregated_call_results[result] += count
-                
-                if rat_distribution is not None:
-                    for rat, count in rat_distribution.items():
-                        aggregated_rat_distribution[rat] += count
-                
-                if total_setup_duration is not None:
-                    aggregated_total_setup_duration += total_setup_duration
-                if setup_duration_count is not None:
-                    aggregated_setup_duration_count += setup_duration_count
-                        
+                file_paths.append(os.path.join(root, file))
+
+    # Take each file's stat before it is analyzed, so a log that changes meanwhile is not memoized as fresh
+    file_stats = {file_path: os.stat(file_path) for file_path in file_paths}
+    cached_summaries = {file_path: load_cached_result(file_path, CALL_SUMMARY_RESULT_NAME) for file_path in file_paths}
+    changed_file_paths = [file_path for file_path in file_paths if cached_summaries[file_path] is None]
+    if len(changed_file_paths) < len(file_paths):
+        print(f"Using memoized call summaries for {len(file_paths) - len(changed_file_paths)} unchanged files in {directory_path}")
+
+    # Executor.map yields the summaries in file order, like the serial map
+    new_summaries = executor.map(_analyze_call_file, changed_file_paths) if executor is not None else map(_analyze_call_file, changed_file_paths)
+    for file_path, file_summary in zip(changed_file_paths, new_summaries):
+        # A log that could not be read (e.g. locked) is neither memoized nor counted, so it is retried on the next run
+        if file_summary is not None:
+            store_cached_result(file_path, CALL_SUMMARY_RESULT_NAME, file_summary, file_stats[file_path])
+        cached_summaries[file_path] = file_summary
+
+    # Reducing in file order adds the counts up exactly as the serial loop did
+    totals = _empty_call_summary()
+    for file_path in file_paths:
+        if cached_summaries[file_path] is not None:
+            totals = _merge_call_summaries(totals, cached_summaries[file_path])
+
     mean_setup_time = None
-    if aggregated_setup_duration_count > 0:
-        mean_setup_time = aggregated_total_setup_duration / aggregated_setup_duration_count
+    if totals["setup_duration_count"] > 0:
+        mean_setup_time = totals["total_setup_duration"] / totals["setup_duration_count"]
 
     # Prepare the results dictionary
     analysis_results = {
-        "total_attempts": total_attempts_sum,
-        "total_mo_attempts": total_mo_attempts_sum,
-        "total_initiation_failures": total_initiation_failures_sum,
-        "total_retention_failures": total_retention_failures_sum,
-        "total_initiation_successes": total_initiation_successes_sum,
-        "call_result_distribution": dict(aggregated_call_results),
-        "rat_distribution": dict(aggregated_rat_distribution),
+        "total_attempts": totals["total_attempts"],
+        "total_mo_attempts": totals["total_mo_attempts"],
+        "total_initiation_failures": totals["total_initiation_failures"],
+        "total_retention_failures": totals["total_retention_failures"],
+        "total_initiation_successes": totals["total_initiation_successes"],
+        "call_result_distribution": totals["call_result_distribution"],
+        "rat_distribution": totals["rat_distribution"],
         "mean_setup_time": mean_setup_time
     }
     
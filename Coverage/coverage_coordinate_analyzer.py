@@ -1,13 +1,29 @@
 import csv
+import io
 import argparse
 import os
+import sys
 import json
 import math
+import numpy as np
+import pandas as pd
+
+# Add the 'Scripts' directory to sys.path so the shared csv_loader module can be imported
+scripts_parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if scripts_parent_dir not in sys.path:
+    sys.path.append(scripts_parent_dir)
+
+from csv_loader import read_projected_csv
 
 BASE_STATION_COORDS = {"latitude": 47.128234, "longitude": -122.356792}
+LATITUDE_COLUMN = '[General] [GPS] Latitude'
+LONGITUDE_COLUMN = '[General] [GPS] Longitude'
+EARTH_RADIUS_KM = 6371
+# Block size of the reverse reader; the last GPS fix is usually within the final block
+REVERSE_READ_BLOCK_SIZE = 64 * 1024
 
 def haversine_distance(lat1, lon1, lat2, lon2):
-    R = 6371  # Radius of Earth in kilometers
+    R = EARTH_RADIUS_KM  # Radius of Earth in kilometers
 
     lat1_rad = math.radians(lat1)
     lon1_rad = math.radians(lon1)
@@ -23,6 +39,96 @@ def haversine_distance(lat1, lon1, lat2, lon2):
     distance = R * c
     return distance
 
+def haversine_distances(lat1, lon1, lat2, lon2):
+    """
+    Vectorized haversine_distance: computes the great-circle distances in kilometers
+    for whole coordinate arrays at once. The arguments broadcast against each other,
+    so a single point (e.g. the base station) can be passed as scalars.
+
+    Args:
+        lat1, lon1 (array-like or float): Coordinates of the first points, in degrees.
+        lat2, lon2 (array-like or float): Coordinates of the second points, in degrees.
+
+    Returns:
+        numpy.ndarray: The distances in kilometers; NaN where a coordinate is missing.
+    """
+    lat1_rad, lon1_rad, lat2_rad, lon2_rad = (np.radians(np.asarray(value, dtype=float)) for value in (lat1, lon1, lat2, lon2))
+
+    dlon = lon2_rad - lon1_rad
+    dlat = lat2_rad - lat1_rad
+
+    a = np.sin(dlat / 2)**2 + np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(dlon / 2)**2
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+    return EARTH_RADIUS_KM * c
+
+def calculate_distances_to_base_station(file_path, base_station_coords=BASE_STATION_COORDS):
+    """
+    Computes the distance to the base station for every row of a coverage log in one vectorized call.
+    Rows without a GPS fix (or with a non-numeric coordinate) get NaN, so the result stays aligned with
+    the log's rows and can be used directly as a per-sample distance column.
+
+    Args:
+        file_path (str): The path to the CSV file.
+        base_station_coords (dict): The 'latitude' and 'longitude' of the base station.
+
+    Returns:
+        numpy.ndarray: One distance in kilometers per data row, or None if the GPS columns are missing.
+    """
+    df = read_projected_csv(file_path, [LATITUDE_COLUMN, LONGITUDE_COLUMN], dtypes={LATITUDE_COLUMN: 'float64', LONGITUDE_COLUMN: 'float64'})
+    if LATITUDE_COLUMN not in df.columns or LONGITUDE_COLUMN not in df.columns:
+        print(f"Error: Missing GPS columns in {os.path.basename(file_path)}.")
+        return None
+
+    latitudes = pd.to_numeric(df[LATITUDE_COLUMN], errors='coerce').to_numpy(dtype=float)
+    longitudes = pd.to_numeric(df[LONGITUDE_COLUMN], errors='coerce').to_numpy(dtype=float)
+    return haversine_distances(latitudes, longitudes, base_station_coords["latitude"], base_station_coords["longitude"])
+
+def _iter_lines_backwards(binary_file, stop_offset, block_size=REVERSE_READ_BLOCK_SIZE):
+    """
+    Yields (offset, line) for the lines of a file opened in binary mode, from the last one back to the line starting at stop_offset.
+    The file is read in fixed-size blocks from its end, so memory is bounded by the block size and the longest line.
+    """
+    binary_file.seek(0, os.SEEK_END)
+    position = binary_file.tell()
+    partial_line = b''
+    while position > stop_offset:
+        read_size = min(block_size, position - stop_offset)
+        position -= read_size
+        binary_file.seek(position)
+        lines = (binary_file.read(read_size) + partial_line).split(b'\n')
+        # The first piece may continue in the previous block
+        partial_line = lines[0]
+        line_offset = position + len(lines[0]) + 1
+        line_offsets = [line_offset]
+        for line in lines[1:-1]:
+            line_offset += len(line) + 1
+            line_offsets.append(line_offset)
+        for line_offset, line in zip(reversed(line_offsets), reversed(lines[1:])):
+            yield line_offset, line
+    yield position, partial_line
+
+def _iter_rows_backwards(binary_file, data_offset):
+    """
+    Yields the data rows of a CSV file opened in binary mode from the last row to the first,
+    parsing lines backwards from the end of the file down to data_offset (the end of the header row).
+    A quoted field spanning several lines cannot be parsed backwards; when one is found, the rows above
+    the rows already yielded are read forwards instead and yielded in reverse.
+    """
+    for line_offset, raw_line in _iter_lines_backwards(binary_file, data_offset):
+        line = raw_line.decode('utf-8').rstrip('\r')
+        if line.count('"') % 2:
+            # Multi-line record found: resume with the rows that end before the lines already parsed
+            unparsed_end = line_offset + len(raw_line) + 1
+            break
+        yield from csv.reader([line])
+    else:
+        return
+
+    binary_file.seek(data_offset)
+    unparsed_text = binary_file.read(unparsed_end - data_offset).decode('utf-8')
+    yield from reversed(list(csv.reader(io.StringIO(unparsed_text, newline=''))))
+
 def analyze_coverage_coordinates(file_path):
     """
     Analyzes a CSV file to find the last valid GPS coordinate and calculates
@@ -33,23 +139,20 @@ def analyze_coverage_coordinates(file_path):
     }
 
     try:
-        with open(file_path, 'r', newline='', encoding='utf-8') as csvfile:
-            reader = csv.reader(csvfile)
-            header = next(reader)  # Read the header row
+        with open(file_path, 'rb') as binary_file:
+            header_line = binary_file.readline()
+            header = next(csv.reader([header_line.decode('utf-8')]))  # Read the header row
 
             # Find column indices for Latitude and Longitude
             try:
-                latitude_col_idx = header.index('[General] [GPS] Latitude')
-                longitude_col_idx = header.index('[General] [GPS] Longitude')
+                latitude_col_idx = header.index(LATITUDE_COLUMN)
+                longitude_col_idx = header.index(LONGITUDE_COLUMN)
             except ValueError as e:
                 print(f"Error: Missing expected header column in {os.path.basename(file_path)}: {e}")
                 return results
 
-            rows = list(reader) # Read all rows into a list
-
-            # Search for the last valid GPS coordinate from the bottom up
-            for i in reversed(range(len(rows))):
-                row = rows[i]
+            # Search for the last valid GPS coordinate from the bottom up, reading the file backwards from its end
+            for row in _iter_rows_backwards(binary_file, len(header_line)):
                 if len(row) > max(latitude_col_idx, longitude_col_idx) and row[latitude_col_idx] and row[longitude_col_idx]:
                     try:
                         lat = float(row[latitude_col_idx])
@@ -0,0 +1,192 @@
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+import numpy as np
+import pandas as pd
+
+# Add the 'Scripts' directory to sys.path so the shared csv_loader module can be imported
+scripts_parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if scripts_parent_dir not in sys.path:
+    sys.path.append(scripts_parent_dir)
+
+from csv_loader import read_projected_csv
+from Coverage.coverage_coordinate_analyzer import calculate_distances_to_base_station
+
+DEFAULT_BIN_WIDTH_KM = 0.1
+# Metric name in the tables -> log column
+METRIC_COLUMNS = {
+    "RSRP": '[NR5G] [RF] RSRP',
+    "Tx Power": '[NR5G] [Power] Tx power (Total Actual)',
+    "UL TP": '[Call Test] [Throughput] Application UL TP',
+    "DL TP": '[Call Test] [Throughput] Application DL TP',
+}
+N41_TEST_FOLDER = "5G n41 HPUE Coverage Test"
+VONR_TEST_FOLDER = "5G VoNR Coverage Test"
+
+def bin_coverage_log(file_path, bin_width_km=DEFAULT_BIN_WIDTH_KM):
+    """
+    Aggregates the metrics of one coverage log into fixed-width bins of distance to the base station.
+    Each sample is placed at the last GPS fix at or above its row, as find_coordinates does for single points,
+    using the per-row distances of calculate_distances_to_base_station; samples before the first fix are skipped.
+
+    Args:
+        file_path (str): The path to the CSV file.
+        bin_width_km (float): The width of a distance bin in kilometers.
+
+    Returns:
+        dict: Metric name -> {bin index: {"count", "sum", "min", "max"}}, mergeable with merge_distance_bins.
+              Empty if the GPS columns are missing.
+    """
+    distances = calculate_distances_to_base_station(file_path)
+    if distances is None:
+        print(f"Warning: Missing GPS columns in {os.path.basename(file_path)}. Skipping distance binning.")
+        return {}
+    distances = pd.Series(distances).ffill().to_numpy()
+
+    metric_columns = list(METRIC_COLUMNS.values())
+    df = read_projected_csv(file_path, metric_columns, dtypes={column: 'float64' for column in metric_columns})
+    bin_indices = np.floor(distances / bin_width_km)
+
+    accumulators = {}
+    for metric_name, column in METRIC_COLUMNS.items():
+        if column not in df.columns:
+            continue
+        values = pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=float)
+        valid = np.isfinite(values) & np.isfinite(bin_indices)
+        if not valid.any():
+            continue
+        grouped = pd.Series(values[valid]).groupby(bin_indices[valid].astype(int)).agg(['count', 'sum', 'min', 'max'])
+        accumulators[metric_name] = {
+            int(bin_index): {"count": int(row["count"]), "sum": float(row["sum"]), "min": float(row["min"]), "max": float(row["max"])}
+            for bin_index, row in grouped.iterrows()
+        }
+    return accumulators
+
+def merge_distance_bins(accumulators, other):
+    """
+    Merges the bin accumulators of another log (or device, or run) into accumulators, in place.
+
+    Returns:
+        dict: The merged accumulators.
+    """
+    for metric_name, other_bins in other.items():
+        metric_bins = accumulators.setdefault(metric_name, {})
+        for bin_index, other_bin in other_bins.items():
+            current = metric_bins.get(bin_index)
+            if current is None:
+                metric_bins[bin_index] = dict(other_bin)
+            else:
+                current["count"] += other_bin["count"]
+                current["sum"] += other_bin["sum"]
+                current["min"] = min(current["min"], other_bin["min"])
+                current["max"] = max(current["max"], other_bin["max"])
+    return accumulators
+
+def build_distance_bin_table(accumulators, bin_width_km=DEFAULT_BIN_WIDTH_KM):
+    """
+    Turns bin accumulators into a compact table for the frontend, one row per non-empty bin in distance order.
+
+    Returns:
+        list: Rows like {"Distance from (km)": 0.3, "Distance to (km)": 0.4, "RSRP": {"Count", "Mean", "Min", "Max"}, ...};
+              a metric without samples in a bin is left out of that row.
+    """
+    bin_indices = sorted({bin_index for metric_bins in accumulators.values() for bin_index in metric_bins})
+    table = []
+    for bin_index in bin_indices:
+        row = {
+            "Distance from (km)": round(bin_index * bin_width_km, 6),
+            "Distance to (km)": round((bin_index + 1) * bin_width_km, 6),
+        }
+        for metric_name in METRIC_COLUMNS:
+            metric_bin = accumulators.get(metric_name, {}).get(bin_index)
+            if metric_bin:
+                row[metric_name] = {
+                    "Count": metric_bin["count"],
+                    "Mean": metric_bin["sum"] / metric_bin["count"],
+                    "Min": metric_bin["min"],
+                    "Max": metric_bin["max"],
+                }
+        table.append(row)
+    return table
+
+def _device_group(filename):
+    """
+    Returns the device a log belongs to ('PC2', 'PC3', 'DUT' or 'REF'), or None.
+    """
+    match = re.search(r'(PC\d+|DUT|REF)', filename, re.IGNORECASE)
+    return match.group(1).upper() if match else None
+
+def _bin_logs_by_device(csv_files, bin_width_km):
+    """
+    Bins every log and merges the accumulators of logs of the same device.
+
+    Returns:
+        dict: Device -> distance bin table.
+    """
+    accumulators_by_device = {}
+    for file_path in sorted(csv_files):
+        device = _device_group(os.path.basename(file_path))
+        if device is None:
+            print(f"Warning: Unknown device type for file {os.path.basename(file_path)}. Skipping.")
+            continue
+        try:
+            file_accumulators = bin_coverage_log(file_path, bin_width_km)
+        except Exception as e:
+            print(f"Error processing file {file_path}: {e}")
+            continue
+        merge_distance_bins(accumulators_by_device.setdefault(device, {}), file_accumulators)
+
+    return {device: build_distance_bin_table(accumulators, bin_width_km) for device, accumulators in accumulators_by_device.items()}
+
+def analyze_coverage_distance_bins(coverage_base_path, bin_width_km=DEFAULT_BIN_WIDTH_KM):
+    """
+    Builds the distance-binned RSRP, Tx power and UL/DL TP tables of the coverage tests: per device over all runs
+    of the n41 HPUE test, and per band and device for the VoNR coverage test.
+
+    Args:
+        coverage_base_path (str): The path to the 'Coverage Performance' folder.
+        bin_width_km (float): The width of a distance bin in kilometers.
+
+    Returns:
+        dict: {"Bin width (km)": ..., "5G n41 HPUE Coverage Test": {device: table},
+               "5G VoNR Coverage Test": {band: {device: table}}}; tests without logs are left out.
+    """
+    results = {"Bin width (km)": bin_width_km}
+
+    n41_base_path = os.path.join(coverage_base_path, N41_TEST_FOLDER)
+    if os.path.isdir(n41_base_path):
+        n41_files = [
+            file_path
+            for run_folder in glob.glob(os.path.join(n41_base_path, 'Run*'))
+            for file_path in glob.glob(os.path.join(run_folder, '*.csv'))
+        ]
+        n41_tables = _bin_logs_by_device(n41_files, bin_width_km)
+        if n41_tables:
+            results[N41_TEST_FOLDER] = n41_tables
+
+    vonr_base_path = os.path.join(coverage_base_path, VONR_TEST_FOLDER)
+    if os.path.isdir(vonr_base_path):
+        vonr_tables = {}
+        for band_folder_name in sorted(os.listdir(vonr_base_path)):
+            band_folder_path = os.path.join(vonr_base_path, band_folder_name)
+            if os.path.isdir(band_folder_path) and band_folder_name.startswith("n"): # Bands are named nXX
+                band_tables = _bin_logs_by_device(glob.glob(os.path.join(band_folder_path, '*.csv')), bin_width_km)
+                if band_tables:
+                    vonr_tables[band_folder_name] = band_tables
+        if vonr_tables:
+            results[VONR_TEST_FOLDER] = vonr_tables
+
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Aggregate coverage metrics into distance-to-base-station bins per device.")
+    parser.add_argument("coverage_base_path", help="Path to the 'Coverage Performance' folder.")
+    parser.add_argument("--bin-width", type=float, default=DEFAULT_BIN_WIDTH_KM, help="Width of a distance bin in kilometers.")
+    args = parser.parse_args()
+    if args.bin_width <= 0:
+        parser.error("--bin-width must be positive")
+
+    print(json.dumps(analyze_coverage_distance_bins(args.coverage_base_path, args.bin_width), indent=4))
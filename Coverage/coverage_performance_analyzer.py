@@ -1,28 +1,46 @@
 import pandas as pd
+import numpy as np
 import argparse
 import os
+import sys
 
-def find_coordinates(df, start_index, column_lat, column_lon):
+# Add the 'Scripts' directory to sys.path so the shared csv_loader module can be imported
+scripts_parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if scripts_parent_dir not in sys.path:
+    sys.path.append(scripts_parent_dir)
+
+from csv_loader import read_projected_csv
+
+def last_true_indices(mask):
+    """
+    Returns, for every row, the index of the last row at or above it where mask is True, or -1 if there is none.
+    One vectorized pass turns every "search upwards" into an array lookup.
+    """
+    mask = np.asarray(mask, dtype=bool)
+    return np.maximum.accumulate(np.where(mask, np.arange(len(mask)), -1))
+
+def _last_valid_coordinate_indices(df, column_lat, column_lon):
+    """
+    Returns, for every row, the index of the last row at or above it with both a latitude and a longitude, or -1.
+    """
+    return last_true_indices(df[column_lat].notna() & df[column_lon].notna())
+
+def find_coordinates(df, start_index, column_lat, column_lon, last_coordinate_indices=None):
     """
     Searches upwards from start_index for the first valid latitude and longitude.
+    Pass the result of _last_valid_coordinate_indices as last_coordinate_indices to look up several rows of the same frame.
     """
-    for i in range(start_index, -1, -1):
-        lat = df.loc[i, column_lat]
-        lon = df.loc[i, column_lon]
-        if pd.notna(lat) and pd.notna(lon):
-            return lat, lon
-    return None, None
+    if last_coordinate_indices is None:
+        last_coordinate_indices = _last_valid_coordinate_indices(df, column_lat, column_lon)
+    coordinate_index = last_coordinate_indices[start_index]
+    if coordinate_index == -1:
+        return None, None
+    return df[column_lat].iat[coordinate_index], df[column_lon].iat[coordinate_index]
 
 def analyze_csv(file_path):
     """
     Analyzes a single CSV file to extract the four required coordinate pairs.
     """
-    try:
-        df = pd.read_csv(file_path)
-    except Exception as e:
-        print(f"Error reading {file_path}: {e}")
-        return None
-
     # Define column names
     col_event_voice_call = '[Event] Voice Call Event'
     col_call_result = '[Tool] Voice - Call Result : Drop'
@@ -32,6 +50,16 @@ def analyze_csv(file_path):
     col_latitude = '[General] [GPS] Latitude'
     col_longitude = '[General] [GPS] Longitude'
 
+    try:
+        df = read_projected_csv(
+            file_path,
+            [col_event_voice_call, col_mos_value, col_dl_tp, col_ul_tp, col_latitude, col_longitude],
+            dtypes={col_event_voice_call: str, col_mos_value: 'float64', col_dl_tp: 'float64', col_ul_tp: 'float64', col_latitude: 'float64', col_longitude: 'float64'}
+        )
+    except Exception as e:
+        print(f"Error reading {file_path}: {e}")
+        return None
+
     coords = {
         "mos_before_drop": (None, None),
         "call_drop": (None, None),
@@ -39,49 +67,39 @@ def analyze_csv(file_path):
         "first_ul_tp_gt_1": (None, None),
     }
 
+    # One vectorized pass per condition; every coordinate below is then an array lookup
+    last_coordinate_indices = _last_valid_coordinate_indices(df, col_latitude, col_longitude)
+    last_mos_indices = last_true_indices(df[col_mos_value].notna())
+
     # Coordinate 1: Last valid MOS recorded before call dropped
     drop_events = df[df[col_event_voice_call] == col_call_result]
     if not drop_events.empty:
         drop_index = drop_events.index[0] # Assuming the first drop event is relevant
         
         # Search upwards for MOS value
-        mos_index = -1
-        for i in range(drop_index, -1, -1):
-            mos_val = df.loc[i, col_mos_value]
-            if pd.notna(mos_val) and pd.to_numeric(mos_val, errors='coerce') is not None:
-                mos_index = i
-                break
+        mos_index = last_mos_indices[drop_index]
         
         if mos_index != -1:
-            coords["mos_before_drop"] = find_coordinates(df, mos_index, col_latitude, col_longitude)
+            coords["mos_before_drop"] = find_coordinates(df, mos_index, col_latitude, col_longitude, last_coordinate_indices)
         else:
             # If no MOS value found, find the first valid coordinate upwards from drop_index
-            coords["mos_before_drop"] = find_coordinates(df, drop_index, col_latitude, col_longitude)
+            coords["mos_before_drop"] = find_coordinates(df, drop_index, col_latitude, col_longitude, last_coordinate_indices)
 
     # Coordinate 2: Drop event coordinates
     if not drop_events.empty:
         drop_index = drop_events.index[0]
-        lat_drop = df.loc[drop_index, col_latitude]
-        lon_drop = df.loc[drop_index, col_longitude]
-        if pd.notna(lat_drop) and pd.notna(lon_drop):
-            coords["call_drop"] = (lat_drop, lon_drop)
-        else:
-            # If current row has no coordinates, search upwards
-            coords["call_drop"] = find_coordinates(df, drop_index, col_latitude, col_longitude)
+        # The drop row's own coordinates if it has both, otherwise the first valid ones upwards
+        coords["call_drop"] = find_coordinates(df, drop_index, col_latitude, col_longitude, last_coordinate_indices)
 
     # Coordinate 3: First DL TP > 1 from bottom
-    for i in range(len(df) - 1, -1, -1):
-        dl_tp_val = df.loc[i, col_dl_tp]
-        if pd.notna(dl_tp_val) and pd.to_numeric(dl_tp_val, errors='coerce') > 1:
-            coords["first_dl_tp_gt_1"] = find_coordinates(df, i, col_latitude, col_longitude)
-            break
+    dl_tp_rows = np.flatnonzero(pd.to_numeric(df[col_dl_tp], errors='coerce') > 1)
+    if len(dl_tp_rows):
+        coords["first_dl_tp_gt_1"] = find_coordinates(df, dl_tp_rows[-1], col_latitude, col_longitude, last_coordinate_indices)
 
     # Coordinate 4: First UL TP > 1 from bottom
-    for i in range(len(df) - 1, -1, -1):
-        ul_tp_val = df.loc[i, col_ul_tp]
-        if pd.notna(ul_tp_val) and pd.to_numeric(ul_tp_val, errors='coerce') > 1:
-            coords["first_ul_tp_gt_1"] = find_coordinates(df, i, col_latitude, col_longitude)
-            break
+    ul_tp_rows = np.flatnonzero(pd.to_numeric(df[col_ul_tp], errors='coerce') > 1)
+    if len(ul_tp_rows):
+        coords["first_ul_tp_gt_1"] = find_coordinates(df, ul_tp_rows[-1], col_latitude, col_longitude, last_coordinate_indices)
 
     return coords
 
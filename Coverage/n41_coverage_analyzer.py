@@ -1,9 +1,20 @@
 import pandas as pd
+import numpy as np
 import os
+import sys
 import glob
 import json
 import re
 
+# Add the 'Scripts' directory to sys.path so the shared csv_loader and series_downsampler modules and the Coverage package can be imported
+scripts_parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if scripts_parent_dir not in sys.path:
+    sys.path.append(scripts_parent_dir)
+
+from csv_loader import read_projected_csv
+from series_downsampler import write_downsampled_levels
+from Coverage.coverage_performance_analyzer import last_true_indices
+
 def analyze_n41_coverage(folder_path, device_type_filter=None):
     """
     Analyzes CSV files in a specified folder for n41 coverage data.
@@ -33,8 +44,6 @@ def analyze_n41_coverage(folder_path, device_type_filter=None):
             continue
 
         try:
-            df = pd.read_csv(file_path)
-            
             ul_tp_column = '[Call Test] [Throughput] Application UL TP'
             serving_network_column = '[General] Serving Network'
             rsrp_column = '[NR5G] [RF] RSRP'
@@ -42,6 +51,7 @@ def analyze_n41_coverage(folder_path, device_type_filter=None):
             longitude_column = '[General] [GPS] Longitude'
 
             required_columns = [ul_tp_column, serving_network_column, rsrp_column, latitude_column, longitude_column]
+            df = read_projected_csv(file_path, required_columns, dtypes={serving_network_column: str, ul_tp_column: 'float64', rsrp_column: 'float64', latitude_column: 'float64', longitude_column: 'float64'})
             if not all(col in df.columns for col in required_columns):
                 missing_cols = [col for col in required_columns if col not in df.columns]
                 print(f"Warning: Missing columns {missing_cols} in {filename}. Skipping.")
@@ -52,56 +62,52 @@ def analyze_n41_coverage(folder_path, device_type_filter=None):
 
             no_service_indices = df[df[serving_network_column].astype(str).str.contains('No service', case=False, na=False)].index.tolist()
 
-            found_data_point = False
-            for no_service_idx in no_service_indices: # Iterate from top to bottom for 'No service'
-                # Search upwards from the 'No service' index for the first UL TP value > 1
-                for ul_tp_idx in range(no_service_idx, -1, -1):
-                    ul_tp_value = df.loc[ul_tp_idx, ul_tp_column]
-                    
-                    if pd.notna(ul_tp_value) and pd.to_numeric(ul_tp_value, errors='coerce') > 1: # Changed condition to > 1
-                        latitude = df.loc[ul_tp_idx, latitude_column]
-                        longitude = df.loc[ul_tp_idx, longitude_column]
-                        rsrp_value = df.loc[ul_tp_idx, rsrp_column]
-                        
-                        results.append({
-                            'Device type': device_type,
-                            'latitude': latitude,
-                            'longitude': longitude,
-                            'ul_tp_value': ul_tp_value,
-                            'rsrp_value': rsrp_value
-                        })
-                        found_data_point = True
-                        break # Found UL TP for this 'No service', move to next 'No service'
-                if found_data_point:
-                    break # Found a data point for at least one 'No service', stop processing this file
-            
-            if not found_data_point:
-                pass # No relevant data point found for this file
+            # For every row, the most recent row at or above it with UL TP > 1 (one vectorized pass)
+            last_ul_tp_indices = last_true_indices(pd.to_numeric(df[ul_tp_column], errors='coerce') > 1)
+
+            # The first 'No service' row (top to bottom) with a UL TP > 1 at or above it gives the data point;
+            # the indices never decrease, so it is the first 'No service' row with any such UL TP
+            ul_tp_indices = last_ul_tp_indices[no_service_indices]
+            found_indices = ul_tp_indices[ul_tp_indices != -1]
+            if len(found_indices):
+                ul_tp_idx = found_indices[0]
+                results.append({
+                    'Device type': device_type,
+                    'latitude': df[latitude_column].iat[ul_tp_idx],
+                    'longitude': df[longitude_column].iat[ul_tp_idx],
+                    'ul_tp_value': df[ul_tp_column].iat[ul_tp_idx],
+                    'rsrp_value': df[rsrp_column].iat[ul_tp_idx]
+                })
         except Exception as e:
             print(f"Error processing file {file_path}: {e}")
     
     return results
 
-def extract_coverage_data_to_csv(folder_path, output_folder='.', device_type_filters=None, data_column_name='[NR5G] [RF] RSRP', output_suffix='Analysis'):
+def extract_coverage_series_to_csv(folder_path, series_outputs, device_type_filters=None):
     """
-    Extracts a specified column from all CSV files in a specified folder,
-    uses the filename as the new header, and saves all extracted columns to a new CSV file.
+    Extracts several columns from all CSV files in a specified folder in one pass. Every file is read once
+    for all requested columns; for each column, the extracted data of all files is combined with the
+    filenames as headers and saved to its own CSV file, together with its downsampled zoom levels
+    for the charts (see series_downsampler.write_downsampled_levels).
 
     Args:
         folder_path (str): The path to the folder containing CSV files.
-        output_folder (str): The folder where the output CSV will be saved.
+        series_outputs (list): One dict per column to extract, with the keys 'data_column_name',
+                               'output_folder' and 'output_suffix' (see extract_coverage_data_to_csv).
         device_type_filters (list, optional): A list of device types (strings) to filter by.
                                               Only process files containing any of these device types in their name.
-        data_column_name (str): The name of the column to extract (e.g., '[NR5G] [RF] RSRP').
-        output_suffix (str): Suffix for the output filename (e.g., 'RSRP_Analysis', 'TxPower_Analysis').
     """
-    all_extracted_data = pd.DataFrame()
     csv_files = glob.glob(os.path.join(folder_path, '*.csv'))
 
     if not csv_files:
         print(f"No CSV files found in the specified folder: {folder_path}")
         return
 
+    data_column_names = [series_output["data_column_name"] for series_output in series_outputs]
+    extracted_series = {data_column_name: [] for data_column_name in data_column_names}
+    # Filename -> row of the coverage edge found by analyze_n41_coverage, kept in every zoom level so the chart markers stay visible
+    coverage_edge_rows = {}
+
     for file_path in csv_files:
         filename = os.path.basename(file_path)
 
@@ -116,10 +122,11 @@ def extract_coverage_data_to_csv(folder_path, output_folder='.', device_type_fil
                 continue
 
         try:
-            df = pd.read_csv(file_path)
+            serving_network_column = '[General] Serving Network'
+            ul_tp_column = '[Call Test] [Throughput] Application UL TP'
+            df = read_projected_csv(file_path, [serving_network_column, ul_tp_column] + data_column_names, dtypes={serving_network_column: str, ul_tp_column: 'float64', **{data_column_name: 'float64' for data_column_name in data_column_names}})
             filename_without_ext = os.path.splitext(filename)[0]
             
-            serving_network_column = '[General] Serving Network'
             if serving_network_column not in df.columns:
                 print(f"Warning: '{serving_network_column}' not found in {filename_without_ext}. Cannot filter data by 'No service'. Extracting full column.")
                 no_service_idx = len(df) # Process entire column if 'No service' column is missing
@@ -130,37 +137,46 @@ def extract_coverage_data_to_csv(folder_path, output_folder='.', device_type_fil
                 else:
                     no_service_idx = len(df) # No 'No service' found, process entire column
 
+                # The last UL TP > 1 at or above the first 'No service' row, as in analyze_n41_coverage
+                if not no_service_indices.empty and ul_tp_column in df.columns:
+                    edge_idx = last_true_indices(pd.to_numeric(df[ul_tp_column], errors='coerce') > 1)[no_service_idx]
+                    if 0 <= edge_idx < no_service_idx:
+                        coverage_edge_rows[filename_without_ext] = edge_idx
+
             # Extract data up to the first 'No service' entry (exclusive of the 'No service' row)
-            if data_column_name in df.columns:
-                extracted_data = df.iloc[:no_service_idx, :][[data_column_name]].rename(columns={data_column_name: filename_without_ext})
-                
-                if all_extracted_data.empty:
-                    all_extracted_data = extracted_data
+            for data_column_name in data_column_names:
+                if data_column_name in df.columns:
+                    extracted_series[data_column_name].append(df[data_column_name].iloc[:no_service_idx].rename(filename_without_ext))
                 else:
-                    all_extracted_data = pd.concat([all_extracted_data, extracted_data], axis=1)
-            else:
-                print(f"Warning: Column '{data_column_name}' not found in {filename_without_ext}. Skipping.")
+                    print(f"Warning: Column '{data_column_name}' not found in {filename_without_ext}. Skipping.")
 
         except Exception as e:
             print(f"Error processing file {file_path}: {e}")
-    
+
+    for series_output in series_outputs:
+        _save_extracted_series(folder_path, extracted_series[series_output["data_column_name"]], device_type_filters, coverage_edge_rows, **series_output)
+
+def _save_extracted_series(folder_path, file_series, device_type_filters, coverage_edge_rows, data_column_name, output_folder, output_suffix):
+    """
+    Combines the series extracted from each file into one frame with a single concat and saves it,
+    followed by its downsampled zoom levels.
+    """
+    # Files without rows before 'No service' only get a column once an earlier file contributed rows
+    first_series_with_rows = next((i for i, series in enumerate(file_series) if len(series)), len(file_series))
+    file_series = file_series[first_series_with_rows:]
+    all_extracted_data = pd.concat(file_series, axis=1) if file_series else pd.DataFrame()
+
     if not all_extracted_data.empty:
         # Clean up Tx Power data: remove rows where Tx Power is 0 or NaN
         if data_column_name == '[NR5G] [Power] Tx power (Total Actual)':
-            # Create a copy to avoid SettingWithCopyWarning and ensure independent operation
-            temp_df = all_extracted_data.copy()
-            
             # Convert all columns to numeric, coercing errors will turn non-numeric into NaN
-            for col in temp_df.columns:
-                temp_df[col] = pd.to_numeric(temp_df[col], errors='coerce')
-            
-            # Filter out rows where any value is NaN or 0
-            # We use .any(axis=1) to check if *any* column in a row meets the condition
-            # and then invert the boolean to keep rows that *do not* have NaN or 0
-            rows_to_keep = ~(temp_df.isna().any(axis=1) | (temp_df == 0).any(axis=1))
+            numeric_data = all_extracted_data.apply(pd.to_numeric, errors='coerce')
+
+            # Keep only rows where no column is NaN or 0
+            rows_to_keep = ~(numeric_data.isna() | (numeric_data == 0)).any(axis=1)
             all_extracted_data = all_extracted_data[rows_to_keep]
 
-        all_extracted_data.dropna(how='all', inplace=True)
+        all_extracted_data = all_extracted_data.dropna(how='all')
 
         if all_extracted_data.empty:
             print(f"No {data_column_name} data extracted to save after removing empty rows or 0 values.")
@@ -175,9 +191,38 @@ def extract_coverage_data_to_csv(folder_path, output_folder='.', device_type_fil
         
         all_extracted_data.to_csv(output_path, index=False)
         print(f"\nSuccessfully extracted {data_column_name} data to: {output_path}")
+
+        # The index still holds the source row numbers, which locate the edge rows among the rows kept above
+        keep_rows = {}
+        for column, edge_idx in coverage_edge_rows.items():
+            if column in all_extracted_data.columns:
+                edge_positions = all_extracted_data.index.get_indexer([edge_idx])
+                keep_rows[column] = edge_positions[edge_positions != -1]
+        for level_path in write_downsampled_levels(all_extracted_data, output_path, keep_rows=keep_rows):
+            print(f"Saved downsampled {data_column_name} data to: {level_path}")
     else:
         print(f"No {data_column_name} data extracted to save.")
 
+def extract_coverage_data_to_csv(folder_path, output_folder='.', device_type_filters=None, data_column_name='[NR5G] [RF] RSRP', output_suffix='Analysis'):
+    """
+    Extracts a specified column from all CSV files in a specified folder,
+    uses the filename as the new header, and saves all extracted columns to a new CSV file.
+    To extract several columns, call extract_coverage_series_to_csv once instead, so each file is read only once.
+
+    Args:
+        folder_path (str): The path to the folder containing CSV files.
+        output_folder (str): The folder where the output CSV will be saved.
+        device_type_filters (list, optional): A list of device types (strings) to filter by.
+                                              Only process files containing any of these device types in their name.
+        data_column_name (str): The name of the column to extract (e.g., '[NR5G] [RF] RSRP').
+        output_suffix (str): Suffix for the output filename (e.g., 'RSRP_Analysis', 'TxPower_Analysis').
+    """
+    extract_coverage_series_to_csv(
+        folder_path,
+        [{"data_column_name": data_column_name, "output_folder": output_folder, "output_suffix": output_suffix}],
+        device_type_filters=device_type_filters
+    )
+
 def run_all_coverage_analysis(base_folder, output_base_folder='public'):
     """
     Runs coverage analysis for all 5 runs, extracting both RSRP and Tx Power data
@@ -194,22 +239,14 @@ def run_all_coverage_analysis(base_folder, output_base_folder='public'):
         
         print(f"\n--- Processing {os.path.basename(run_folder)} ---")
 
-        # Extract RSRP data
-        extract_coverage_data_to_csv(
-            folder_path=run_folder,
-            output_folder=output_base_folder,
-            device_type_filters=device_filters,
-            data_column_name='[NR5G] [RF] RSRP',
-            output_suffix='RSRP_Analysis'
-        )
-
-        # Extract Tx Power data
-        extract_coverage_data_to_csv(
+        # Extract RSRP and Tx Power data, reading each file once
+        extract_coverage_series_to_csv(
             folder_path=run_folder,
-            output_folder=output_base_folder,
-            device_type_filters=device_filters,
-            data_column_name='[NR5G] [Power] Tx power (Total Actual)',
-            output_suffix='TxPower_Analysis'
+            series_outputs=[
+                {"data_column_name": '[NR5G] [RF] RSRP', "output_folder": output_base_folder, "output_suffix": 'RSRP_Analysis'},
+                {"data_column_name": '[NR5G] [Power] Tx power (Total Actual)', "output_folder": output_base_folder, "output_suffix": 'TxPower_Analysis'},
+            ],
+            device_type_filters=device_filters
         )
 
 if __name__ == '__main__':
@@ -1,14 +1,12 @@
 import json
-import math
 import os
 import sys
 
 # Add the parent directory of Scripts/Coverage to the Python path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
-from Scripts.Coverage.coverage_coordinate_analyzer import haversine_distance
+from Scripts.Coverage.coverage_coordinate_analyzer import haversine_distances, BASE_STATION_COORDS
 
-BASE_STATION_COORDS = {"latitude": 47.128234, "longitude": -122.356792}
 DATA_ANALYSIS_RESULTS_PATH = "Scripts/React/frontend/src/data_analysis_results.json"
 OUTPUT_JSON_PATH = "Scripts/React/frontend/src/coverage_distance_data.json"
 
@@ -22,36 +20,32 @@ def calculate_distances_from_analysis_results():
 
     n41_hpue_data = data_results.get("Coverage Performance", {}).get("5G n41 HPUE Coverage Test", {})
 
-    pc2_distances = []
-    pc3_distances = []
-    
     runs = ["Run1", "Run2", "Run3", "Run4", "Run5"]
-    
+    devices = ["PC2", "PC3"]
+
+    # Coordinates of every (run, device) pair, so all distances are computed in one vectorized call
+    coordinate_keys = []
+    latitudes = []
+    longitudes = []
+
     for run_key in runs:
         run_data = n41_hpue_data.get(run_key, [])
         
-        pc2_coords = None
-        pc3_coords = None
-
+        device_coords = {}
         for device_data in run_data:
-            if device_data.get("Device type") == "PC2":
-                pc2_coords = {"latitude": device_data["latitude"], "longitude": device_data["longitude"]}
-            elif device_data.get("Device type") == "PC3":
-                pc3_coords = {"latitude": device_data["latitude"], "longitude": device_data["longitude"]}
-        
-        if pc2_coords:
-            dist = haversine_distance(pc2_coords["latitude"], pc2_coords["longitude"], 
-                                      BASE_STATION_COORDS["latitude"], BASE_STATION_COORDS["longitude"])
-            pc2_distances.append(dist)
-        else:
-            pc2_distances.append(None)
-
-        if pc3_coords:
-            dist = haversine_distance(pc3_coords["latitude"], pc3_coords["longitude"], 
-                                      BASE_STATION_COORDS["latitude"], BASE_STATION_COORDS["longitude"])
-            pc3_distances.append(dist)
-        else:
-            pc3_distances.append(None)
+            if device_data.get("Device type") in devices:
+                device_coords[device_data["Device type"]] = (device_data["latitude"], device_data["longitude"])
+
+        for device, (latitude, longitude) in device_coords.items():
+            coordinate_keys.append((run_key, device))
+            latitudes.append(latitude)
+            longitudes.append(longitude)
+
+    distances_by_key = dict(zip(coordinate_keys, haversine_distances(
+        latitudes, longitudes, BASE_STATION_COORDS["latitude"], BASE_STATION_COORDS["longitude"]
+    ).tolist()))
+    pc2_distances = [distances_by_key.get((run_key, "PC2")) for run_key in runs]
+    pc3_distances = [distances_by_key.get((run_key, "PC3")) for run_key in runs]
 
     # Calculate averages
     avg_pc2 = sum(d for d in pc2_distances if d is not None) / len([d for d in pc2_distances if d is not None]) if any(d is not None for d in pc2_distances) else None
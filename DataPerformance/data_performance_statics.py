@@ -1,17 +1,25 @@
 import pandas as pd
+import numpy as np
 import sys
 import argparse
 import os
 import re
+from collections import deque
 
-def _clean_header(header):
-    """
-    Removes content within square brackets (tags) and strips leading/trailing whitespace from a header string.
-    """
-    # Remove content within square brackets, including the brackets themselves
-    cleaned_header = re.sub(r'\[.*?\]', '', header)
-    # Strip leading/trailing whitespace
-    return cleaned_header.strip()
+# Add the 'Scripts' directory to sys.path so the shared csv_loader module can be imported
+scripts_parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if scripts_parent_dir not in sys.path:
+    sys.path.append(scripts_parent_dir)
+
+from csv_loader import read_projected_csv, iter_projected_csv_chunks, _clean_header
+from run_profiler import profile_stage
+from interval_set import interval_set_from_rows, interval_sizes, interval_sums, interval_means
+
+# Logs larger than this are streamed in chunks instead of being loaded whole
+STREAMING_THRESHOLD_BYTES = 1024 ** 3
+STREAMING_CHUNK_ROWS = 200000
+# Throughput statistics only use the last 20 interval averages (or the last 20 rows in the fallback)
+LAST_GROUPS_LIMIT = 20
 
 def _determine_analysis_parameters(file_path):
     """
@@ -183,26 +191,64 @@ def _determine_analysis_parameters(file_path):
     print(f"DEBUG: _determine_analysis_parameters returning: {params}")
     return params
 
-def _find_related_ping_file(current_file_path, device_type):
+def build_ping_file_catalog(raw_data_root="Raw Data"):
     """
-    Attempts to find a related PING CSV file by searching within the 'Raw Data' directory.
+    Walks the 'Raw Data' directory once and indexes every PING CSV file by the device types in its filename,
+    so related PING files can be looked up without walking the tree again for every drive file.
+
+    Args:
+        raw_data_root (str): The raw data directory. Defaults to 'Raw Data' at the current working directory.
+
+    Returns:
+        dict: Lower-case device type (e.g. "dut", "ref", "pc2") -> list of PING file paths.
     """
-    # Assuming 'Raw Data' is at the root of the current working directory
-    raw_data_root = "Raw Data" 
-    
+    ping_catalog = {}
     if not os.path.isdir(raw_data_root):
         print(f"Error: '{raw_data_root}' directory not found at the project root.")
-        return None
-
-    device_type_lower = device_type.lower()
+        return ping_catalog
 
-    for root, _, files in os.walk(raw_data_root):
-        for f in files:
+    for root, dirs, files in os.walk(raw_data_root):
+        dirs.sort() # Walk in a fixed order so the catalog does not depend on the file system
+        for f in sorted(files):
             file_lower = f.lower()
-            # Check if it's a CSV, contains "ping" in the filename, and matches the device type
-            if file_lower.endswith(".csv") and "ping" in file_lower and device_type_lower in file_lower:
-                return os.path.join(root, f)
-    return None
+            if file_lower.endswith(".csv") and "ping" in file_lower:
+                # Same device pattern as _determine_analysis_parameters uses for the file being analyzed
+                for device_type in sorted(set(match.lower() for match in re.findall(r'(DUT|REF|PC\d+)', f, re.IGNORECASE))):
+                    ping_catalog.setdefault(device_type, []).append(os.path.join(root, f))
+    return ping_catalog
+
+def _directory_distance(dir_a, dir_b):
+    """
+    Returns the number of directory steps between two directories (0 for the same directory, 2 for siblings).
+    """
+    parts_a = os.path.abspath(dir_a).split(os.sep)
+    parts_b = os.path.abspath(dir_b).split(os.sep)
+    common_length = len(os.path.commonprefix([parts_a, parts_b]))
+    return (len(parts_a) - common_length) + (len(parts_b) - common_length)
+
+def _find_related_ping_file(current_file_path, device_type, ping_catalog=None):
+    """
+    Finds the PING CSV file of the same device type that is nearest to the given file in the 'Raw Data' tree:
+    one in the same directory first, then one in a sibling directory, and so on.
+    Ties are broken by path, so the result does not depend on the directory walk order.
+
+    Args:
+        current_file_path (str): The path of the file a PING file is looked up for.
+        device_type (str): The device type of that file (e.g. "DUT", "REF").
+        ping_catalog (dict, optional): A catalog from build_ping_file_catalog. Built on the fly if omitted.
+
+    Returns:
+        str: The path of the related PING file, or None if there is none.
+    """
+    if ping_catalog is None:
+        ping_catalog = build_ping_file_catalog()
+
+    current_file_abspath = os.path.abspath(current_file_path)
+    current_dir = os.path.dirname(current_file_abspath)
+    candidates = [ping_file for ping_file in ping_catalog.get(device_type.lower(), []) if os.path.abspath(ping_file) != current_file_abspath]
+    if not candidates:
+        return None
+    return min(candidates, key=lambda ping_file: (_directory_distance(current_dir, os.path.dirname(ping_file)), ping_file))
 
 def _calculate_statistics(data_series, column_name):
     """
@@ -227,60 +273,248 @@ def _calculate_statistics(data_series, column_name):
     
     return stats
 
-def analyze_throughput(file_path, column_name_to_analyze, event_col_name, start_event_str, end_event_str, fallback_column_name=None, fallback_event_col_name=None, third_fallback_column_name=None):
-    num_intervals = 0 # Initialize interval count
+def _load_cleaned_csv(file_path, columns=None, dtypes=None):
     """
-    Reads a data CSV file, identifies intervals based on start/end event markers,
-    calculates average throughput for each, and then performs full statistics on these averages.
-    Returns a dictionary of statistics or None.
+    Reads a data CSV file once and cleans all of its column names with _clean_header.
+    If `columns` (cleaned names) is given, only those columns are parsed, using the optional `dtypes`.
     """
-    try:
+    with profile_stage("parse"):
+        if columns is not None:
+            return read_projected_csv(file_path, columns, dtypes=dtypes, clean_headers=True)
         data = pd.read_csv(file_path)
         # Apply the cleaning function to all column names in the DataFrame
         data.columns = [_clean_header(col) for col in data.columns]
-        # print(f"Successfully loaded {file_path}")
+        return data
 
-        # The column names to analyze are already cleaned by _determine_analysis_parameters
-        # No need to strip or clean them again here.
-        
-        current_column_to_use = column_name_to_analyze
-        
-        # Check primary column
-        if current_column_to_use in data.columns and not data[current_column_to_use].dropna().empty:
-            pass # Primary column is good
+def _projection(event_columns, numeric_columns):
+    """
+    Builds the column list and explicit dtypes for a projected read:
+    event columns are read as strings and metric columns as floats. None entries are skipped.
+    """
+    columns = []
+    dtypes = {}
+    for column in event_columns:
+        if column and column not in dtypes:
+            columns.append(column)
+            dtypes[column] = str
+    for column in numeric_columns:
+        if column and column not in dtypes:
+            columns.append(column)
+            dtypes[column] = "float64"
+    return columns, dtypes
+
+def _analysis_columns(params):
+    """
+    Returns the (columns, dtypes) projection covering every metric that analyze_file_metrics
+    computes for the given _determine_analysis_parameters dict.
+    """
+    numeric_columns = [
+        params["column_to_analyze_throughput"],
+        params["column_to_analyze_throughput_fallback"],
+        params["column_to_analyze_throughput_third_fallback"],
+    ]
+    if params["protocol_type_detected"] == "UDP":
+        if params["analysis_direction_detected"] == "DL":
+            numeric_columns += [params["column_to_analyze_jitter"], params["column_to_analyze_error_ratio"]]
         else:
-            # Primary column is not good, try fallbacks
-            if fallback_column_name in data.columns and not data[fallback_column_name].dropna().empty:
-                print(f"Warning: Primary throughput column '{current_column_to_use}' is empty or not found. Using fallback column '{fallback_column_name}'.")
-                current_column_to_use = fallback_column_name
-            elif third_fallback_column_name in data.columns and not data[third_fallback_column_name].dropna().empty:
-                print(f"Warning: Primary throughput column '{column_name_to_analyze}' and first fallback '{fallback_column_name}' are empty or not found. Using third fallback column '{third_fallback_column_name}'.")
-                current_column_to_use = third_fallback_column_name
+            numeric_columns += [params["column_to_analyze_ul_jitter"], params["column_to_analyze_ul_error_ratio"]]
+    elif params["protocol_type_detected"] == "WEB_PAGE":
+        numeric_columns.append(params.get("column_to_analyze_total_duration"))
+    return _projection([params["event_col"], params["event_col_fallback"]], numeric_columns)
+
+def _resolve_event_column(available_columns, event_col_name, fallback_event_col_name=None):
+    """
+    Returns the event column to use among the available column names, trying the fallback event column
+    if the primary one is missing. Returns None if neither column exists.
+    """
+    current_event_col_to_use = event_col_name
+    if current_event_col_to_use not in available_columns:
+        if fallback_event_col_name:
+            if fallback_event_col_name in available_columns:
+                print(f"Warning: Primary event column '{current_event_col_to_use}' not found. Using fallback event column '{fallback_event_col_name}'.")
+                current_event_col_to_use = fallback_event_col_name
             else:
-                print(f"Error: Primary throughput column '{column_name_to_analyze}' is empty or not found, and fallback column '{fallback_column_name}' is also empty or not found, and third fallback '{third_fallback_column_name}' is also empty or not found.")
-                print(f"Available columns: {data.columns.tolist()}")
+                print(f"\nError: Primary event column '{current_event_col_to_use}' not found, and fallback event column '{fallback_event_col_name}' is also not found.")
+                print(f"Available columns: {list(available_columns)}")
+                return None
+        else:
+            print(f"\nError: Event column '{current_event_col_to_use}' not found in the CSV file, and no fallback event column was provided.")
+            print(f"Available columns: {list(available_columns)}")
+            return None
+    return current_event_col_to_use
+
+def _event_masks(event_series, start_event_str, end_event_str):
+    """
+    Returns boolean numpy masks of the start rows and end rows of an event column.
+    A row containing both strings counts as a start, as in the original if/elif.
+    """
+    event_strings = event_series.astype(str)
+    is_start = event_strings.str.contains(start_event_str, regex=False, na=False).to_numpy()
+    is_end = event_strings.str.contains(end_event_str, regex=False, na=False).to_numpy() & ~is_start
+    return is_start, is_end
+
+def _pair_event_positions(start_positions, end_positions):
+    """
+    Pairs sorted start and end row positions like the original row-by-row scan:
+    a start opens (or re-opens) an interval, and an end closes the interval only if one is open.
+    Returns two numpy arrays with the positions of each paired start and end.
+    """
+    if start_positions.size == 0 or end_positions.size == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    # The latest start before each end is the one that would be open when the end is reached...
+    last_start_idx = np.searchsorted(start_positions, end_positions) - 1
+    candidate_starts = start_positions[np.maximum(last_start_idx, 0)]
+    # ...but only if no earlier end has already closed it (-2 stays below the -1 used for carried-over starts)
+    previous_ends = np.concatenate(([-2], end_positions[:-1]))
+    is_paired = (last_start_idx >= 0) & (candidate_starts > previous_ends)
+    return candidate_starts[is_paired], end_positions[is_paired]
+
+def _pair_interval_events(event_series, start_event_str, end_event_str):
+    """
+    Pairs start and end events of an event column with array operations.
+    Matches the original row-by-row scan: a row containing the start string opens (or re-opens) an interval,
+    and a row containing the end string closes the interval only if one is open.
+    Returns two numpy arrays with the row positions of each paired start and end (both inclusive).
+    """
+    is_start, is_end = _event_masks(event_series, start_event_str, end_event_str)
+    return _pair_event_positions(np.flatnonzero(is_start), np.flatnonzero(is_end))
+
+def _interval_means(value_series, start_positions, end_positions):
+    """
+    Calculates the mean of the non-NaN values between each start and end position (inclusive)
+    on an interval set of the column. Intervals without any valid value are dropped, like the original loop.
+    Returns a numpy array of interval means in interval order.
+    """
+    intervals = interval_set_from_rows(value_series.to_numpy(dtype=float), start_positions, end_positions)
+    return interval_means(intervals)[interval_sizes(intervals) > 0]
+
+def _interval_sums_and_counts(value_series, start_positions, end_positions):
+    """
+    Calculates the sum and the number of non-NaN values between each start and end position (inclusive).
+    Negative start positions (an interval carried over from a previous chunk) start at the first row.
+    Returns two numpy arrays in interval order, with zeros for intervals without any valid value.
+    """
+    intervals = interval_set_from_rows(value_series.to_numpy(dtype=float), np.maximum(start_positions, 0), end_positions)
+    return interval_sums(intervals), interval_sizes(intervals)
+
+def _select_throughput_column(available_columns, value_counts, column_name_to_analyze, fallback_column_name=None, third_fallback_column_name=None):
+    """
+    Picks the first of the primary, fallback and third fallback throughput columns that exists and has data.
+    `value_counts` maps each existing candidate column to its number of non-NaN values.
+    Returns the column name, or None if none of them is usable.
+    """
+    # Check primary column
+    if value_counts.get(column_name_to_analyze):
+        return column_name_to_analyze # Primary column is good
+
+    # Primary column is not good, try fallbacks
+    if value_counts.get(fallback_column_name):
+        print(f"Warning: Primary throughput column '{column_name_to_analyze}' is empty or not found. Using fallback column '{fallback_column_name}'.")
+        return fallback_column_name
+    elif value_counts.get(third_fallback_column_name):
+        print(f"Warning: Primary throughput column '{column_name_to_analyze}' and first fallback '{fallback_column_name}' are empty or not found. Using third fallback column '{third_fallback_column_name}'.")
+        return third_fallback_column_name
+    else:
+        print(f"Error: Primary throughput column '{column_name_to_analyze}' is empty or not found, and fallback column '{fallback_column_name}' is also empty or not found, and third fallback '{third_fallback_column_name}' is also empty or not found.")
+        print(f"Available columns: {list(available_columns)}")
+        return None
+
+def _throughput_stats_from_intervals(column_name, interval_averages, interval_count, num_intervals_detected, last_values, value_count, available_columns):
+    """
+    Builds the throughput statistics from the interval averages of a column, falling back to
+    the last rows of the column when no interval had valid data.
+
+    Args:
+        column_name (str): The throughput column the values come from.
+        interval_averages (array-like): The interval averages in interval order (at least the last LAST_GROUPS_LIMIT of them).
+        interval_count (int): The total number of interval averages.
+        num_intervals_detected (int): The number of start events found.
+        last_values (pandas.Series): The non-NaN values of the column (at least the last LAST_GROUPS_LIMIT of them).
+        value_count (int): The total number of non-NaN values of the column.
+        available_columns (list): The column names of the file, for error messages.
+
+    Returns:
+        dict: The statistics, or an empty dict if they cannot be calculated.
+    """
+    if interval_count == 0:
+        # print(f"\nNo valid '{start_event_str}' to '{end_event_str}' intervals with {current_column_to_use} data found.") # Removed as per user request
+
+        # Implement user's requested fallback logic
+        overall_data_for_sum = last_values
+
+        # If overall_data_for_sum has more than 20 entries, take only the last 20
+        if value_count > LAST_GROUPS_LIMIT:
+            overall_data_for_sum = overall_data_for_sum.tail(LAST_GROUPS_LIMIT)
+            print(f"Warning: Overall data for sum exceeded 20 rows. Using last 20 rows for calculation.")
+
+        if not overall_data_for_sum.empty and num_intervals_detected > 0:
+            # Calculate full statistics for the overall data
+            stats = _calculate_statistics(overall_data_for_sum, column_name)
+            if stats:
+                # Add the calculated mean (sum / intervals) and other info
+                total_sum = overall_data_for_sum.sum()
+                # If num_intervals_detected is based on the full dataset, and overall_data_for_sum is sliced,
+                # the mean calculation might be skewed. The request says "從最後20組的Row開始計算總和，而不是整Column計算"
+                # and "輸出統計的組數假如超過20組，也只計算最後20組".
+                # This implies that if we are taking the sum of the last 20 rows, the "number of intervals"
+                # for the mean calculation should also be based on these 20 rows, or the number of actual intervals
+                # found within these 20 rows. For simplicity and to align with "last 20 rows",
+                # I will use the count of the sliced `overall_data_for_sum` for the mean divisor.
+                calculated_mean = total_sum / len(overall_data_for_sum) if len(overall_data_for_sum) > 0 else 0
+                stats["Mean"] = calculated_mean # Override mean with the requested calculation
+                stats["Number of Intervals"] = len(overall_data_for_sum) # Reflect the number of rows used for sum
+                stats["Note"] = "Calculated overall sum divided by number of detected intervals due to no valid interval data. Limited to last 20 rows if applicable."
+                # print(f"Fallback: Calculated overall stats for '{current_column_to_use}': {stats}") # Removed as per user request
+                return stats
+            else:
+                print(f"Warning: Cannot perform fallback calculation: No valid data in column ('{column_name}' empty: {overall_data_for_sum.empty}) or no intervals detected (num_intervals_detected: {num_intervals_detected}).")
+                print(f"Available columns in file: {list(available_columns)}")
                 return {} # Return empty dict instead of None
+        else:
+            print(f"Warning: Cannot perform fallback calculation: No valid data in column ('{column_name}' empty: {overall_data_for_sum.empty}) or no intervals detected (num_intervals_detected: {num_intervals_detected}).")
+            print(f"Available columns in file: {list(available_columns)}")
+            return {} # Return empty dict instead of None
+
+    # If interval_averages has more than 20 entries, take only the last 20
+    interval_averages = np.asarray(interval_averages, dtype=float)
+    if interval_count > LAST_GROUPS_LIMIT:
+        interval_averages = interval_averages[-LAST_GROUPS_LIMIT:]
+        print(f"Warning: Throughput interval groups exceeded 20. Using last 20 groups for statistics.")
+
+    averages_series = pd.Series(interval_averages)
+
+    # Get statistics and add interval count
+    stats = _calculate_statistics(averages_series, column_name)
+    if stats:
+        stats["Number of Intervals"] = len(interval_averages)
+    return stats
+
+def _throughput_stats_from_data(data, column_name_to_analyze, event_col_name, start_event_str, end_event_str, fallback_column_name=None, fallback_event_col_name=None, third_fallback_column_name=None):
+    """
+    Identifies intervals based on start/end event markers in already loaded data,
+    calculates average throughput for each, and then performs full statistics on these averages.
+    Returns a dictionary of statistics, or an empty dict on failure.
+    """
+    try:
+        # The column names to analyze are already cleaned by _determine_analysis_parameters
+        # No need to strip or clean them again here.
+        available_columns = data.columns.tolist()
+        candidate_columns = [column_name_to_analyze, fallback_column_name, third_fallback_column_name]
+        value_counts = {column: data[column].count() for column in candidate_columns if column in data.columns}
+        current_column_to_use = _select_throughput_column(available_columns, value_counts, column_name_to_analyze, fallback_column_name, third_fallback_column_name)
+        if current_column_to_use is None:
+            return {} # Return empty dict instead of None
         
         # Check if primary event column exists, otherwise try fallback
-        current_event_col_to_use = event_col_name
-        if current_event_col_to_use not in data.columns:
-            if fallback_event_col_name:
-                if fallback_event_col_name in data.columns:
-                    print(f"Warning: Primary event column '{current_event_col_to_use}' not found. Using fallback event column '{fallback_event_col_name}'.")
-                    current_event_col_to_use = fallback_event_col_name
-                else:
-                    print(f"\nError: Primary event column '{current_event_col_to_use}' not found, and fallback event column '{fallback_event_col_name}' is also not found.")
-                    print(f"Available columns: {data.columns.tolist()}")
-                    return {} # Return empty dict instead of None
-            else:
-                print(f"\nError: Event column '{current_event_col_to_use}' not found in the CSV file, and no fallback event column was provided.")
-                print(f"Available columns: {data.columns.tolist()}")
-                return {} # Return empty dict instead of None
+        current_event_col_to_use = _resolve_event_column(available_columns, event_col_name, fallback_event_col_name)
+        if current_event_col_to_use is None:
+            return {} # Return empty dict instead of None
         
         # print(f"Attempting to analyze with column: '{current_column_to_use}' and event column: '{current_event_col_to_use}'") # Removed as per user request
         # print(f"Looking for start event: '{start_event_str}' and end event: '{end_event_str}'") # Removed as per user request
 
-        filtered_data = data.copy()
+        filtered_data = data # Shared between metrics and only read, so no copy is needed
 
         started_indices = filtered_data[filtered_data[current_event_col_to_use].astype(str).str.contains(start_event_str, na=False)].index
         ended_indices = filtered_data[filtered_data[current_event_col_to_use].astype(str).str.contains(end_event_str, na=False)].index
@@ -297,226 +531,70 @@ def analyze_throughput(file_path, column_name_to_analyze, event_col_name, start_
         
         # print(f"Found {len(started_indices)} start events and {len(ended_indices)} end events.") # Removed as per user request
 
-        interval_averages = []
-        current_start_idx = -1
-
-        for i in range(len(filtered_data)):
-            event = str(filtered_data.loc[i, current_event_col_to_use])
-            
-            if start_event_str in event:
-                current_start_idx = i
-            elif end_event_str in event and current_start_idx != -1:
-                end_idx = i
-                
-                interval_data = filtered_data.loc[current_start_idx : end_idx, current_column_to_use].dropna()
-                
-                if not interval_data.empty:
-                    interval_avg = interval_data.mean()
-                    interval_averages.append(interval_avg)
-                # else:
-                    # print(f"Interval from row {current_start_idx} to {end_idx}: No valid {current_column_to_use} data.") # Removed as per user request
-                
-                current_start_idx = -1 # Reset for the next interval
-
-        if not interval_averages:
-            # print(f"\nNo valid '{start_event_str}' to '{end_event_str}' intervals with {current_column_to_use} data found.") # Removed as per user request
-            
-            # Implement user's requested fallback logic
-            overall_data_for_sum = filtered_data[current_column_to_use].dropna()
-            
-            # If overall_data_for_sum has more than 20 entries, take only the last 20
-            if len(overall_data_for_sum) > 20:
-                overall_data_for_sum = overall_data_for_sum.tail(20)
-                print(f"Warning: Overall data for sum exceeded 20 rows. Using last 20 rows for calculation.")
-
-            num_intervals_detected = len(started_indices) # Use the count of detected start events
-
-            if not overall_data_for_sum.empty and num_intervals_detected > 0:
-                # Calculate full statistics for the overall data
-                stats = _calculate_statistics(overall_data_for_sum, current_column_to_use)
-                if stats:
-                    # Add the calculated mean (sum / intervals) and other info
-                    total_sum = overall_data_for_sum.sum()
-                    # If num_intervals_detected is based on the full dataset, and overall_data_for_sum is sliced,
-                    # the mean calculation might be skewed. The request says "從最後20組的Row開始計算總和，而不是整Column計算"
-                    # and "輸出統計的組數假如超過20組，也只計算最後20組".
-                    # This implies that if we are taking the sum of the last 20 rows, the "number of intervals"
-                    # for the mean calculation should also be based on these 20 rows, or the number of actual intervals
-                    # found within these 20 rows. For simplicity and to align with "last 20 rows",
-                    # I will use the count of the sliced `overall_data_for_sum` for the mean divisor.
-                    calculated_mean = total_sum / len(overall_data_for_sum) if len(overall_data_for_sum) > 0 else 0
-                    stats["Mean"] = calculated_mean # Override mean with the requested calculation
-                    stats["Number of Intervals"] = len(overall_data_for_sum) # Reflect the number of rows used for sum
-                    stats["Note"] = "Calculated overall sum divided by number of detected intervals due to no valid interval data. Limited to last 20 rows if applicable."
-                    # print(f"Fallback: Calculated overall stats for '{current_column_to_use}': {stats}") # Removed as per user request
-                    return stats
-                else:
-                    print(f"Warning: Cannot perform fallback calculation: No valid data in column ('{current_column_to_use}' empty: {overall_data_for_sum.empty}) or no intervals detected (num_intervals_detected: {num_intervals_detected}).")
-                    print(f"Available columns in file: {data.columns.tolist()}")
-                    return {} # Return empty dict instead of None
-            else:
-                print(f"Warning: Cannot perform fallback calculation: No valid data in column ('{current_column_to_use}' empty: {overall_data_for_sum.empty}) or no intervals detected (num_intervals_detected: {num_intervals_detected}).")
-                print(f"Available columns in file: {data.columns.tolist()}")
-                return {} # Return empty dict instead of None
+        # Pair start/end events and average each interval with array operations instead of a row loop
+        with profile_stage("interval detection"):
+            start_positions, end_positions = _pair_interval_events(filtered_data[current_event_col_to_use], start_event_str, end_event_str)
+            interval_averages = _interval_means(filtered_data[current_column_to_use], start_positions, end_positions)
 
-        # If interval_averages has more than 20 entries, take only the last 20
-        if len(interval_averages) > 20:
-            interval_averages = interval_averages[-20:]
-            print(f"Warning: Throughput interval groups exceeded 20. Using last 20 groups for statistics.")
+        with profile_stage("statistics"):
+            overall_values = filtered_data[current_column_to_use].dropna()
+            return _throughput_stats_from_intervals(current_column_to_use, interval_averages, len(interval_averages), len(started_indices), overall_values, len(overall_values), available_columns)
 
-        averages_series = pd.Series(interval_averages)
-        
-        # Get statistics and add interval count
-        stats = _calculate_statistics(averages_series, current_column_to_use)
-        if stats:
-            stats["Number of Intervals"] = len(interval_averages)
-        return stats
-
-    except FileNotFoundError:
-        print(f"Error: The file at {file_path} was not found.")
-        return {} # Return empty dict instead of None
     except Exception as e:
         print(f"An error occurred: {e}")
         return {} # Return empty dict instead of None
 
-def analyze_jitter(file_path, column_name_to_analyze, event_col_name, start_event_str, end_event_str, fallback_event_col_name=None):
+def _column_mean_from_data(data, column_name_to_analyze, event_col_name, fallback_event_col_name=None):
     """
-    Reads a data CSV file and reports the mean of the entire jitter column.
-    Returns a dictionary of statistics or None.
+    Reports the mean of an entire column (jitter or error ratio) of already loaded data.
+    Returns a dictionary with the mean, or an empty dict if it cannot be calculated.
     """
     try:
-        data = pd.read_csv(file_path)
-        # Apply the cleaning function to all column names in the DataFrame
-        data.columns = [_clean_header(col) for col in data.columns]
-        # print(f"Successfully loaded {file_path}")
-
         # The column names to analyze are already cleaned by _determine_analysis_parameters
         # No need to strip or clean them again here.
 
         # Check if primary event column exists, otherwise try fallback
-        current_event_col_to_use = event_col_name
-        if current_event_col_to_use not in data.columns:
-            if fallback_event_col_name:
-                if fallback_event_col_name in data.columns:
-                    print(f"Warning: Primary event column '{current_event_col_to_use}' not found. Using fallback event column '{fallback_event_col_name}'.")
-                    current_event_col_to_use = fallback_event_col_name
-                else:
-                    print(f"\nError: Primary event column '{current_event_col_to_use}' not found, and fallback event column '{fallback_event_col_name}' is also not found.")
-                    print(f"Available columns: {data.columns.tolist()}")
-                    return {} # Return empty dict instead of None
-            else:
-                print(f"\nError: Event column '{current_event_col_to_use}' not found in the CSV file, and no fallback event column was provided.")
-                print(f"Available columns: {data.columns.tolist()}")
-                return {} # Return empty dict instead of None
-
-        if column_name_to_analyze not in data.columns:
-            print(f"\nError: Column '{column_name_to_analyze}' not found in the CSV file.")
+        if _resolve_event_column(data.columns.tolist(), event_col_name, fallback_event_col_name) is None:
             return {} # Return empty dict instead of None
-        
-        # Calculate mean of the entire column
-        overall_jitter_data = data[column_name_to_analyze].dropna()
-
-        if not overall_jitter_data.empty:
-            mean_val = overall_jitter_data.mean()
-            return {"Mean": mean_val}
-        else:
-            # print(f"\nNo valid data found to calculate mean for '{column_name_to_analyze_stripped}'.")
-            return {} # Return empty dict instead of None
-
-    except FileNotFoundError:
-        print(f"Error: The file at {file_path} was not found.")
-        return {} # Return empty dict instead of None
-    except Exception as e:
-        print(f"An error occurred: {e}")
-        return {} # Return empty dict instead of None
-
-def analyze_error_ratio(file_path, column_name_to_analyze, event_col_name, start_event_str, end_event_str, fallback_event_col_name=None):
-    """
-    Reads a data CSV file and reports the mean of the entire error ratio column.
-    Returns a dictionary of statistics or None.
-    """
-    try:
-        data = pd.read_csv(file_path)
-        # Apply the cleaning function to all column names in the DataFrame
-        data.columns = [_clean_header(col) for col in data.columns]
-        # print(f"Successfully loaded {file_path}")
-
-        # The column names to analyze are already cleaned by _determine_analysis_parameters
-        # No need to strip or clean them again here.
-
-        # Check if primary event column exists, otherwise try fallback
-        current_event_col_to_use = event_col_name
-        if current_event_col_to_use not in data.columns:
-            if fallback_event_col_name:
-                if fallback_event_col_name in data.columns:
-                    print(f"Warning: Primary event column '{current_event_col_to_use}' not found. Using fallback event column '{fallback_event_col_name}'.")
-                    current_event_col_to_use = fallback_event_col_name
-                else:
-                    print(f"\nError: Primary event column '{current_event_col_to_use}' not found, and fallback event column '{fallback_event_col_name}' is also not found.")
-                    print(f"Available columns: {data.columns.tolist()}")
-                    return {} # Return empty dict instead of None
-            else:
-                print(f"\nError: Event column '{current_event_col_to_use}' not found in the CSV file, and no fallback event column was provided.")
-                print(f"Available columns: {data.columns.tolist()}")
-                return {} # Return empty dict instead of None
 
         if column_name_to_analyze not in data.columns:
             print(f"\nError: Column '{column_name_to_analyze}' not found in the CSV file.")
             return {} # Return empty dict instead of None
         
         # Calculate mean of the entire column
-        overall_error_ratio_data = data[column_name_to_analyze].dropna()
+        overall_data = data[column_name_to_analyze].dropna()
 
-        if not overall_error_ratio_data.empty:
-            mean_val = overall_error_ratio_data.mean()
+        if not overall_data.empty:
+            mean_val = overall_data.mean()
             return {"Mean": mean_val}
         else:
-            # print(f"\nNo valid data found to calculate statistics for '{column_name_to_analyze_stripped}'.")
             return {} # Return empty dict instead of None
 
-    except FileNotFoundError:
-        print(f"Error: The file at {file_path} was not found.")
-        return {} # Return empty dict instead of None
     except Exception as e:
         print(f"An error occurred: {e}")
         return {} # Return empty dict instead of None
 
-def analyze_web_page_load_time(file_path, event_col_name, start_event_str, end_event_str, duration_col_name, fallback_event_col_name=None):
+def _web_page_load_time_from_data(data, event_col_name, start_event_str, end_event_str, duration_col_name, fallback_event_col_name=None):
     """
-    Reads a data CSV file, identifies web page load time intervals based on start/end event markers,
+    Identifies web page load time intervals in already loaded data based on start/end event markers,
     extracts total duration for each, and calculates statistics (count, average, max, min, std dev).
-    Returns a dictionary of statistics or None.
+    Returns a dictionary of statistics, or an empty dict on failure.
     """
     try:
-        data = pd.read_csv(file_path)
-        # Apply the cleaning function to all column names in the DataFrame
-        data.columns = [_clean_header(col) for col in data.columns]
-
         # The column names to analyze are already cleaned by _determine_analysis_parameters
         # No need to strip or clean them again here.
         
         # Check if primary event column exists, otherwise try fallback
-        current_event_col_to_use = event_col_name
-        if current_event_col_to_use not in data.columns:
-            if fallback_event_col_name:
-                if fallback_event_col_name in data.columns:
-                    print(f"Warning: Primary event column '{current_event_col_to_use}' not found. Using fallback event column '{fallback_event_col_name}'.")
-                    current_event_col_to_use = fallback_event_col_name
-                else:
-                    print(f"\nError: Primary event column '{current_event_col_to_use}' not found, and fallback event column '{fallback_event_col_name}' is also not found.")
-                    print(f"Available columns: {data.columns.tolist()}")
-                    return {} # Return empty dict instead of None
-            else:
-                print(f"\nError: Event column '{current_event_col_to_use}' not found in the CSV file, and no fallback event column was provided.")
-                print(f"Available columns: {data.columns.tolist()}")
-                return {} # Return empty dict instead of None
+        current_event_col_to_use = _resolve_event_column(data.columns.tolist(), event_col_name, fallback_event_col_name)
+        if current_event_col_to_use is None:
+            return {} # Return empty dict instead of None
 
         if duration_col_name not in data.columns:
             print(f"\nError: Duration column '{duration_col_name}' not found in the CSV file.")
             print(f"Available columns: {data.columns.tolist()}")
             return {} # Return empty dict instead of None
         
-        filtered_data = data.copy()
+        filtered_data = data # Shared between metrics and only read, so no copy is needed
 
         started_indices = filtered_data[filtered_data[current_event_col_to_use].astype(str).str.contains(start_event_str, na=False)].index
         ended_indices = filtered_data[filtered_data[current_event_col_to_use].astype(str).str.contains(end_event_str, na=False)].index
@@ -565,12 +643,357 @@ def analyze_web_page_load_time(file_path, event_col_name, start_event_str, end_e
             stats["Number of Intervals"] = len(total_durations)
         return stats
 
+    except Exception as e:
+        print(f"An error occurred: {e}")
+        return {} # Return empty dict instead of None
+
+def _streaming_chunksize(file_path, chunksize=None):
+    """
+    Returns the number of rows per chunk to stream a log with, or None to load it whole.
+    An explicit chunksize always streams; otherwise only logs above STREAMING_THRESHOLD_BYTES are streamed.
+    """
+    if chunksize:
+        return chunksize
+    try:
+        if os.path.getsize(file_path) > STREAMING_THRESHOLD_BYTES:
+            return STREAMING_CHUNK_ROWS
+    except OSError:
+        pass # A missing file is reported by the regular loader
+    return None
+
+def _new_value_summary():
+    """
+    Returns the running state of one value column while a log is streamed in chunks.
+    """
+    return {
+        "count": 0, # Number of non-NaN values
+        "sum": 0.0,
+        "m2": 0.0, # Sum of squared deviations from the mean
+        "min": None,
+        "max": None,
+        "last_values": deque(maxlen=LAST_GROUPS_LIMIT),
+        "interval_count": 0,
+        "interval_averages": deque(maxlen=LAST_GROUPS_LIMIT),
+        "open_interval_sum": 0.0, # Sum and count of the interval still open at the end of the previous chunk
+        "open_interval_count": 0,
+    }
+
+def _update_value_summary(summary, value_series, start_positions, end_positions, open_start_position):
+    """
+    Folds one chunk of a value column into its running summary.
+    `start_positions` and `end_positions` are the intervals closed in this chunk, where a start of -1 continues
+    the interval left open by the previous chunk. `open_start_position` is the start of the interval still open
+    at the end of this chunk (-1 if it is the carried-over one), or None.
+    """
+    valid_values = value_series.dropna()
+    if not valid_values.empty:
+        chunk_count = len(valid_values)
+        chunk_sum = valid_values.sum()
+        chunk_m2 = ((valid_values - chunk_sum / chunk_count) ** 2).sum()
+        if summary["count"]:
+            # Merge the chunk's variance with the running one (Chan et al.)
+            delta = chunk_sum / chunk_count - summary["sum"] / summary["count"]
+            chunk_m2 += delta ** 2 * summary["count"] * chunk_count / (summary["count"] + chunk_count)
+        summary["m2"] += chunk_m2
+        summary["count"] += chunk_count
+        summary["sum"] += chunk_sum
+        summary["min"] = valid_values.min() if summary["min"] is None else min(summary["min"], valid_values.min())
+        summary["max"] = valid_values.max() if summary["max"] is None else max(summary["max"], valid_values.max())
+        summary["last_values"].extend(valid_values.tail(LAST_GROUPS_LIMIT).tolist())
+
+    interval_sums, interval_counts = _interval_sums_and_counts(value_series, start_positions, end_positions)
+    if start_positions.size and start_positions[0] < 0:
+        interval_sums[0] += summary["open_interval_sum"]
+        interval_counts[0] += summary["open_interval_count"]
+    for interval_sum, interval_count in zip(interval_sums, interval_counts):
+        if interval_count: # Intervals without any valid value are dropped
+            summary["interval_averages"].append(interval_sum / interval_count)
+            summary["interval_count"] += 1
+
+    open_sum, open_count = 0.0, 0
+    if open_start_position is not None:
+        open_sums, open_counts = _interval_sums_and_counts(value_series, np.array([open_start_position]), np.array([len(value_series) - 1]))
+        open_sum, open_count = open_sums[0], open_counts[0]
+        if open_start_position < 0:
+            open_sum += summary["open_interval_sum"]
+            open_count += summary["open_interval_count"]
+    summary["open_interval_sum"] = open_sum
+    summary["open_interval_count"] = open_count
+
+def _stream_value_summaries(file_path, columns, dtypes, event_col_name, fallback_event_col_name, start_event_str, end_event_str, value_columns, chunksize):
+    """
+    Streams a log once in chunks and summarizes its value columns for the throughput and column mean metrics.
+    The interval state (whether a start event is still open, and its running sum and count)
+    is carried across chunk boundaries, so memory stays bounded by the chunk size.
+
+    Returns:
+        dict: "columns" (the projected column names), "start_count" and "end_count" (rows containing the
+              start and end strings) and "values" (value column -> running summary, for the columns present),
+              or None if the file has no data rows.
+    """
+    stream_summary = None
+    event_col = None
+    interval_open = False
+    for chunk in iter_projected_csv_chunks(file_path, columns, dtypes=dtypes, clean_headers=True, chunksize=chunksize):
+        if stream_summary is None:
+            stream_summary = {
+                "columns": chunk.columns.tolist(),
+                "start_count": 0,
+                "end_count": 0,
+                "values": {column: _new_value_summary() for column in value_columns if column in chunk.columns},
+            }
+            # Resolved quietly here; the metric functions report a missing event column themselves
+            event_col = next((column for column in (event_col_name, fallback_event_col_name) if column and column in chunk.columns), None)
+
+        start_positions = end_positions = np.empty(0, dtype=np.int64)
+        open_start_position = None
+        if event_col is not None:
+            event_strings = chunk[event_col].astype(str)
+            contains_start = event_strings.str.contains(start_event_str, regex=False, na=False).to_numpy()
+            contains_end = event_strings.str.contains(end_event_str, regex=False, na=False).to_numpy()
+            stream_summary["start_count"] += int(contains_start.sum())
+            stream_summary["end_count"] += int(contains_end.sum())
+
+            chunk_starts = np.flatnonzero(contains_start)
+            if interval_open:
+                chunk_starts = np.concatenate(([-1], chunk_starts)) # The interval left open by the previous chunk
+            # A row containing both strings counts as a start, as in _event_masks
+            chunk_ends = np.flatnonzero(contains_end & ~contains_start)
+            start_positions, end_positions = _pair_event_positions(chunk_starts, chunk_ends)
+
+            # An interval is still open at the end of the chunk if the last start comes after the last end
+            if chunk_starts.size and (chunk_ends.size == 0 or chunk_starts[-1] > chunk_ends[-1]):
+                open_start_position = chunk_starts[-1]
+            interval_open = open_start_position is not None
+
+        for column, summary in stream_summary["values"].items():
+            _update_value_summary(summary, chunk[column], start_positions, end_positions, open_start_position)
+    return stream_summary
+
+def _load_or_stream(file_path, columns, dtypes, event_col_name, fallback_event_col_name, start_event_str, end_event_str, value_columns, chunksize=None):
+    """
+    Loads a log whole, or streams it into a _stream_value_summaries summary if _streaming_chunksize says so.
+    Returns (data, None) or (None, stream_summary). Raises the same errors as _load_cleaned_csv.
+    """
+    streaming_chunksize = _streaming_chunksize(file_path, chunksize)
+    if streaming_chunksize:
+        try:
+            with profile_stage("parse and interval detection (streamed)"):
+                stream_summary = _stream_value_summaries(file_path, columns, dtypes, event_col_name, fallback_event_col_name, start_event_str, end_event_str, value_columns, streaming_chunksize)
+            if stream_summary is not None:
+                return None, stream_summary
+        except ValueError as e:
+            # A metric column holds a non-numeric token; the whole-file reader falls back to inferred dtypes
+            print(f"Warning: Could not stream {file_path} in chunks ({e}). Loading it whole instead.")
+    return _load_cleaned_csv(file_path, columns, dtypes), None
+
+def _statistics_from_value_summary(value_summary):
+    """
+    Returns the same statistics as _calculate_statistics for a streamed value column.
+    """
+    count = value_summary["count"]
+    if count == 0:
+        return {}
+    return {
+        "Mean": value_summary["sum"] / count,
+        "Standard Deviation": np.sqrt(value_summary["m2"] / (count - 1)) if count > 1 else np.nan, # Sample standard deviation, as pandas computes it
+        "Minimum": value_summary["min"],
+        "Maximum": value_summary["max"]
+    }
+
+def _throughput_stats_from_summary(stream_summary, column_name_to_analyze, event_col_name, start_event_str, end_event_str, fallback_column_name=None, fallback_event_col_name=None, third_fallback_column_name=None):
+    """
+    Streaming counterpart of _throughput_stats_from_data, working on a _stream_value_summaries result.
+    Returns a dictionary of statistics, or an empty dict on failure.
+    """
+    try:
+        available_columns = stream_summary["columns"]
+        value_counts = {column: value_summary["count"] for column, value_summary in stream_summary["values"].items()}
+        current_column_to_use = _select_throughput_column(available_columns, value_counts, column_name_to_analyze, fallback_column_name, third_fallback_column_name)
+        if current_column_to_use is None:
+            return {} # Return empty dict instead of None
+
+        # Check if primary event column exists, otherwise try fallback
+        current_event_col_to_use = _resolve_event_column(available_columns, event_col_name, fallback_event_col_name)
+        if current_event_col_to_use is None:
+            return {} # Return empty dict instead of None
+
+        value_summary = stream_summary["values"][current_column_to_use]
+        if stream_summary["start_count"] == 0 or stream_summary["end_count"] == 0:
+            print(f"\nWarning: Could not find both '{start_event_str}' and '{end_event_str}' events in '{current_event_col_to_use}'. Cannot calculate interval averages.")
+            print(f"Proceeding with full dataset for {current_column_to_use} analysis (this will calculate overall statistics, not statistics of averages).")
+            return _statistics_from_value_summary(value_summary)
+
+        last_values = pd.Series(list(value_summary["last_values"]), dtype="float64")
+        with profile_stage("statistics"):
+            return _throughput_stats_from_intervals(current_column_to_use, value_summary["interval_averages"], value_summary["interval_count"], stream_summary["start_count"], last_values, value_summary["count"], available_columns)
+
+    except Exception as e:
+        print(f"An error occurred: {e}")
+        return {} # Return empty dict instead of None
+
+def _column_mean_from_summary(stream_summary, column_name_to_analyze, event_col_name, fallback_event_col_name=None):
+    """
+    Streaming counterpart of _column_mean_from_data, working on a _stream_value_summaries result.
+    Returns a dictionary with the mean, or an empty dict if it cannot be calculated.
+    """
+    # Check if primary event column exists, otherwise try fallback
+    if _resolve_event_column(stream_summary["columns"], event_col_name, fallback_event_col_name) is None:
+        return {} # Return empty dict instead of None
+
+    if column_name_to_analyze not in stream_summary["columns"]:
+        print(f"\nError: Column '{column_name_to_analyze}' not found in the CSV file.")
+        return {} # Return empty dict instead of None
+
+    value_summary = stream_summary["values"][column_name_to_analyze]
+    if value_summary["count"]:
+        return {"Mean": value_summary["sum"] / value_summary["count"]}
+    return {} # Return empty dict instead of None
+
+def analyze_throughput(file_path, column_name_to_analyze, event_col_name, start_event_str, end_event_str, fallback_column_name=None, fallback_event_col_name=None, third_fallback_column_name=None, chunksize=None):
+    """
+    Reads a data CSV file, identifies intervals based on start/end event markers,
+    calculates average throughput for each, and then performs full statistics on these averages.
+    Logs above STREAMING_THRESHOLD_BYTES, or any log when `chunksize` is given, are streamed in chunks of that many rows.
+    Returns a dictionary of statistics or None.
+    """
+    columns, dtypes = _projection([event_col_name, fallback_event_col_name], [column_name_to_analyze, fallback_column_name, third_fallback_column_name])
+    value_columns = [column_name_to_analyze, fallback_column_name, third_fallback_column_name]
+    try:
+        data, stream_summary = _load_or_stream(file_path, columns, dtypes, event_col_name, fallback_event_col_name, start_event_str, end_event_str, value_columns, chunksize)
     except FileNotFoundError:
         print(f"Error: The file at {file_path} was not found.")
         return {} # Return empty dict instead of None
     except Exception as e:
         print(f"An error occurred: {e}")
         return {} # Return empty dict instead of None
+    if stream_summary is not None:
+        return _throughput_stats_from_summary(stream_summary, column_name_to_analyze, event_col_name, start_event_str, end_event_str, fallback_column_name=fallback_column_name, fallback_event_col_name=fallback_event_col_name, third_fallback_column_name=third_fallback_column_name)
+    return _throughput_stats_from_data(data, column_name_to_analyze, event_col_name, start_event_str, end_event_str, fallback_column_name=fallback_column_name, fallback_event_col_name=fallback_event_col_name, third_fallback_column_name=third_fallback_column_name)
+
+def _analyze_column_mean(file_path, column_name_to_analyze, event_col_name, start_event_str, end_event_str, fallback_event_col_name=None, chunksize=None):
+    """
+    Reads (or streams) a data CSV file and reports the mean of an entire column.
+    Shared by analyze_jitter and analyze_error_ratio.
+    """
+    columns, dtypes = _projection([event_col_name, fallback_event_col_name], [column_name_to_analyze])
+    try:
+        data, stream_summary = _load_or_stream(file_path, columns, dtypes, event_col_name, fallback_event_col_name, start_event_str, end_event_str, [column_name_to_analyze], chunksize)
+    except FileNotFoundError:
+        print(f"Error: The file at {file_path} was not found.")
+        return {} # Return empty dict instead of None
+    except Exception as e:
+        print(f"An error occurred: {e}")
+        return {} # Return empty dict instead of None
+    if stream_summary is not None:
+        return _column_mean_from_summary(stream_summary, column_name_to_analyze, event_col_name, fallback_event_col_name=fallback_event_col_name)
+    return _column_mean_from_data(data, column_name_to_analyze, event_col_name, fallback_event_col_name=fallback_event_col_name)
+
+def analyze_jitter(file_path, column_name_to_analyze, event_col_name, start_event_str, end_event_str, fallback_event_col_name=None, chunksize=None):
+    """
+    Reads a data CSV file and reports the mean of the entire jitter column.
+    Large logs are streamed in chunks, as in analyze_throughput.
+    Returns a dictionary of statistics or None.
+    """
+    return _analyze_column_mean(file_path, column_name_to_analyze, event_col_name, start_event_str, end_event_str, fallback_event_col_name=fallback_event_col_name, chunksize=chunksize)
+
+def analyze_error_ratio(file_path, column_name_to_analyze, event_col_name, start_event_str, end_event_str, fallback_event_col_name=None, chunksize=None):
+    """
+    Reads a data CSV file and reports the mean of the entire error ratio column.
+    Large logs are streamed in chunks, as in analyze_throughput.
+    Returns a dictionary of statistics or None.
+    """
+    return _analyze_column_mean(file_path, column_name_to_analyze, event_col_name, start_event_str, end_event_str, fallback_event_col_name=fallback_event_col_name, chunksize=chunksize)
+
+def analyze_web_page_load_time(file_path, event_col_name, start_event_str, end_event_str, duration_col_name, fallback_event_col_name=None):
+    """
+    Reads a data CSV file, identifies web page load time intervals based on start/end event markers,
+    extracts total duration for each, and calculates statistics (count, average, max, min, std dev).
+    Returns a dictionary of statistics or None.
+    """
+    columns, dtypes = _projection([event_col_name, fallback_event_col_name], [duration_col_name])
+    try:
+        data = _load_cleaned_csv(file_path, columns, dtypes)
+    except FileNotFoundError:
+        print(f"Error: The file at {file_path} was not found.")
+        return {} # Return empty dict instead of None
+    except Exception as e:
+        print(f"An error occurred: {e}")
+        return {} # Return empty dict instead of None
+    return _web_page_load_time_from_data(data, event_col_name, start_event_str, end_event_str, duration_col_name, fallback_event_col_name=fallback_event_col_name)
+
+def analyze_file_metrics(file_path, params, chunksize=None):
+    """
+    Loads a data CSV file once and computes every metric requested by the
+    _determine_analysis_parameters dict (Throughput, Jitter, Error Ratio, Web Page Load Time)
+    from that single in-memory frame. Large HTTP and UDP logs are instead streamed once in chunks,
+    as in analyze_throughput.
+    Returns a dictionary keyed by metric name; metrics that could not be calculated are omitted.
+    """
+    protocol_type = params["protocol_type_detected"]
+    direction = params["analysis_direction_detected"]
+
+    # PING files use their own reader in ping_statics, and unknown protocols have nothing to compute here
+    if protocol_type not in ["HTTP", "UDP", "WEB_PAGE"]:
+        return {}
+    if protocol_type in ["HTTP", "UDP"] and direction not in ["DL", "UL"]:
+        return {}
+
+    # Only the event, throughput and metric columns named in params are parsed
+    columns, dtypes = _analysis_columns(params)
+    try:
+        if protocol_type == "WEB_PAGE":
+            # The load time lookup needs random row access, so web page logs are always loaded whole
+            data, stream_summary = _load_cleaned_csv(file_path, columns, dtypes), None
+        else:
+            value_columns = [column for column in columns if dtypes[column] == "float64"]
+            data, stream_summary = _load_or_stream(file_path, columns, dtypes, params["event_col"], params["event_col_fallback"], params["start_event"], params["end_event"], value_columns, chunksize)
+    except FileNotFoundError:
+        print(f"Error: The file at {file_path} was not found.")
+        return {}
+    except Exception as e:
+        print(f"An error occurred: {e}")
+        return {}
+
+    metrics = {}
+    if protocol_type in ["HTTP", "UDP"]:
+        if stream_summary is not None:
+            throughput_stats = _throughput_stats_from_summary(stream_summary, params["column_to_analyze_throughput"], params["event_col"], params["start_event"], params["end_event"], fallback_column_name=params["column_to_analyze_throughput_fallback"], fallback_event_col_name=params["event_col_fallback"], third_fallback_column_name=params["column_to_analyze_throughput_third_fallback"])
+        else:
+            throughput_stats = _throughput_stats_from_data(data, params["column_to_analyze_throughput"], params["event_col"], params["start_event"], params["end_event"], fallback_column_name=params["column_to_analyze_throughput_fallback"], fallback_event_col_name=params["event_col_fallback"], third_fallback_column_name=params["column_to_analyze_throughput_third_fallback"])
+        if throughput_stats:
+            metrics["Throughput"] = throughput_stats
+
+    if protocol_type == "UDP":
+        # DL and UL UDP files keep their jitter and error ratio in different columns
+        if direction == "DL":
+            jitter_column = params["column_to_analyze_jitter"]
+            error_ratio_column = params["column_to_analyze_error_ratio"]
+        else:
+            jitter_column = params["column_to_analyze_ul_jitter"]
+            error_ratio_column = params["column_to_analyze_ul_error_ratio"]
+
+        with profile_stage("statistics"):
+            if stream_summary is not None:
+                jitter_stats = _column_mean_from_summary(stream_summary, jitter_column, params["event_col"], fallback_event_col_name=params["event_col_fallback"])
+                error_ratio_stats = _column_mean_from_summary(stream_summary, error_ratio_column, params["event_col"], fallback_event_col_name=params["event_col_fallback"])
+            else:
+                jitter_stats = _column_mean_from_data(data, jitter_column, params["event_col"], fallback_event_col_name=params["event_col_fallback"])
+                error_ratio_stats = _column_mean_from_data(data, error_ratio_column, params["event_col"], fallback_event_col_name=params["event_col_fallback"])
+
+        if jitter_stats:
+            metrics["Jitter"] = jitter_stats
+
+        if error_ratio_stats:
+            metrics["Error Ratio"] = error_ratio_stats
+
+    elif protocol_type == "WEB_PAGE":
+        with profile_stage("interval detection"):
+            web_page_stats = _web_page_load_time_from_data(data, params["event_col"], params["start_event"], params["end_event"], params["column_to_analyze_total_duration"], fallback_event_col_name=params["event_col_fallback"])
+        if web_page_stats:
+            metrics["Web Page Load Time"] = web_page_stats
+
+    return metrics
 
 def evaluate_performance(dut_value, ref_value, metric_type):
     """
@@ -663,41 +1086,15 @@ if __name__ == "__main__":
             if stats and "Number of Intervals" in stats:
                 print(f"Number of Intervals: {stats['Number of Intervals']}")
     elif params["protocol_type_detected"] == "UDP":
-        if params["analysis_direction_detected"] == "DL":
-            # Analyze Throughput
-            print(f"\n--- Performing Throughput Analysis for {params['analysis_direction_detected']} UDP ---")
-            stats = analyze_throughput(file_path, params["column_to_analyze_throughput"], params["event_col"], params["start_event"], params["end_event"], fallback_column_name=params["column_to_analyze_throughput_fallback"], fallback_event_col_name=params["event_col_fallback"])
-            print(f"Throughput Stats: {stats}")
-            if stats and "Number of Intervals" in stats:
-                print(f"Number of Intervals: {stats['Number of Intervals']}")
-
-            # Analyze Jitter
-            print(f"\n--- Performing Jitter Analysis for {params['analysis_direction_detected']} UDP ---")
-            stats = analyze_jitter(file_path, params["column_to_analyze_jitter"], params["event_col"], params["start_event"], params["end_event"], fallback_event_col_name=params["event_col_fallback"])
-            print(f"Jitter Stats: {stats}")
-
-            # Analyze DL Error Ratio
-            print(f"\n--- Performing DL Error Ratio Analysis for {params['analysis_direction_detected']} UDP ---")
-            stats = analyze_error_ratio(file_path, params["column_to_analyze_error_ratio"], params["event_col"], params["start_event"], params["end_event"], fallback_event_col_name=params["event_col_fallback"])
-            print(f"Error Ratio Stats: {stats}")
-
-        elif params["analysis_direction_detected"] == "UL":
-            # Analyze Throughput
-            print(f"\n--- Performing Throughput Analysis for {params['analysis_direction_detected']} UDP ---")
-            stats = analyze_throughput(file_path, params["column_to_analyze_throughput"], params["event_col"], params["start_event"], params["end_event"], fallback_column_name=params["column_to_analyze_throughput_fallback"], fallback_event_col_name=params["event_col_fallback"], third_fallback_column_name=params["column_to_analyze_throughput_third_fallback"])
-            print(f"Throughput Stats: {stats}")
-            if stats and "Number of Intervals" in stats:
-                print(f"Number of Intervals: {stats['Number of Intervals']}")
-
-            # Analyze UL Jitter
-            print(f"\n--- Performing UL Jitter Analysis for {params['analysis_direction_detected']} UDP ---")
-            stats = analyze_jitter(file_path, params["column_to_analyze_ul_jitter"], params["event_col"], params["start_event"], params["end_event"], fallback_event_col_name=params["event_col_fallback"])
-            print(f"Jitter Stats: {stats}")
-
-            # Analyze UL Error Ratio
-            print(f"\n--- Performing UL Error Ratio Analysis for {params['analysis_direction_detected']} UDP ---")
-            stats = analyze_error_ratio(file_path, params["column_to_analyze_ul_error_ratio"], params["event_col"], params["start_event"], params["end_event"], fallback_event_col_name=params["event_col_fallback"])
-            print(f"Error Ratio Stats: {stats}")
+        # Throughput, jitter and error ratio are all computed from a single parse of the file
+        print(f"\n--- Performing Throughput, Jitter and Error Ratio Analysis for {params['analysis_direction_detected']} UDP ---")
+        metrics = analyze_file_metrics(file_path, params)
+        stats = metrics.get("Throughput", {})
+        print(f"Throughput Stats: {stats}")
+        if stats and "Number of Intervals" in stats:
+            print(f"Number of Intervals: {stats['Number of Intervals']}")
+        print(f"Jitter Stats: {metrics.get('Jitter', {})}")
+        print(f"Error Ratio Stats: {metrics.get('Error Ratio', {})}")
     elif params["protocol_type_detected"] == "WEB_PAGE":
         print(f"\n--- Performing Web Page Load Time Analysis ---")
         stats = analyze_web_page_load_time(file_path, params["event_col"], params["start_event"], params["end_event"], params["column_to_analyze_total_duration"], fallback_event_col_name=params["event_col_fallback"])
@@ -1,8 +1,60 @@
 # This script will analyze a CSV file to calculate average throughput in specific intervals.
 # The intervals are defined by a start condition (>2M throughput) and an end condition (three consecutive <2M throughput values).
 
+import numpy as np
 import pandas as pd
 import argparse
+import os
+import sys
+
+# Add the 'Scripts' directory to sys.path so the shared csv_loader module can be imported
+scripts_parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if scripts_parent_dir not in sys.path:
+    sys.path.append(scripts_parent_dir)
+
+from csv_loader import read_projected_csv
+from interval_set import interval_set_from_rows, interval_means
+
+# An interval starts above this throughput (Mbps)...
+THROUGHPUT_THRESHOLD = 2.0 # Assuming 2 Mbps as the threshold based on user feedback and image
+# ...and ends before this many consecutive values below it
+END_LOW_COUNT = 3
+
+def find_throughput_intervals(throughput_values, threshold=THROUGHPUT_THRESHOLD, end_low_count=END_LOW_COUNT):
+    """
+    Finds the throughput intervals of a series: an interval starts at a value above the threshold and ends
+    at the value before `end_low_count` consecutive values below it. An interval still open at the end of the
+    series runs to its last value. Each step jumps to the next start or end with a binary search instead of a per-value loop.
+
+    Args:
+        throughput_values (numpy.ndarray): The numeric throughput values.
+
+    Returns:
+        tuple: Two numpy arrays with the first and last position (inclusive) of each interval.
+    """
+    high_positions = np.flatnonzero(throughput_values > threshold)
+    is_low = throughput_values < threshold
+    # Positions ending a run of end_low_count values below the threshold
+    low_run_counts = np.convolve(is_low, np.ones(end_low_count, dtype=int))[:len(throughput_values)]
+    low_run_ends = np.flatnonzero(low_run_counts == end_low_count)
+
+    start_positions, end_positions = [], []
+    position = 0
+    while True:
+        next_high = np.searchsorted(high_positions, position)
+        if next_high == len(high_positions):
+            break
+        start = high_positions[next_high]
+        # The low run must follow the starting value
+        next_low_run = np.searchsorted(low_run_ends, start + end_low_count)
+        start_positions.append(start)
+        if next_low_run == len(low_run_ends):
+            end_positions.append(len(throughput_values) - 1)
+            break
+        end_positions.append(low_run_ends[next_low_run] - end_low_count)
+        position = low_run_ends[next_low_run] + 1
+
+    return np.array(start_positions, dtype=np.int64), np.array(end_positions, dtype=np.int64)
 
 def analyze_throughput(file_path):
     """
@@ -15,8 +67,11 @@ def analyze_throughput(file_path):
     Returns:
         float: The overall average of all interval averages, or None if no data/intervals found.
     """
+    # Define the column name for PDSCH Throughput
+    throughput_column = '[NR5G] [(NR + LTE)] [Throughput] PDSCH TP'
+
     try:
-        df = pd.read_csv(file_path)
+        df = read_projected_csv(file_path, [throughput_column], dtypes={throughput_column: 'float64'})
     except FileNotFoundError:
         print(f"Error: File not found at {file_path}")
         return None
@@ -24,74 +79,27 @@ def analyze_throughput(file_path):
         print(f"Error reading CSV file: {e}")
         return None
 
-    # Define the column name for PDSCH Throughput
-    throughput_column = '[NR5G] [(NR + LTE)] [Throughput] PDSCH TP'
-
     if throughput_column not in df.columns:
         print(f"Error: Column '{throughput_column}' not found in the CSV file.")
         return None
 
     print(f"DEBUG: Analyzing file: {file_path}")
-    throughput_data = df[throughput_column].dropna().tolist()
+    throughput_data = df[throughput_column].dropna()
     print(f"DEBUG: Raw throughput_data length: {len(throughput_data)}")
     
-    # Convert throughput data to numeric, handling potential non-numeric values
-    numeric_throughput_data = []
-    for x in throughput_data:
-        try:
-            numeric_throughput_data.append(float(x))
-        except ValueError:
-            # Skip non-numeric values
-            continue
+    # Convert throughput data to numeric, skipping non-numeric values
+    numeric_throughput_data = pd.to_numeric(throughput_data, errors='coerce').dropna().to_numpy(dtype=float)
     print(f"DEBUG: Numeric throughput_data length: {len(numeric_throughput_data)}")
-    print(f"DEBUG: First 20 numeric throughput values: {numeric_throughput_data[:20]}")
-    print(f"DEBUG: Last 20 numeric throughput values: {numeric_throughput_data[-20:]}")
+    print(f"DEBUG: First 20 numeric throughput values: {numeric_throughput_data[:20].tolist()}")
+    print(f"DEBUG: Last 20 numeric throughput values: {numeric_throughput_data[-20:].tolist()}")
 
-    if not numeric_throughput_data:
+    if not len(numeric_throughput_data):
         print("No valid numeric throughput data found.")
         return None
 
-    interval_averages = []
-    in_interval = False
-    current_interval_data = []
-    consecutive_low_count = 0
-    threshold = 2.0 # Assuming 2 Mbps as the threshold based on user feedback and image
-
-    for i, value in enumerate(numeric_throughput_data):
-        if not in_interval:
-            if value > threshold:
-                in_interval = True
-                current_interval_data.append(value)
-                consecutive_low_count = 0 # Reset count when a new interval starts
-        else: # Currently in an interval
-            current_interval_data.append(value)
-            if value < threshold:
-                consecutive_low_count += 1
-            else:
-                consecutive_low_count = 0 # Reset if value is >= threshold
-
-            # Check for end of interval condition (3 consecutive values < threshold)
-            if consecutive_low_count >= 3:
-                # The interval ends at the value *before* the three consecutive low values.
-                # So, remove the last three values from current_interval_data
-                if len(current_interval_data) > 3:
-                    interval_to_average = current_interval_data[:-3]
-                    if interval_to_average:
-                        interval_averages.append(sum(interval_to_average) / len(interval_to_average))
-                elif len(current_interval_data) > 0: # Handle cases where interval is very short
-                    interval_to_average = current_interval_data[:-consecutive_low_count]
-                    if interval_to_average:
-                        interval_averages.append(sum(interval_to_average) / len(interval_to_average))
-                
-                in_interval = False
-                current_interval_data = []
-                consecutive_low_count = 0
-
-    # Handle any remaining data if an interval was open at the end of the file
-    if in_interval and current_interval_data:
-        # If the last part of the data was an open interval, average what's there
-        # We don't have 3 consecutive low values to end it, so we average all of it.
-        interval_averages.append(sum(current_interval_data) / len(current_interval_data))
+    start_positions, end_positions = find_throughput_intervals(numeric_throughput_data)
+    # Every interval holds at least its starting value, so every average is defined
+    interval_averages = interval_means(interval_set_from_rows(numeric_throughput_data, start_positions, end_positions)).tolist()
 
     print(f"DEBUG: Final interval_averages: {interval_averages}")
 
@@ -102,10 +110,10 @@ def analyze_throughput(file_path):
         return {"overall_average": overall_average, "interval_averages": interval_averages}
     else:
         # Fallback: If no valid intervals are found, calculate the average of all non-zero throughput values
-        non_zero_throughput = [val for val in numeric_throughput_data if val > 0]
-        print(f"DEBUG: Non-zero throughput for fallback: {non_zero_throughput[:20]}...")
-        if non_zero_throughput:
-            overall_average = sum(non_zero_throughput) / len(non_zero_throughput)
+        non_zero_throughput = numeric_throughput_data[numeric_throughput_data > 0]
+        print(f"DEBUG: Non-zero throughput for fallback: {non_zero_throughput[:20].tolist()}...")
+        if len(non_zero_throughput):
+            overall_average = float(non_zero_throughput.mean())
             print("No valid intervals found using the defined criteria. Calculating overall average of all non-zero throughput values as a fallback.")
             print(f"Fallback overall average throughput: {overall_average}")
             return {"overall_average": overall_average, "interval_averages": []} # Return empty list for individual averages
@@ -1,100 +1,110 @@
-import csv
+import os
 import sys
 import numpy as np
+import pandas as pd
 import json
 
-def extract_intervals_and_values(file_path, header_name, blank_row_threshold=10):
+# Add the 'Scripts' directory to sys.path so the shared interval_set and csv_loader modules can be imported
+scripts_parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if scripts_parent_dir not in sys.path:
+    sys.path.append(scripts_parent_dir)
+
+from interval_set import build_interval_set, empty_interval_set, interval_count, interval_means
+from csv_loader import read_csv_header, iter_projected_csv_chunks
+
+# Line number of the first data row (the header is line 1)
+FIRST_DATA_LINE = 2
+# Rows of the column parsed at a time
+READ_CHUNK_ROWS = 200000
+
+def extract_intervals_and_values(file_path, header_name, blank_row_threshold=10, chunksize=READ_CHUNK_ROWS):
     """
     Extracts discrete intervals, their numerical values, and their line number ranges
     from a specified column of a CSV file.
 
     An interval is defined by consecutive non-empty rows. If the number of
     consecutive empty rows exceeds `blank_row_threshold`, a new interval begins.
+    Only the column is parsed, `chunksize` rows at a time; the intervals are found from the lengths
+    of the blank runs between numeric rows, without a per-row loop. The last numeric row is carried
+    from chunk to chunk, so a blank run spanning a chunk boundary is measured whole.
 
     Args:
         file_path (str): The path to the CSV file.
         header_name (str): The name of the header column to analyze.
         blank_row_threshold (int): The maximum number of consecutive blank rows
                                    allowed within a single interval.
+        chunksize (int): Number of rows parsed per chunk.
 
     Returns:
-        list: A list of tuples, where each tuple contains (numerical values of an interval,
-              (start_line_number, end_line_number)).
-              Returns an empty list if an error occurs.
+        dict: An interval set (see interval_set.build_interval_set) holding the numerical values of each interval
+              and its (start_line_number, end_line_number). It has no intervals if an error occurs.
     """
-    intervals_data = []
-    current_interval_values = []
-    current_interval_start_line = -1
-    consecutive_blank_rows = 0
-    in_interval = False
-    line_number = 0
-
+    value_chunks = []
+    start_row_chunks = []
+    end_row_chunks = []
+    offset_chunks = []
+    value_count = 0
+    row_count = 0
+    last_numeric_row = None
     try:
-        with open(file_path, 'r', newline='', encoding='utf-8') as csvfile:
-            reader = csv.reader(csvfile)
-            headers = next(reader)  # Read the header row
-            line_number += 1 # Account for header row
-
-            try:
-                column_index = headers.index(header_name)
-            except ValueError:
-                print(f"Error: Header '{header_name}' not found in the CSV file.")
-                return []
-
-            for row in reader:
-                line_number += 1
-                cell_value = ""
-                if len(row) > column_index:
-                    cell_value = row[column_index].strip()
-
-                try:
-                    numeric_value = float(cell_value)
-                    # If a numeric value is found
-                    if not in_interval:
-                        in_interval = True
-                        current_interval_values = [] # Start a new interval
-                        current_interval_start_line = line_number
-                    current_interval_values.append(numeric_value)
-                    consecutive_blank_rows = 0 # Reset blank row counter
-                except ValueError:
-                    # If the cell is blank or non-numeric
-                    if in_interval:
-                        consecutive_blank_rows += 1
-                        if consecutive_blank_rows > blank_row_threshold:
-                            if current_interval_values: # Only add if the interval has data
-                                # Corrected end_line_number calculation
-                                intervals_data.append((current_interval_values, (current_interval_start_line, line_number - consecutive_blank_rows)))
-                            in_interval = False
-                            current_interval_values = []
-                            current_interval_start_line = -1
-                            consecutive_blank_rows = 0
-            
-            # Add the last interval if it was still active
-            if in_interval and current_interval_values:
-                intervals_data.append((current_interval_values, (current_interval_start_line, line_number)))
-
-        return intervals_data
-
+        if header_name not in read_csv_header(file_path):
+            print(f"Error: Header '{header_name}' not found in the CSV file.")
+            return empty_interval_set()
+
+        # Blank lines are kept as rows, so row positions map to line numbers
+        for chunk in iter_projected_csv_chunks(file_path, [header_name], chunksize=chunksize, skip_blank_lines=False):
+            column = pd.to_numeric(chunk.iloc[:, 0], errors='coerce').to_numpy(dtype=float)
+            chunk_numeric_rows = np.flatnonzero(~np.isnan(column))
+            numeric_rows = chunk_numeric_rows + row_count
+            row_count += len(column)
+            if not len(numeric_rows):
+                continue
+
+            # The numeric row before each one; a blank run longer than the threshold between them starts an interval
+            previous_rows = np.concatenate(([-1 if last_numeric_row is None else last_numeric_row], numeric_rows[:-1]))
+            starts = np.flatnonzero(numeric_rows - previous_rows - 1 > blank_row_threshold)
+            if last_numeric_row is None and (not len(starts) or starts[0] != 0):
+                starts = np.concatenate(([0], starts))
+            # Each new interval ends the previous one (none is open before the first numeric row)
+            closed = starts if last_numeric_row is not None else starts[1:]
+
+            value_chunks.append(column[chunk_numeric_rows])
+            start_row_chunks.append(numeric_rows[starts])
+            end_row_chunks.append(previous_rows[closed])
+            offset_chunks.append(starts + value_count)
+            value_count += len(numeric_rows)
+            last_numeric_row = numeric_rows[-1]
     except FileNotFoundError:
         print(f"Error: File not found at '{file_path}'")
-        return []
+        return empty_interval_set()
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
-        return []
+        return empty_interval_set()
+
+    if last_numeric_row is None:
+        return empty_interval_set()
+
+    # The last interval is still open at the end of the file unless enough blank rows follow it,
+    # and then runs to the last line
+    last_end_row = row_count - 1 if row_count - 1 - last_numeric_row <= blank_row_threshold else last_numeric_row
+    start_lines = np.concatenate(start_row_chunks) + FIRST_DATA_LINE
+    end_lines = np.concatenate(end_row_chunks + [[last_end_row]]) + FIRST_DATA_LINE
+    offsets = np.concatenate(offset_chunks + [[value_count]])
+
+    return build_interval_set(np.concatenate(value_chunks), offsets, np.column_stack((start_lines, end_lines)))
 
 def analyze_grouped_intervals(all_intervals_with_lines):
     """
     Groups intervals into three sets and calculates statistics for each group,
-    based on the sum of values within each interval. Also stores line ranges for debugging.
+    based on the average of values within each interval. Also stores line ranges for debugging.
 
     Args:
-        all_intervals_with_lines (list): A list of tuples, where each tuple contains
-                                         (numerical values of an interval, (start_line, end_line)).
+        all_intervals_with_lines (dict): The interval set returned by extract_intervals_and_values.
 
     Returns:
         dict: A dictionary containing statistics for each group (Group 0, Group 1, Group 2).
-              Each group's statistics include sum, average, max, min, and standard deviation
-              of the *interval sums*, and for Group 0, a list of its interval line ranges.
+              Each group's statistics include average, max, min, and standard deviation
+              of the *interval averages*, plus each group's interval line ranges and (average, line range) pairs.
     """
     group_labels = {
         0: "Pre Call",
@@ -102,40 +112,22 @@ def analyze_grouped_intervals(all_intervals_with_lines):
         2: "Post Call"
     }
 
-    grouped_interval_averages = {
-        0: [],  # Averages of intervals where index % 3 == 0
-        1: [],  # Averages of intervals where index % 3 == 1
-        2: []   # Averages of intervals where index % 3 == 2
-    }
-    grouped_interval_line_ranges = {
-        0: [],
-        1: [],
-        2: []
-    }
-
-    for i, (interval_values, line_range) in enumerate(all_intervals_with_lines):
-        if interval_values: # Only calculate average if interval is not empty
-            interval_average = np.mean(interval_values)
-            group_key = i % 3
-            grouped_interval_averages[group_key].append(interval_average)
-            grouped_interval_line_ranges[group_key].append(line_range)
+    # Intervals are never empty, so every interval average is defined
+    interval_averages = interval_means(all_intervals_with_lines)
+    line_ranges = all_intervals_with_lines["line_ranges"]
 
     results = {}
-    grouped_interval_averages_with_lines = {
-        0: [],
-        1: [],
-        2: []
-    }
+    grouped_interval_line_ranges = {}
+    grouped_interval_averages_with_lines = {}
 
-    for i, (interval_values, line_range) in enumerate(all_intervals_with_lines):
-        if interval_values:
-            interval_average = np.mean(interval_values)
-            group_key = i % 3
-            grouped_interval_averages_with_lines[group_key].append((interval_average, line_range))
+    for group_key, group_name in group_labels.items():
+        # Intervals where index % 3 == group_key
+        averages_in_group = interval_averages[group_key::3]
+        group_line_ranges = [tuple(line_range) for line_range in line_ranges[group_key::3].tolist()]
+        grouped_interval_line_ranges[group_key] = group_line_ranges
+        grouped_interval_averages_with_lines[group_key] = list(zip(averages_in_group, group_line_ranges))
 
-    for group_key, averages_in_group in grouped_interval_averages.items():
-        group_name = group_labels.get(group_key, f"Group {group_key}") # Get the descriptive name
-        if not averages_in_group:
+        if not len(averages_in_group):
             results[group_name] = {
                 "Mean": None,
                 "Maximum": None,
@@ -144,16 +136,11 @@ def analyze_grouped_intervals(all_intervals_with_lines):
             }
             continue
 
-        overall_average = np.mean(averages_in_group)
-        maximum_of_averages = np.max(averages_in_group)
-        minimum_of_averages = np.min(averages_in_group)
-        std_dev_of_averages = np.std(averages_in_group)
-
         results[group_name] = {
-            "Mean": overall_average,
-            "Maximum": maximum_of_averages,
-            "Minimum": minimum_of_averages,
-            "Standard Deviation": std_dev_of_averages
+            "Mean": np.mean(averages_in_group),
+            "Maximum": np.max(averages_in_group),
+            "Minimum": np.min(averages_in_group),
+            "Standard Deviation": np.std(averages_in_group)
         }
     return results, grouped_interval_line_ranges, grouped_interval_averages_with_lines
 
@@ -212,11 +199,11 @@ if __name__ == "__main__":
     # Process DUT MRAB data
     print(f"Processing DUT MRAB data from: {DUT_MRAB_CSV_PATH}")
     dut_intervals = extract_intervals_and_values(DUT_MRAB_CSV_PATH, THROUGHPUT_HEADER)
-    print(f"  Total DUT intervals counted: {len(dut_intervals)}")
+    print(f"  Total DUT intervals counted: {interval_count(dut_intervals)}")
     dut_mrab_analysis = {}
     dut_mrab_line_ranges = {}
     dut_mrab_averages_with_lines = {} # Renamed from sums_with_lines
-    if dut_intervals:
+    if interval_count(dut_intervals):
         dut_mrab_analysis, dut_mrab_line_ranges, dut_mrab_averages_with_lines = analyze_grouped_intervals(dut_intervals)
         data["5G VoNR MRAB Stationary"]["DUT MRAB"] = {"MRAB Statistics": dut_mrab_analysis}
         print("DUT MRAB statistics generated.")
@@ -227,11 +214,11 @@ if __name__ == "__main__":
     # Process REF MRAB data
     print(f"Processing REF MRAB data from: {REF_MRAB_CSV_PATH}")
     ref_intervals = extract_intervals_and_values(REF_MRAB_CSV_PATH, THROUGHPUT_HEADER)
-    print(f"  Total REF intervals counted: {len(ref_intervals)}")
+    print(f"  Total REF intervals counted: {interval_count(ref_intervals)}")
     ref_mrab_analysis = {}
     ref_mrab_line_ranges = {}
     ref_mrab_averages_with_lines = {} # Renamed from sums_with_lines
-    if ref_intervals:
+    if interval_count(ref_intervals):
         ref_mrab_analysis, ref_mrab_line_ranges, ref_mrab_averages_with_lines = analyze_grouped_intervals(ref_intervals)
         data["5G VoNR MRAB Stationary"]["REF MRAB"] = {"MRAB Statistics": ref_mrab_analysis}
         print("REF MRAB statistics generated.")
@@ -1,14 +1,14 @@
+import os
+import sys
 import pandas as pd
-import re
+import numpy as np
 
-def _clean_header(header):
-    """
-    Removes content within square brackets (tags) and strips leading/trailing whitespace from a header string.
-    """
-    # Remove content within square brackets, including the brackets themselves
-    cleaned_header = re.sub(r'\[.*?\]', '', header)
-    # Strip leading/trailing whitespace
-    return cleaned_header.strip()
+# Add the 'Scripts' directory to sys.path so the shared csv_loader module can be imported
+scripts_parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if scripts_parent_dir not in sys.path:
+    sys.path.append(scripts_parent_dir)
+
+from csv_loader import read_projected_csv, _clean_header
 
 def calculate_ping_statistics(file_path, device_type=None):
     """
@@ -21,9 +21,15 @@ def calculate_ping_statistics(file_path, device_type=None):
     Returns:
         dict: A dictionary containing the calculated statistics (min, max, avg, std dev) and device type.
     """
+    event_col_name = _clean_header('[Event] [Data call test detail events] Ping Call Event')
+    rtt_col_name = _clean_header('[Call Test] [PING] [RTT] RTT')
+
     try:
-        # Attempt to read with default comma delimiter
-        df = pd.read_csv(file_path)
+        # Attempt to read only the event and RTT columns with the default comma delimiter (through the parsed-log cache)
+        df = read_projected_csv(file_path, [event_col_name, rtt_col_name], dtypes={event_col_name: str, rtt_col_name: "float64"}, clean_headers=True)
+        if event_col_name not in df.columns or rtt_col_name not in df.columns:
+            # The column inference below needs every column of the file
+            df = pd.read_csv(file_path)
     except pd.errors.ParserError:
         # If parsing fails, try with whitespace as a delimiter and no header
         print(f"Warning: ParserError with default CSV read for {file_path}. Attempting with whitespace delimiter and no header.")
@@ -51,13 +57,6 @@ def calculate_ping_statistics(file_path, device_type=None):
     # Apply the cleaning function to all column names in the DataFrame
     df.columns = [_clean_header(col) for col in df.columns]
 
-    rtt_values = []
-    in_ping_traffic_block = False
-
-    # Dynamically determine column names or indices
-    event_col_name = _clean_header('[Event] [Data call test detail events] Ping Call Event')
-    rtt_col_name = _clean_header('[Call Test] [PING] [RTT] RTT')
-
     # Check if original column names exist
     if event_col_name not in df.columns or rtt_col_name not in df.columns:
         print(f"Warning: Cleaned column names not found in {file_path}. Attempting to infer or use default indices.")
@@ -71,28 +70,24 @@ def calculate_ping_statistics(file_path, device_type=None):
             print(f"Error: Could not infer event and RTT columns for {file_path}. Skipping.")
             return {"min": None, "max": None, "avg": None, "std_dev": None}
 
-    for index, row in df.iterrows():
-        event = row.get(event_col_name)
-        rtt = row.get(rtt_col_name)
+    events = df[event_col_name]
+    is_start = events == 'PING Traffic Start'
+    is_end = events == 'PING Traffic End'
+
+    # Forward-fill the last Start/End marker to get the block state of every row (no marker yet means outside)
+    block_state = pd.Series(np.where(is_start, 1.0, np.where(is_end, 0.0, np.nan)), index=df.index).ffill()
+    in_ping_traffic_block = (block_state == 1.0) & ~is_start & ~is_end
 
-        if event == 'PING Traffic Start':
-            in_ping_traffic_block = True
-        elif event == 'PING Traffic End':
-            in_ping_traffic_block = False
-        elif in_ping_traffic_block and pd.notna(rtt):
-            try:
-                rtt_values.append(float(rtt))
-            except ValueError:
-                # Handle cases where RTT might not be a valid number
-                pass
+    # RTTs that are not valid numbers are skipped
+    rtt_values = pd.to_numeric(df.loc[in_ping_traffic_block, rtt_col_name], errors='coerce').dropna().to_numpy(dtype=float)
 
-    if not rtt_values:
+    if rtt_values.size == 0:
         return {"min": None, "max": None, "avg": None, "std_dev": None}
 
-    min_rtt = min(rtt_values)
-    max_rtt = max(rtt_values)
-    avg_rtt = sum(rtt_values) / len(rtt_values)
-    std_dev_rtt = pd.Series(rtt_values).std()
+    min_rtt = float(rtt_values.min())
+    max_rtt = float(rtt_values.max())
+    avg_rtt = float(rtt_values.mean())
+    std_dev_rtt = float(rtt_values.std(ddof=1)) if rtt_values.size > 1 else float('nan') # Sample standard deviation, as pandas computes it
 
     result = {
         "Ping RTT": {
@@ -1,6 +1,10 @@
 import os
 import subprocess
 import sys
+import argparse
+import contextlib
+import itertools
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import json # Import the json module
 import re # Import the re module for regex operations
@@ -18,16 +22,215 @@ import ping_statics # Import the ping_statics module
 import mrab_statistics # Import the mrab_statistics module
 import data_path_reader # Import the new path reader script
 import check_empty_data # Import check_empty_data directly
+import csv_loader # Shared projected CSV loader and its parsed-log cache
+import run_profiler # Opt-in stage timers and peak memory tracking
+from interval_set import interval_count # Number of intervals in an interval set returned by mrab_statistics
 from CallPerformance.call_analyze import analyze_directory, _calculate_fisher_exact_criteria # Import analyze_directory and _calculate_fisher_exact_criteria
-from VoiceQuality.voice_quality_analyzer import process_directory as analyze_nb_voice_quality_directory # Import process_directory from voice_quality_analyzer.py for NB
-from VoiceQuality.audio_delay_analyzer import process_directory as analyze_audio_delay_directory # Import process_directory from audio_delay_analyzer.py
-from VoiceQuality.wb_voice_quality_analyzer import analyze_wb_voice_quality # Import the new WB voice quality analyzer
+from VoiceQuality.voice_quality_engine import analyze_voice_quality # Import the combined NB, WB, EVS and Audio Delay voice quality engine
 from Coverage.coverage_coordinate_analyzer import analyze_coverage_coordinates, find_dut_ref_files, compare_analysis_results # Import the coverage analysis functions
-from Coverage.n41_coverage_analyzer import analyze_n41_coverage, extract_coverage_data_to_csv # Import the n41 coverage analyzer and generic data extractor
+from Coverage.n41_coverage_analyzer import analyze_n41_coverage, extract_coverage_series_to_csv # Import the n41 coverage analyzer and the one-pass multi-column extractor
 from Coverage.coverage_performance_analyzer import analyze_csv as analyze_vonr_coverage_performance # Import the new VoNR coverage performance analyzer
+from Coverage.coverage_distance_bins import analyze_coverage_distance_bins # Import the distance-binned coverage aggregation
 from DataPerformance.google_throughput_analyzer import analyze_throughput as google_analyze_throughput # Import the google throughput analyzer
 
+def _insert_into_nested_dict(data_dict, path_components, value):
+    """Inserts a value into a nested dictionary based on a list of path components."""
+    current_level = data_dict
+    for i, component in enumerate(path_components):
+        if i == len(path_components) - 1:
+            current_level[component] = value
+        else:
+            if component not in current_level:
+                current_level[component] = {}
+            current_level = current_level[component]
+
+def analyze_csv_file(csv_file_path, ping_catalog=None):
+    """
+    Runs the per-file analysis of one collected CSV file.
+    The result is a plain, picklable record, so the same function serves the serial loop
+    and the worker processes of the --workers mode. The statistics of a related PING file
+    are not computed here but by _finalize_file_record, once per PING file and run.
+
+    Args:
+        csv_file_path (str): The path to the CSV file.
+        ping_catalog (dict, optional): The run's PING file catalog from build_ping_file_catalog.
+
+    Returns:
+        dict: A record with the "file_path", its "file_stats", the detected "analysis_type"
+              (None if the parameters could not be determined) and its "related_ping_file".
+    """
+    all_file_stats = {} # Initialize stats for the current file
+    related_ping_file = None
+
+    params = _determine_analysis_parameters(csv_file_path)
+
+    if params is None:
+        file_name = os.path.basename(csv_file_path).lower()
+        print(f"Warning: Could not fully determine analysis parameters from filename: {file_name}. Skipping.")
+    else:
+        all_file_stats["Device Type"] = params["device_type_detected"]
+        if params["analysis_direction_detected"] is not None:
+            all_file_stats["Analysis Direction"] = params["analysis_direction_detected"]
+        if params["protocol_type_detected"] is not None:
+            all_file_stats["Protocol Type"] = params["protocol_type_detected"]
+        all_file_stats["Network Type"] = params["network_type_detected"]
+        all_file_stats["Analysis Type"] = params["analysis_type_detected"] # Store the detected analysis type
+
+        # Always attempt to collect data performance stats if applicable
+        if params["analysis_type_detected"] == "data_performance":
+            # HTTP, UDP and Web Page files are parsed once and every requested metric is computed from that frame
+            file_metrics = data_performance_statics.analyze_file_metrics(csv_file_path, params)
+            all_file_stats.update(file_metrics)
+
+            if params["protocol_type_detected"] == "PING":
+                # If it's a direct PING file, get its stats
+                with run_profiler.profile_stage("ping statistics"):
+                    ping_stats_result = ping_statics.calculate_ping_statistics(csv_file_path, device_type=params["device_type_detected"])
+                if ping_stats_result and "Ping RTT" in ping_stats_result:
+                    all_file_stats["Ping RTT"] = ping_stats_result["Ping RTT"]
+            
+            # Additionally, check for related ping files if it's a "drive" path and not already a PING protocol
+            if params["is_drive_path"] and params["protocol_type_detected"] != "PING":
+                with run_profiler.profile_stage("related ping lookup"):
+                    related_ping_file = data_performance_statics._find_related_ping_file(csv_file_path, params["device_type_detected"], ping_catalog)
+                if related_ping_file:
+                    print(f"Found related Ping file for drive path: {related_ping_file}")
+                else:
+                    print(f"No related Ping file found for drive path: {csv_file_path}")
+        
+        # Add MRAB statistics collection
+        elif params["analysis_type_detected"] == "mrab_performance":
+            target_header = "[Call Test] [Throughput] Application DL TP"
+            threshold = 10
+            with run_profiler.profile_stage("MRAB interval detection"):
+                mrab_intervals = mrab_statistics.extract_intervals_and_values(csv_file_path, target_header, threshold)
+            if interval_count(mrab_intervals):
+                with run_profiler.profile_stage("MRAB statistics"):
+                    mrab_analysis_results, _, _ = mrab_statistics.analyze_grouped_intervals(mrab_intervals) # Unpack and get only the results
+                if mrab_analysis_results:
+                    all_file_stats["MRAB Statistics"] = mrab_analysis_results
+            else:
+                print(f"No MRAB intervals found or an error occurred for: {csv_file_path}")
+        
+        # Add Call Performance statistics collection
+        elif params["analysis_type_detected"] == "call_performance":
+            # For call performance, we analyze the entire directory, not individual files here.
+            # This block will be skipped for individual CSVs, and handled after the loop.
+            pass
+        # Voice Quality analysis will also be handled after the loop, so skip here
+        elif params["analysis_type_detected"] == "voice_quality" or params["analysis_type_detected"] == "audio_delay":
+            pass
+
+    return {
+        "file_path": csv_file_path,
+        "file_stats": all_file_stats,
+        "analysis_type": params["analysis_type_detected"] if params else None,
+        "related_ping_file": related_ping_file,
+    }
+
+def _finalize_file_record(record, ping_statistics_by_file):
+    """
+    Attaches the related PING statistics to a file record and judges whether the file holds valid data.
+    PING statistics are memoized per PING file, so a log shared by many drive files is parsed once per run.
+
+    Args:
+        record (dict): A record returned by analyze_csv_file.
+        ping_statistics_by_file (dict): PING file path -> calculate_ping_statistics result, shared by the whole run.
+
+    Returns:
+        dict: The record, with "is_invalid" and "included_in_results" set.
+    """
+    all_file_stats = record["file_stats"]
+    analysis_type = record["analysis_type"]
+
+    if analysis_type is None:
+        record["is_invalid"] = True # Mark as invalid if parameters cannot be determined
+        record["included_in_results"] = False
+        return record
+
+    # A directly analyzed PING file never has to be parsed again as a related file
+    if "Ping RTT" in all_file_stats:
+        ping_statistics_by_file.setdefault(record["file_path"], {"Ping RTT": all_file_stats["Ping RTT"]})
+
+    related_ping_file = record["related_ping_file"]
+    if related_ping_file:
+        if related_ping_file not in ping_statistics_by_file:
+            with run_profiler.profile_file(record["file_path"]), run_profiler.profile_stage("related ping statistics"):
+                ping_statistics_by_file[related_ping_file] = ping_statics.calculate_ping_statistics(related_ping_file, all_file_stats["Device Type"])
+        ping_stats_result = ping_statistics_by_file[related_ping_file]
+        if ping_stats_result and "Ping RTT" in ping_stats_result:
+            all_file_stats["Ping RTT"] = ping_stats_result["Ping RTT"]
+
+    # Determine if the file is invalid: it's invalid if no statistical data was collected
+    statistical_keys = ["Throughput", "Jitter", "Error Ratio", "Web Page Load Time", "Ping RTT", "MRAB Statistics"]
+    has_any_statistical_data = False
+    for key in statistical_keys:
+        if key in all_file_stats and all_file_stats[key]: # Check if key exists and its value (the dict) is not empty
+            has_any_statistical_data = True
+            break
+
+    # Don't mark call_performance or voice_quality files as invalid here
+    record["is_invalid"] = not has_any_statistical_data and analysis_type not in ["call_performance", "voice_quality"]
+    # Only insert if stats were successfully collected and not call_performance or voice_quality
+    record["included_in_results"] = bool(all_file_stats) and analysis_type not in ["call_performance", "voice_quality"]
+    return record
+
+def _analyze_csv_file_task(csv_file_path, ping_catalog=None):
+    """
+    Runs analyze_csv_file for one file under the profiler. When profiling, the timings of the
+    process are handed back with the record, so a worker's share reaches the parent's report.
+    """
+    with run_profiler.profile_file(csv_file_path):
+        record = analyze_csv_file(csv_file_path, ping_catalog)
+    if run_profiler.is_profiling_enabled():
+        record["profile"] = run_profiler.collect_profile()
+    return record
+
+def _init_worker(cache_enabled, profiling_enabled):
+    """
+    Hands the cache and profiling settings of this run to a worker process, which starts with the defaults.
+    """
+    csv_loader.configure_cache(enabled=cache_enabled)
+    run_profiler.enable_profiling(profiling_enabled)
+    run_profiler.collect_profile() # Drop the parent's timings that a forked worker inherits
+
+def _worker_pool(workers, cache_enabled):
+    """
+    Returns a process pool for directory-level analyses, or a context yielding None (serial) for a single worker.
+    """
+    if workers <= 1:
+        return contextlib.nullcontext()
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(cache_enabled, run_profiler.is_profiling_enabled()))
+
+def _iter_file_records(csv_file_paths, workers, cache_enabled, ping_catalog=None):
+    """
+    Yields the analyze_csv_file record of every path, in the order of csv_file_paths.
+    With more than one worker the files are analyzed in a process pool; Executor.map still
+    yields the records in submission order, so the merge is identical to a serial run.
+    """
+    with _worker_pool(workers, cache_enabled) as executor:
+        map_function = executor.map if executor is not None else map
+        for record in map_function(_analyze_csv_file_task, csv_file_paths, itertools.repeat(ping_catalog)):
+            yield record
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run all Fit4Launch data analyses and generate the React JSON report.")
+    parser.add_argument("--no-cache", action="store_true", help="Parse every raw CSV again instead of reading unchanged logs from the parsed-log cache.")
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes for the per-file, call performance and voice quality analyses (default: 1, serial).")
+    parser.add_argument("--profile", action="store_true", help="Time every analysis stage and write a profile report to Analyze Summary.")
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    run_profiler.enable_profiling(args.profile)
+
+    if args.no_cache:
+        csv_loader.configure_cache(enabled=False)
+    else:
+        # Drop cache entries of logs that were deleted or changed since the last run
+        evicted_entries = csv_loader.evict_stale_cache_entries()
+        if evicted_entries:
+            print(f"Evicted {evicted_entries} stale entries from the parsed-log cache.")
+
     script_dir = os.path.dirname(os.path.abspath(__file__))
     
     base_raw_data_dir = "Raw Data" # Changed to "Raw Data" as per user's path
@@ -47,22 +250,13 @@ if __name__ == "__main__":
         {"path": "Coverage Performance", "analysis_type": "coverage_coordinate"}, # Add Coverage Coordinate directory
         {"path": "Coverage Performance/5G n41 HPUE Coverage Test", "analysis_type": "n41_coverage"}, # Add N41 Coverage directory
         {"path": "Coverage Performance/5G VoNR Coverage Test", "analysis_type": "vonr_coverage_performance"}, # Add 5G VoNR Coverage Test directory
+        {"path": "Coverage Performance", "analysis_type": "coverage_distance_bins"}, # Distance-binned RSRP, Tx Power and TP tables of both coverage tests
         {"path": "Data Performance/5G AUTO DP/5G Auto Data Play-store app DL Stationary", "analysis_type": "google_throughput_analysis"}, # Add Google Throughput Analysis directory
     ]
     
     all_collected_results = {}
     invalid_data_files = [] # Initialize a list to store paths of files with invalid data
     valid_data_files = [] # Initialize a list to store paths of files with valid data
-    def _insert_into_nested_dict(data_dict, path_components, value):
-        """Inserts a value into a nested dictionary based on a list of path components."""
-        current_level = data_dict
-        for i, component in enumerate(path_components):
-            if i == len(path_components) - 1:
-                current_level[component] = value
-            else:
-                if component not in current_level:
-                    current_level[component] = {}
-                current_level = current_level[component]
 
     # Get all CSV file paths using the new data_path_reader script
     # This will now also include Voice Quality CSVs, but they won't be processed in the main loop
@@ -74,127 +268,30 @@ if __name__ == "__main__":
         "coverage_coordinate",
         "n41_coverage", # Add n41_coverage to excluded list
         "vonr_coverage_performance", # Add vonr_coverage_performance to excluded list
+        "coverage_distance_bins",
         "google_throughput_analysis" # Add google_throughput_analysis to excluded list
     ]
 
     # Get all CSV file paths using the new data_path_reader script, excluding those handled separately
-    all_csv_files_processed = data_path_reader.get_csv_file_paths(
-        base_raw_data_dir, 
-        directories_to_process, 
-        excluded_analysis_types=excluded_analysis_types_for_individual_csvs
-    )
-
-    # Now iterate through the collected files for analysis
-    for csv_file_path in all_csv_files_processed:
-        all_file_stats = {} # Initialize stats for the current file
-        current_file_has_invalid_data = False # Flag for the current file
-
-        params = _determine_analysis_parameters(csv_file_path)
-
-        if params is None:
-            file_name = os.path.basename(csv_file_path).lower()
-            print(f"Warning: Could not fully determine analysis parameters from filename: {file_name}. Skipping.")
-            current_file_has_invalid_data = True # Mark as invalid if parameters cannot be determined
-        else:
-            all_file_stats["Device Type"] = params["device_type_detected"]
-            if params["analysis_direction_detected"] is not None:
-                all_file_stats["Analysis Direction"] = params["analysis_direction_detected"]
-            if params["protocol_type_detected"] is not None:
-                all_file_stats["Protocol Type"] = params["protocol_type_detected"]
-            all_file_stats["Network Type"] = params["network_type_detected"]
-            all_file_stats["Analysis Type"] = params["analysis_type_detected"] # Store the detected analysis type
-
-            # Always attempt to collect data performance stats if applicable
-            if params["analysis_type_detected"] == "data_performance":
-                if params["protocol_type_detected"] == "HTTP":
-                    if params["analysis_direction_detected"] == "DL":
-                        throughput_stats = data_performance_statics.analyze_throughput(csv_file_path, params["column_to_analyze_throughput"], params["event_col"], params["start_event"], params["end_event"], fallback_column_name=params["column_to_analyze_throughput_fallback"], fallback_event_col_name=params["event_col_fallback"], third_fallback_column_name=params["column_to_analyze_throughput_third_fallback"])
-                        if throughput_stats:
-                            all_file_stats["Throughput"] = throughput_stats
-                    elif params["analysis_direction_detected"] == "UL":
-                        throughput_stats = data_performance_statics.analyze_throughput(csv_file_path, params["column_to_analyze_throughput"], params["event_col"], params["start_event"], params["end_event"], fallback_column_name=params["column_to_analyze_throughput_fallback"], fallback_event_col_name=params["event_col_fallback"], third_fallback_column_name=params["column_to_analyze_throughput_third_fallback"])
-                        if throughput_stats:
-                            all_file_stats["Throughput"] = throughput_stats
-                elif params["protocol_type_detected"] == "UDP":
-                    if params["analysis_direction_detected"] == "DL":
-                        throughput_stats = data_performance_statics.analyze_throughput(csv_file_path, params["column_to_analyze_throughput"], params["event_col"], params["start_event"], params["end_event"], fallback_column_name=params["column_to_analyze_throughput_fallback"], fallback_event_col_name=params["event_col_fallback"], third_fallback_column_name=params["column_to_analyze_throughput_third_fallback"])
-                        if throughput_stats:
-                            all_file_stats["Throughput"] = throughput_stats
-
-                        jitter_stats = data_performance_statics.analyze_jitter(csv_file_path, params["column_to_analyze_jitter"], params["event_col"], params["start_event"], params["end_event"], fallback_event_col_name=params["event_col_fallback"])
-                        if jitter_stats:
-                            all_file_stats["Jitter"] = jitter_stats
-
-                        error_ratio_stats = data_performance_statics.analyze_error_ratio(csv_file_path, params["column_to_analyze_error_ratio"], params["event_col"], params["start_event"], params["end_event"], fallback_event_col_name=params["event_col_fallback"])
-                        if error_ratio_stats:
-                            all_file_stats["Error Ratio"] = error_ratio_stats
-
-                    elif params["analysis_direction_detected"] == "UL":
-                        throughput_stats = data_performance_statics.analyze_throughput(csv_file_path, params["column_to_analyze_throughput"], params["event_col"], params["start_event"], params["end_event"], fallback_column_name=params["column_to_analyze_throughput_fallback"], fallback_event_col_name=params["event_col_fallback"], third_fallback_column_name=params["column_to_analyze_throughput_third_fallback"])
-                        if throughput_stats:
-                            all_file_stats["Throughput"] = throughput_stats
-
-                        jitter_stats = data_performance_statics.analyze_jitter(csv_file_path, params["column_to_analyze_ul_jitter"], params["event_col"], params["start_event"], params["end_event"], fallback_event_col_name=params["event_col_fallback"])
-                        if jitter_stats:
-                            all_file_stats["Jitter"] = jitter_stats
-
-                        error_ratio_stats = data_performance_statics.analyze_error_ratio(csv_file_path, params["column_to_analyze_ul_error_ratio"], params["event_col"], params["start_event"], params["end_event"], fallback_event_col_name=params["event_col_fallback"])
-                        if error_ratio_stats:
-                            all_file_stats["Error Ratio"] = error_ratio_stats
-                elif params["protocol_type_detected"] == "WEB_PAGE":
-                    web_page_stats = data_performance_statics.analyze_web_page_load_time(csv_file_path, params["event_col"], params["start_event"], params["end_event"], params["column_to_analyze_total_duration"], fallback_event_col_name=params["event_col_fallback"])
-                    if web_page_stats:
-                        all_file_stats["Web Page Load Time"] = web_page_stats
-                elif params["protocol_type_detected"] == "PING":
-                    # If it's a direct PING file, get its stats
-                    ping_stats_result = ping_statics.calculate_ping_statistics(csv_file_path, device_type=params["device_type_detected"])
-                    if ping_stats_result and "Ping RTT" in ping_stats_result:
-                        all_file_stats["Ping RTT"] = ping_stats_result["Ping RTT"]
-                
-                # Additionally, check for related ping files if it's a "drive" path and not already a PING protocol
-                if params["is_drive_path"] and params["protocol_type_detected"] != "PING":
-                    related_ping_file = data_performance_statics._find_related_ping_file(csv_file_path, params["device_type_detected"])
-                    if related_ping_file:
-                        print(f"Found related Ping file for drive path: {related_ping_file}")
-                        ping_stats_result = ping_statics.calculate_ping_statistics(related_ping_file, params["device_type_detected"])
-                        if ping_stats_result and "Ping RTT" in ping_stats_result:
-                            all_file_stats["Ping RTT"] = ping_stats_result["Ping RTT"]
-                    else:
-                        print(f"No related Ping file found for drive path: {csv_file_path}")
-            
-            # Add MRAB statistics collection
-            elif params["analysis_type_detected"] == "mrab_performance":
-                target_header = "[Call Test] [Throughput] Application DL TP"
-                threshold = 10
-                mrab_intervals = mrab_statistics.extract_intervals_and_values(csv_file_path, target_header, threshold)
-                if mrab_intervals:
-                    mrab_analysis_results, _, _ = mrab_statistics.analyze_grouped_intervals(mrab_intervals) # Unpack and get only the results
-                    if mrab_analysis_results:
-                        all_file_stats["MRAB Statistics"] = mrab_analysis_results
-                else:
-                    print(f"No MRAB intervals found or an error occurred for: {csv_file_path}")
-            
-            # Add Call Performance statistics collection
-            elif params["analysis_type_detected"] == "call_performance":
-                # For call performance, we analyze the entire directory, not individual files here.
-                # This block will be skipped for individual CSVs, and handled after the loop.
-                pass
-            # Voice Quality analysis will also be handled after the loop, so skip here
-            elif params["analysis_type_detected"] == "voice_quality" or params["analysis_type_detected"] == "audio_delay":
-                pass
-
-            # Determine if the file is invalid: it's invalid if no statistical data was collected
-            statistical_keys = ["Throughput", "Jitter", "Error Ratio", "Web Page Load Time", "Ping RTT", "MRAB Statistics"]
-            has_any_statistical_data = False
-            for key in statistical_keys:
-                if key in all_file_stats and all_file_stats[key]: # Check if key exists and its value (the dict) is not empty
-                    has_any_statistical_data = True
-                    break
-            
-            if not has_any_statistical_data and params["analysis_type_detected"] not in ["call_performance", "voice_quality"]: # Don't mark call_performance or voice_quality files as invalid here
-                current_file_has_invalid_data = True
-        
-        if current_file_has_invalid_data:
+    with run_profiler.profile_stage("file discovery"):
+        all_csv_files_processed = data_path_reader.get_csv_file_paths(
+            base_raw_data_dir, 
+            directories_to_process, 
+            excluded_analysis_types=excluded_analysis_types_for_individual_csvs
+        )
+
+    # Now analyze the collected files and merge their records in path order
+    if args.workers > 1:
+        print(f"Analyzing {len(all_csv_files_processed)} files with {args.workers} worker processes.")
+    # PING files are cataloged once per run and each one's statistics are computed at most once
+    with run_profiler.profile_stage("ping catalog"):
+        ping_catalog = data_performance_statics.build_ping_file_catalog(base_raw_data_dir)
+    ping_statistics_by_file = {}
+    for record in _iter_file_records(all_csv_files_processed, args.workers, not args.no_cache, ping_catalog):
+        run_profiler.merge_profile(record.pop("profile", None))
+        record = _finalize_file_record(record, ping_statistics_by_file)
+        csv_file_path = record["file_path"]
+        if record["is_invalid"]:
             invalid_data_files.append(csv_file_path)
             print(f"Invalid data detected or analysis skipped for: {csv_file_path}. File will remain in its original location.")
         else:
@@ -202,7 +299,7 @@ if __name__ == "__main__":
             print(f"Valid data detected for: {csv_file_path}. Added to valid_data_files.")
         
         # Construct the hierarchical path for the JSON output
-        if all_file_stats and params["analysis_type_detected"] not in ["call_performance", "voice_quality"]: # Only insert if stats were successfully collected and not call_performance or voice_quality
+        if record["included_in_results"]:
             relative_path = os.path.relpath(csv_file_path, base_raw_data_dir)
             path_components = relative_path.replace("\\", "/").split('/') # Use forward slashes for consistency
             
@@ -210,75 +307,78 @@ if __name__ == "__main__":
             filename_without_ext = os.path.splitext(path_components[-1])[0]
             path_components[-1] = filename_without_ext
             
-            _insert_into_nested_dict(all_collected_results, path_components, all_file_stats)
+            _insert_into_nested_dict(all_collected_results, path_components, record["file_stats"])
     
     # After processing all individual CSVs, handle directory-level analyses
     for directory_info in directories_to_process:
+        directory_stage = run_profiler.start_stage(f"{directory_info['analysis_type']} directory pass")
         if directory_info["analysis_type"] == "call_performance":
             call_performance_path = os.path.join(base_raw_data_dir, directory_info["path"])
             if os.path.isdir(call_performance_path):
                 print(f"\n--- Starting Call Performance analysis for directory: {call_performance_path} ---")
                 
-                # Iterate through subdirectories within the main Call Performance directory
-                for sub_dir_name in os.listdir(call_performance_path):
-                    sub_dir_full_path = os.path.join(call_performance_path, sub_dir_name)
+                # With --workers, the call logs of all DUT and REF folders are analyzed in one shared process pool
+                with _worker_pool(args.workers, not args.no_cache) as call_executor:
+                    # Iterate through subdirectories within the main Call Performance directory
+                    for sub_dir_name in os.listdir(call_performance_path):
+                        sub_dir_full_path = os.path.join(call_performance_path, sub_dir_name)
                     
-                    if os.path.isdir(sub_dir_full_path):
-                        # Check for DUT and REF subdirectories within the current sub_dir_full_path
-                        dut_call_path = os.path.join(sub_dir_full_path, 'DUT')
-                        ref_call_path = os.path.join(sub_dir_full_path, 'REF')
-
-                        if os.path.isdir(dut_call_path) or os.path.isdir(ref_call_path):
-                            print(f"\n--- Analyzing Call Performance data in: {sub_dir_full_path} ---")
-                            call_results_for_subdir = {}
-
-                            if os.path.isdir(dut_call_path):
-                                print(f"Analyzing DUT call data in: {dut_call_path}")
-                                dut_call_results = analyze_directory(dut_call_path)
-                                if dut_call_results:
-                                    call_results_for_subdir['DUT'] = dut_call_results
-                            else:
-                                print(f"Warning: DUT directory not found for Call Performance at {dut_call_path}")
+                        if os.path.isdir(sub_dir_full_path):
+                            # Check for DUT and REF subdirectories within the current sub_dir_full_path
+                            dut_call_path = os.path.join(sub_dir_full_path, 'DUT')
+                            ref_call_path = os.path.join(sub_dir_full_path, 'REF')
+
+                            if os.path.isdir(dut_call_path) or os.path.isdir(ref_call_path):
+                                print(f"\n--- Analyzing Call Performance data in: {sub_dir_full_path} ---")
+                                call_results_for_subdir = {}
+
+                                if os.path.isdir(dut_call_path):
+                                    print(f"Analyzing DUT call data in: {dut_call_path}")
+                                    dut_call_results = analyze_directory(dut_call_path, call_executor)
+                                    if dut_call_results:
+                                        call_results_for_subdir['DUT'] = dut_call_results
+                                else:
+                                    print(f"Warning: DUT directory not found for Call Performance at {dut_call_path}")
 
-                            if os.path.isdir(ref_call_path):
-                                print(f"Analyzing REF call data in: {ref_call_path}")
-                                ref_call_results = analyze_directory(ref_call_path)
-                                if ref_call_results:
-                                    call_results_for_subdir['REF'] = ref_call_results
-                            else:
-                                print(f"Warning: REF directory not found for Call Performance at {ref_call_path}")
-
-                            if call_results_for_subdir:
-                                # Calculate p-values for aggregated results if both DUT and REF data are available
-                                if 'DUT' in call_results_for_subdir and 'REF' in call_results_for_subdir:
-                                    dut_res = call_results_for_subdir['DUT']
-                                    ref_res = call_results_for_subdir['REF']
-
-                                    # Initiation P-value
-                                    _, initiation_p_value = _calculate_fisher_exact_criteria(
-                                        dut_res['total_initiation_failures'], dut_res['total_attempts'] - dut_res['total_initiation_failures'],
-                                        ref_res['total_initiation_failures'], ref_res['total_attempts'] - ref_res['total_initiation_failures'],
-                                        criteria_type="MO/MT"
-                                    )
-                                    if initiation_p_value is not None:
-                                        call_results_for_subdir['initiation_p_value'] = initiation_p_value
-
-                                    # Retention P-value
-                                    _, retention_p_value = _calculate_fisher_exact_criteria(
-                                        dut_res['total_retention_failures'], dut_res['total_initiation_successes'],
-                                        ref_res['total_retention_failures'], ref_res['total_initiation_successes'],
-                                        criteria_type="MO"
-                                    )
-                                    if retention_p_value is not None:
-                                        call_results_for_subdir['retention_p_value'] = retention_p_value
-
-                                # Insert results under the specific subdirectory's name
-                                _insert_into_nested_dict(all_collected_results, [directory_info["path"], sub_dir_name], call_results_for_subdir)
-                                print(f"Call Performance analysis for {sub_dir_name} completed and added to results.")
+                                if os.path.isdir(ref_call_path):
+                                    print(f"Analyzing REF call data in: {ref_call_path}")
+                                    ref_call_results = analyze_directory(ref_call_path, call_executor)
+                                    if ref_call_results:
+                                        call_results_for_subdir['REF'] = ref_call_results
+                                else:
+                                    print(f"Warning: REF directory not found for Call Performance at {ref_call_path}")
+
+                                if call_results_for_subdir:
+                                    # Calculate p-values for aggregated results if both DUT and REF data are available
+                                    if 'DUT' in call_results_for_subdir and 'REF' in call_results_for_subdir:
+                                        dut_res = call_results_for_subdir['DUT']
+                                        ref_res = call_results_for_subdir['REF']
+
+                                        # Initiation P-value
+                                        _, initiation_p_value = _calculate_fisher_exact_criteria(
+                                            dut_res['total_initiation_failures'], dut_res['total_attempts'] - dut_res['total_initiation_failures'],
+                                            ref_res['total_initiation_failures'], ref_res['total_attempts'] - ref_res['total_initiation_failures'],
+                                            criteria_type="MO/MT"
+                                        )
+                                        if initiation_p_value is not None:
+                                            call_results_for_subdir['initiation_p_value'] = initiation_p_value
+
+                                        # Retention P-value
+                                        _, retention_p_value = _calculate_fisher_exact_criteria(
+                                            dut_res['total_retention_failures'], dut_res['total_initiation_successes'],
+                                            ref_res['total_retention_failures'], ref_res['total_initiation_successes'],
+                                            criteria_type="MO"
+                                        )
+                                        if retention_p_value is not None:
+                                            call_results_for_subdir['retention_p_value'] = retention_p_value
+
+                                    # Insert results under the specific subdirectory's name
+                                    _insert_into_nested_dict(all_collected_results, [directory_info["path"], sub_dir_name], call_results_for_subdir)
+                                    print(f"Call Performance analysis for {sub_dir_name} completed and added to results.")
+                                else:
+                                    print(f"No call performance data collected for {sub_dir_name}.")
                             else:
-                                print(f"No call performance data collected for {sub_dir_name}.")
-                        else:
-                            print(f"Skipping directory {sub_dir_name}: No 'DUT' or 'REF' subdirectories found.")
+                                print(f"Skipping directory {sub_dir_name}: No 'DUT' or 'REF' subdirectories found.")
             else:
                 print(f"Warning: Call Performance directory not found at {call_performance_path}. Skipping analysis.")
         
@@ -287,61 +387,18 @@ if __name__ == "__main__":
             if os.path.isdir(base_voice_quality_path):
                 print(f"\n--- Starting Combined Voice Quality analysis for directory: {base_voice_quality_path} ---")
                 
-                voice_quality_combined_results = {}
-
-                for sub_dir_name in os.listdir(base_voice_quality_path):
-                    sub_dir_full_path = os.path.join(base_voice_quality_path, sub_dir_name)
-                    
-                    if os.path.isdir(sub_dir_full_path):
-                        print(f"Processing Voice Quality subfolder: {sub_dir_name}")
-                        
-                        if "5G Auto VoNR Enabled AMR NB VQ" in sub_dir_name:
-                            print(f"Calling analyze_nb_voice_quality_directory for {sub_dir_name}")
-                            nb_vq_results = analyze_nb_voice_quality_directory(sub_dir_full_path, subdir_filter="VQ")
-                            if nb_vq_results:
-                                organized_nb_vq_results = {}
-                                for file_stats in nb_vq_results:
-                                    # Directly assign to device_type key, avoiding double nesting
-                                    organized_nb_vq_results[file_stats["device_type"]] = {
-                                        "ul_mos_stats": file_stats["ul_mos_stats"],
-                                        "dl_mos_stats": file_stats["dl_mos_stats"]
-                                    }
-                                voice_quality_combined_results[sub_dir_name] = organized_nb_vq_results
-                                print(f"NB VQ analysis for {sub_dir_name} completed.")
-                            else:
-                                print(f"No NB VQ data collected for {sub_dir_name}.")
-
-                        elif "Audio Delay" in sub_dir_name:
-                            print(f"Calling analyze_audio_delay_directory for {sub_dir_name}")
-                            ad_results = analyze_audio_delay_directory(sub_dir_full_path, subdir_filter="Audio Delay")
-                            if ad_results:
-                                organized_ad_results = {}
-                                for file_stats in ad_results:
-                                    if file_stats["device_type"] not in organized_ad_results:
-                                        organized_ad_results[file_stats["device_type"]] = {}
-                                    organized_ad_results[file_stats["device_type"]][os.path.splitext(os.path.basename(file_stats["file_path"]))[0]] = {
-                                        "mean": file_stats["mean"],
-                                        "std_dev": file_stats["std_dev"],
-                                        "min": file_stats["min"],
-                                        "max": file_stats["max"],
-                                        "occurrences": file_stats["occurrences"]
-                                    }
-                                voice_quality_combined_results[sub_dir_name] = organized_ad_results
-                                print(f"Audio Delay analysis for {sub_dir_name} completed.")
-                            else:
-                                print(f"No Audio Delay data collected for {sub_dir_name}.")
-
-                        elif "WB" in sub_dir_name:
-                            print(f"Calling analyze_wb_voice_quality for {sub_dir_name}")
-                            wb_vq_results = analyze_wb_voice_quality(sub_dir_full_path)
-                            if wb_vq_results:
-                                voice_quality_combined_results[sub_dir_name] = wb_vq_results
-                                print(f"WB VQ analysis for {sub_dir_name} completed.")
-                            else:
-                                print(f"No WB VQ data collected for {sub_dir_name}.")
-                        else:
-                            print(f"Skipping subfolder {sub_dir_name}: Does not match any known voice quality analysis type.")
+                # With --workers, the logs of all voice quality folders are analyzed in one shared process pool
+                voice_quality_distributions = {}
+                with _worker_pool(args.workers, not args.no_cache) as voice_quality_executor:
+                    voice_quality_combined_results = analyze_voice_quality(base_voice_quality_path, executor=voice_quality_executor, distributions=voice_quality_distributions)
                 
+                # Per-file MOS and delay histograms, mergeable across files, devices and runs (see VoiceQuality/voice_quality_histograms.py)
+                if voice_quality_distributions:
+                    distributions_output_path = os.path.join(output_dir, "voice_quality_distributions.json")
+                    with open(distributions_output_path, 'w', encoding='utf-8') as f:
+                        json.dump(voice_quality_distributions, f, ensure_ascii=False, separators=(',', ':'))
+                    print(f"Voice quality distributions written to {distributions_output_path}")
+
                 if voice_quality_combined_results:
                     _insert_into_nested_dict(all_collected_results, ["Voice Quality"], voice_quality_combined_results)
                     print(f"Combined Voice Quality analysis for {base_voice_quality_path} completed and added to results.")
@@ -490,6 +547,19 @@ if __name__ == "__main__":
             else:
                 print(f"Warning: 5G VoNR Coverage Performance directory not found at {vonr_coverage_base_path}. Skipping analysis.")
 
+        elif directory_info["analysis_type"] == "coverage_distance_bins":
+            coverage_base_path = os.path.join(base_raw_data_dir, directory_info["path"])
+            if os.path.isdir(coverage_base_path):
+                print(f"\n--- Starting distance-binned coverage aggregation for directory: {coverage_base_path} ---")
+                distance_bins = analyze_coverage_distance_bins(coverage_base_path)
+                if len(distance_bins) > 1: # More than the bin width alone
+                    _insert_into_nested_dict(all_collected_results, ["Coverage Performance", "Distance Bins"], distance_bins)
+                    print(f"Distance-binned coverage aggregation for {coverage_base_path} completed and added to results.")
+                else:
+                    print(f"No coverage logs with GPS data found for distance binning in {coverage_base_path}.")
+            else:
+                print(f"Warning: Coverage Performance directory not found at {coverage_base_path}. Skipping distance binning.")
+
         elif directory_info["analysis_type"] == "google_throughput_analysis":
             google_throughput_base_path = os.path.join(base_raw_data_dir, directory_info["path"])
             if os.path.isdir(google_throughput_base_path):
@@ -550,6 +620,7 @@ if __name__ == "__main__":
                     print(f"No Google Throughput data collected for {google_throughput_base_path}.")
             else:
                 print(f"Warning: Google Throughput directory not found at {google_throughput_base_path}. Skipping analysis.")
+        run_profiler.stop_stage(directory_stage)
 
     # After all other analyses, extract RSRP and Tx Power to CSV
     rsrp_output_folder = os.path.join(scripts_parent_dir, "React", "frontend", "public", "rsrp_data")
@@ -558,31 +629,26 @@ if __name__ == "__main__":
     os.makedirs(rsrp_output_folder, exist_ok=True) # Ensure the RSRP output directory exists
     os.makedirs(tx_power_output_folder, exist_ok=True) # Ensure the Tx Power output directory exists
 
+    extraction_stage = run_profiler.start_stage("RSRP and Tx Power extraction")
     n41_hpue_coverage_test_path = os.path.join(base_raw_data_dir, "Coverage Performance", "5G n41 HPUE Coverage Test")
     if os.path.isdir(n41_hpue_coverage_test_path):
         print(f"\n--- Starting RSRP and Tx Power extraction for directory: {n41_hpue_coverage_test_path} ---")
         for run_folder_name in os.listdir(n41_hpue_coverage_test_path):
             run_folder_path = os.path.join(n41_hpue_coverage_test_path, run_folder_name)
             if os.path.isdir(run_folder_path) and run_folder_name.startswith("Run"):
-                print(f"Extracting RSRP for {run_folder_name}...")
-                extract_coverage_data_to_csv(
+                print(f"Extracting RSRP and Tx Power for {run_folder_name}...")
+                # One pass over the Run folder reads each log once for both series
+                extract_coverage_series_to_csv(
                     folder_path=run_folder_path,
-                    output_folder=rsrp_output_folder,
-                    device_type_filters=['PC2', 'PC3'],
-                    data_column_name='[NR5G] [RF] RSRP',
-                    output_suffix='RSRP_Analysis'
-                )
-                
-                print(f"Extracting Tx Power for {run_folder_name}...")
-                extract_coverage_data_to_csv(
-                    folder_path=run_folder_path,
-                    output_folder=tx_power_output_folder,
-                    device_type_filters=['PC2', 'PC3'],
-                    data_column_name='[NR5G] [Power] Tx power (Total Actual)',
-                    output_suffix='TxPower_Analysis'
+                    series_outputs=[
+                        {"data_column_name": '[NR5G] [RF] RSRP', "output_folder": rsrp_output_folder, "output_suffix": 'RSRP_Analysis'},
+                        {"data_column_name": '[NR5G] [Power] Tx power (Total Actual)', "output_folder": tx_power_output_folder, "output_suffix": 'TxPower_Analysis'},
+                    ],
+                    device_type_filters=['PC2', 'PC3']
                 )
     else:
         print(f"Warning: 5G n41 HPUE Coverage Test directory not found at {n41_hpue_coverage_test_path}. Skipping RSRP and Tx Power extraction.")
+    run_profiler.stop_stage(extraction_stage)
 
     # Write the collected list of CSV files to a TXT file using the new data_path_reader script
     # Note: all_csv_files_processed only contains paths for data_performance and mrab_performance.
@@ -632,3 +698,7 @@ if __name__ == "__main__":
     
     # Call check_empty_data.main with the output_dir
     check_empty_data.main(output_dir)
+
+    if args.profile:
+        profile_json_path, profile_table_path = run_profiler.write_profile_report(output_dir)
+        print(f"\nProfile report written to: {profile_json_path} and {profile_table_path}")
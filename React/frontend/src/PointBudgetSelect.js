@@ -0,0 +1,20 @@
+import React from 'react';
+import { POINT_BUDGETS } from './utils/csvReader';
+
+// Lets a series chart switch between its downsampled zoom levels and the full series
+const PointBudgetSelect = ({ value, onChange }) => (
+  <label style={{ fontSize: '0.9em' }}>
+    Detail:{' '}
+    <select
+      value={value === null ? 'all' : value}
+      onChange={(event) => onChange(event.target.value === 'all' ? null : Number(event.target.value))}
+    >
+      {POINT_BUDGETS.map(pointBudget => (
+        <option key={pointBudget} value={pointBudget}>Up to {pointBudget} points</option>
+      ))}
+      <option value="all">All samples</option>
+    </select>
+  </label>
+);
+
+export default PointBudgetSelect;
@@ -1,7 +1,8 @@
 import React, { useEffect, useRef, useState } from 'react';
 import Chart from 'chart.js/auto';
 import ChartDataLabels from 'chartjs-plugin-datalabels'; // Import the datalabels plugin
-import { fetchAndParseRsrpData } from './utils/csvReader';
+import { fetchAndParseRsrpData, DEFAULT_POINT_BUDGET } from './utils/csvReader';
+import PointBudgetSelect from './PointBudgetSelect';
 import dataAnalysisResults from './data_analysis_results.json'; // Import the JSON data
 
 Chart.register(ChartDataLabels); // Register the plugin globally
@@ -12,13 +13,14 @@ const RsrpChart = ({ runNumber }) => {
   const [chartData, setChartData] = useState({ pc2: [], pc3: [] });
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
+  const [pointBudget, setPointBudget] = useState(DEFAULT_POINT_BUDGET); // null shows every sample
   const [rsrpMarkers, setRsrpMarkers] = useState({ pc2: [], pc3: [] });
 
   useEffect(() => {
     const getChartData = async () => {
       try {
         setLoading(true);
-        const data = await fetchAndParseRsrpData(runNumber);
+        const data = await fetchAndParseRsrpData(runNumber, pointBudget);
         setChartData(data);
         setError(null);
 
@@ -47,7 +49,7 @@ const RsrpChart = ({ runNumber }) => {
     };
 
     getChartData();
-  }, [runNumber]);
+  }, [runNumber, pointBudget]);
 
   useEffect(() => {
     if (!loading && chartRef.current && (chartData.pc2.length > 0 || chartData.pc3.length > 0)) {
@@ -93,7 +95,6 @@ const RsrpChart = ({ runNumber }) => {
       chartInstance.current = new Chart(ctx, {
         type: 'line',
         data: {
-          labels: chartData.pc2.map(dataPoint => dataPoint.x), // X-axis labels from PC2 data points
           datasets: [
             {
               label: 'PC2',
@@ -155,6 +156,7 @@ const RsrpChart = ({ runNumber }) => {
           },
           scales: {
             x: {
+              type: 'linear', // Downsampled PC2 and PC3 keep different samples, so they are placed by their position in the full series
               title: {
                 display: true,
                 text: 'Data Point Order',
@@ -184,8 +186,11 @@ const RsrpChart = ({ runNumber }) => {
   if (chartData.pc2.length === 0 && chartData.pc3.length === 0) return <div>No data available for Run {runNumber}.</div>;
 
   return (
-    <div style={{ width: '80%', height: '400px', marginBottom: '20px' }}>
-      <canvas ref={chartRef}></canvas>
+    <div style={{ width: '80%', marginBottom: '20px' }}>
+      <PointBudgetSelect value={pointBudget} onChange={setPointBudget} />
+      <div style={{ height: '400px' }}>
+        <canvas ref={chartRef}></canvas>
+      </div>
     </div>
   );
 };
@@ -1,7 +1,8 @@
 import React, { useEffect, useRef, useState } from 'react';
 import Chart from 'chart.js/auto';
 import ChartDataLabels from 'chartjs-plugin-datalabels';
-import { fetchAndParseTxPowerData } from './utils/csvReader'; // Import the new Tx Power data fetcher
+import { fetchAndParseTxPowerData, DEFAULT_POINT_BUDGET } from './utils/csvReader'; // Import the new Tx Power data fetcher
+import PointBudgetSelect from './PointBudgetSelect';
 
 Chart.register(ChartDataLabels);
 
@@ -11,12 +12,13 @@ const TxPowerChart = ({ runNumber }) => {
   const [chartData, setChartData] = useState({ pc2: [], pc3: [] });
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
+  const [pointBudget, setPointBudget] = useState(DEFAULT_POINT_BUDGET); // null shows every sample
 
   useEffect(() => {
     const getChartData = async () => {
       try {
         setLoading(true);
-        const data = await fetchAndParseTxPowerData(runNumber); // Use Tx Power data fetcher
+        const data = await fetchAndParseTxPowerData(runNumber, pointBudget); // Use Tx Power data fetcher
         setChartData(data);
         setError(null);
       } catch (err) {
@@ -28,7 +30,7 @@ const TxPowerChart = ({ runNumber }) => {
     };
 
     getChartData();
-  }, [runNumber]);
+  }, [runNumber, pointBudget]);
 
   useEffect(() => {
     if (!loading && chartRef.current && (chartData.pc2.length > 0 || chartData.pc3.length > 0)) {
@@ -41,7 +43,6 @@ const TxPowerChart = ({ runNumber }) => {
       chartInstance.current = new Chart(ctx, {
         type: 'line',
         data: {
-          labels: chartData.pc2.map(dataPoint => dataPoint.x), // X-axis labels from PC2 data points
           datasets: [
             {
               label: 'PC2',
@@ -87,6 +88,7 @@ const TxPowerChart = ({ runNumber }) => {
           },
           scales: {
             x: {
+              type: 'linear', // Downsampled PC2 and PC3 keep different samples, so they are placed by their position in the full series
               title: {
                 display: true,
                 text: 'Data Point Order',
@@ -116,8 +118,11 @@ const TxPowerChart = ({ runNumber }) => {
   if (chartData.pc2.length === 0 && chartData.pc3.length === 0) return <div>No data available for Run {runNumber}.</div>;
 
   return (
-    <div style={{ width: '80%', height: '400px', marginBottom: '20px' }}>
-      <canvas ref={chartRef}></canvas>
+    <div style={{ width: '80%', marginBottom: '20px' }}>
+      <PointBudgetSelect value={pointBudget} onChange={setPointBudget} />
+      <div style={{ height: '400px' }}>
+        <canvas ref={chartRef}></canvas>
+      </div>
     </div>
   );
 };
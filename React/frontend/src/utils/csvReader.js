@@ -1,83 +1,76 @@
 import Papa from 'papaparse'; // Assuming papaparse is installed or will be installed
 
-export const fetchAndParseRsrpData = async (runNumber) => {
-  const filePath = `/rsrp_data/Run${runNumber}_PC2_PC3_RSRP_Analysis.csv`;
-  try {
-    const response = await fetch(filePath);
-    if (!response.ok) {
-      throw new Error(`HTTP error! status: ${response.status}`);
+// Point budgets of the downsampled zoom levels written next to each series CSV (CHART_POINT_BUDGETS in series_downsampler.py)
+export const POINT_BUDGETS = [500, 2000, 8000];
+export const DEFAULT_POINT_BUDGET = 2000;
+
+const fetchCsvText = async (filePath) => {
+  const response = await fetch(filePath);
+  // The dev server answers unknown paths with index.html, so only a CSV response counts as found
+  const contentType = response.headers.get('content-type') || '';
+  if (!response.ok || contentType.includes('text/html')) {
+    throw new Error(`HTTP error! status: ${response.status}`);
+  }
+  return response.text();
+};
+
+// Fetches the zoom level of a series CSV for the given point budget, or the full series when the budget is null.
+// A series with no more points than the budget has no such level, so the full series is read instead.
+const fetchSeriesCsv = async (basePath, pointBudget) => {
+  if (pointBudget) {
+    try {
+      return await fetchCsvText(`${basePath}_${pointBudget}pts.csv`);
+    } catch (error) {
+      // Fall back to the full series below
     }
-    const csvText = await response.text();
+  }
+  return fetchCsvText(`${basePath}.csv`);
+};
 
-    return new Promise((resolve, reject) => {
-      Papa.parse(csvText, {
-        header: true,
-        dynamicTyping: true,
-        skipEmptyLines: true,
-        complete: (results) => {
-          const pc2Data = [];
-          const pc3Data = [];
-          results.data.forEach((row, index) => {
-            // Ensure data is numeric and not null/undefined before pushing
-            const pc2Value = parseFloat(row.PC2);
-            const pc3Value = parseFloat(row.PC3);
+const parseSeriesCsv = (csvText) => new Promise((resolve, reject) => {
+  Papa.parse(csvText, {
+    header: true,
+    dynamicTyping: true,
+    skipEmptyLines: true,
+    complete: (results) => {
+      const pc2Data = [];
+      const pc3Data = [];
+      results.data.forEach((row, index) => {
+        // Zoom levels carry the position of each sample in the full series, so both line up on the same x-axis
+        const x = row.Row !== undefined ? row.Row : index + 1;
+        // Ensure data is numeric and not null/undefined before pushing
+        const pc2Value = parseFloat(row.PC2);
+        const pc3Value = parseFloat(row.PC3);
 
-            if (!isNaN(pc2Value) && pc2Value !== null) {
-              pc2Data.push({ x: index + 1, y: pc2Value });
-            }
-            if (!isNaN(pc3Value) && pc3Value !== null) {
-              pc3Data.push({ x: index + 1, y: pc3Value });
-            }
-          });
-          resolve({ pc2: pc2Data, pc3: pc3Data });
-        },
-        error: (error) => {
-          reject(error);
-        },
+        if (!isNaN(pc2Value) && pc2Value !== null) {
+          pc2Data.push({ x, y: pc2Value });
+        }
+        if (!isNaN(pc3Value) && pc3Value !== null) {
+          pc3Data.push({ x, y: pc3Value });
+        }
       });
-    });
+      resolve({ pc2: pc2Data, pc3: pc3Data });
+    },
+    error: (error) => {
+      reject(error);
+    },
+  });
+});
+
+export const fetchAndParseRsrpData = async (runNumber, pointBudget = DEFAULT_POINT_BUDGET) => {
+  try {
+    const csvText = await fetchSeriesCsv(`/rsrp_data/Run${runNumber}_PC2_PC3_RSRP_Analysis`, pointBudget);
+    return await parseSeriesCsv(csvText);
   } catch (error) {
     console.error(`Error fetching or parsing RSRP CSV for Run${runNumber}:`, error);
     return { pc2: [], pc3: [] };
   }
 };
 
-export const fetchAndParseTxPowerData = async (runNumber) => {
-  const filePath = `/tx_power_data/Run${runNumber}_PC2_PC3_TxPower_Analysis.csv`;
+export const fetchAndParseTxPowerData = async (runNumber, pointBudget = DEFAULT_POINT_BUDGET) => {
   try {
-    const response = await fetch(filePath);
-    if (!response.ok) {
-      throw new Error(`HTTP error! status: ${response.status}`);
-    }
-    const csvText = await response.text();
-
-    return new Promise((resolve, reject) => {
-      Papa.parse(csvText, {
-        header: true,
-        dynamicTyping: true,
-        skipEmptyLines: true,
-        complete: (results) => {
-          const pc2Data = [];
-          const pc3Data = [];
-          results.data.forEach((row, index) => {
-            // Ensure data is numeric and not null/undefined before pushing
-            const pc2Value = parseFloat(row.PC2);
-            const pc3Value = parseFloat(row.PC3);
-
-            if (!isNaN(pc2Value) && pc2Value !== null) {
-              pc2Data.push({ x: index + 1, y: pc2Value });
-            }
-            if (!isNaN(pc3Value) && pc3Value !== null) {
-              pc3Data.push({ x: index + 1, y: pc3Value });
-            }
-          });
-          resolve({ pc2: pc2Data, pc3: pc3Data });
-        },
-        error: (error) => {
-          reject(error);
-        },
-      });
-    });
+    const csvText = await fetchSeriesCsv(`/tx_power_data/Run${runNumber}_PC2_PC3_TxPower_Analysis`, pointBudget);
+    return await parseSeriesCsv(csvText);
   } catch (error) {
     console.error(`Error fetching or parsing Tx Power CSV for Run${runNumber}:`, error);
     return { pc2: [], pc3: [] };
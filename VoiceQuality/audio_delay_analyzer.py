@@ -2,6 +2,15 @@ import pandas as pd
 import numpy as np
 import argparse
 import os
+import sys
+
+# Add the 'Scripts' directory to sys.path so the shared csv_loader module can be imported
+scripts_parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if scripts_parent_dir not in sys.path:
+    sys.path.append(scripts_parent_dir)
+
+from csv_loader import read_projected_csv, read_csv_header
+from VoiceQuality.voice_quality_histograms import build_histogram, DELAY_HISTOGRAM_SPEC_MS
 
 def extract_device_type_from_audio_delay_filename(file_path):
     """
@@ -23,23 +32,23 @@ def extract_device_type_from_audio_delay_filename(file_path):
 def analyze_audio_delay(file_path):
     """
     Analyzes the 'Mouth to Ear Delay (Avg)' from a CSV file and calculates
-    Mean, Standard Deviation, Min, and Max.
+    Mean, Standard Deviation, Min, and Max, plus a mergeable histogram of the delays in ms.
     """
     if not os.path.exists(file_path):
         print(f"Error: File not found at {file_path}")
         return None
 
+    header = '[Call Test] [Voice Quality] [Per Rx Clip] Mouth to Ear Delay (Avg)'
+
     try:
-        df = pd.read_csv(file_path)
+        df = read_projected_csv(file_path, [header], dtypes={header: 'float64'})
     except Exception as e:
         print(f"Error reading CSV file: {e}")
         return None
 
-    header = '[Call Test] [Voice Quality] [Per Rx Clip] Mouth to Ear Delay (Avg)'
-
     if header not in df.columns:
         print(f"Error: Column '{header}' not found in the CSV file.")
-        print(f"Available columns: {df.columns.tolist()}")
+        print(f"Available columns: {read_csv_header(file_path)}")
         return None
 
     # Convert the column to numeric, coercing errors to NaN
@@ -63,7 +72,8 @@ def analyze_audio_delay(file_path):
         "std_dev": std_dev_val,
         "min": min_val,
         "max": max_val,
-        "occurrences": count_val
+        "occurrences": count_val,
+        "delay_histogram": build_histogram(delay_data.to_numpy() * 1000, DELAY_HISTOGRAM_SPEC_MS)
     }
 
 def process_directory(directory_path, subdir_filter=None):
@@ -0,0 +1,97 @@
+import csv
+import numpy as np
+import pandas as pd
+from VoiceQuality.voice_quality_histograms import build_histogram, MOS_HISTOGRAM_SPEC
+
+MOS_VALUE_COLUMN = '[Call Test] [Voice Quality] [Per Rx Clip] MOS Value'
+
+def read_mos_values(file_path, mos_column=MOS_VALUE_COLUMN):
+    """
+    Reads the MOS values of a voice quality log in a single pass over the file.
+    The header is the first line containing the MOS column name (lines above it are skipped); once it is found,
+    only the MOS column is parsed from the rest of the same open file.
+
+    Args:
+        file_path (str): The path to the CSV file.
+        mos_column (str): The MOS column name, matched as a substring of the header names.
+
+    Returns:
+        numpy.ndarray: The numeric MOS values (non-numeric and empty cells dropped),
+                       or None if the header or the column is not found (a warning is printed).
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        header_offset = f.tell()
+        header_line = f.readline()
+        while header_line and mos_column not in header_line:
+            header_offset = f.tell()
+            header_line = f.readline()
+
+        if not header_line:
+            print(f"Warning: Header '{mos_column}' not found in {file_path}")
+            return None
+
+        header = next(csv.reader([header_line]))
+        mos_column_index = next((i for i, column in enumerate(header) if mos_column in column), None)
+        if mos_column_index is None:
+            print(f"Warning: Column '{mos_column}' not found in {file_path}")
+            return None
+
+        # Continue from the header line on the same handle instead of reopening the file and skipping rows
+        f.seek(header_offset)
+        mos_data = pd.read_csv(f, usecols=[mos_column_index])
+
+    return pd.to_numeric(mos_data.iloc[:, 0], errors='coerce').dropna().to_numpy(dtype=float)
+
+def calculate_mos_metrics(mos_values, thresholds):
+    """
+    Calculates the MOS summary of one log from its values.
+
+    Args:
+        mos_values (numpy.ndarray): The MOS values; must not be empty.
+        thresholds (tuple): MOS thresholds reported as '% MOS < <threshold>', in this order.
+
+    Returns:
+        dict: 'MOS Average', 'MOS Stdev' (0.0 for a single value), 'Maximum MOS', 'Counts' and one percentage per threshold.
+    """
+    count = len(mos_values)
+    metrics = {
+        'MOS Average': mos_values.mean(),
+        'MOS Stdev': mos_values.std(ddof=1) if count > 1 else 0.0,
+        'Maximum MOS': mos_values.max(),
+        'Counts': count,
+    }
+    for threshold in thresholds:
+        metrics[f'% MOS < {threshold}'] = np.count_nonzero(mos_values < threshold) / count * 100
+    return metrics
+
+def read_mos_summary(file_path, thresholds):
+    """
+    Reads a voice quality log once and returns its MOS summary (see calculate_mos_metrics)
+    together with a mergeable histogram of its MOS values (see voice_quality_histograms).
+
+    Returns:
+        tuple: (metrics, histogram), or (None, None) if the file has no MOS column, no valid MOS values or cannot be read.
+    """
+    try:
+        mos_values = read_mos_values(file_path)
+        if mos_values is None:
+            return None, None
+
+        if not len(mos_values):
+            print(f"Warning: No valid MOS values found in column '{MOS_VALUE_COLUMN}' in {file_path}")
+            return None, None
+
+        return calculate_mos_metrics(mos_values, thresholds), build_histogram(mos_values, MOS_HISTOGRAM_SPEC)
+
+    except Exception as e:
+        print(f"Error processing file {file_path}: {e}")
+        return None, None
+
+def read_mos_metrics(file_path, thresholds):
+    """
+    Reads a voice quality log once and returns its MOS summary (see calculate_mos_metrics).
+
+    Returns:
+        dict: The MOS metrics, or None if the file has no MOS column, no valid MOS values or cannot be read.
+    """
+    return read_mos_summary(file_path, thresholds)[0]
@@ -1,7 +1,16 @@
 import os
+import sys
 import pandas as pd
 import argparse
 
+# Add the 'Scripts' directory to sys.path so the shared csv_loader module can be imported
+scripts_parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if scripts_parent_dir not in sys.path:
+    sys.path.append(scripts_parent_dir)
+
+from csv_loader import read_projected_csv
+from VoiceQuality.voice_quality_histograms import build_histogram, MOS_HISTOGRAM_SPEC
+
 def extract_device_type(file_path):
     """
     Extracts device type from the filename.
@@ -28,17 +37,17 @@ def extract_device_type(file_path):
 def analyze_csv(file_path):
     """
     Analyzes a single CSV file for voice quality metrics.
-    Extracts UL MOS, DL MOS, and calculates statistics.
+    Extracts UL MOS, DL MOS, and calculates statistics and mergeable histograms (see voice_quality_histograms).
     """
+    ul_mos_header = '[Call Test] [Voice Quality] [UL MOS] MOS'
+    dl_mos_header = '[Call Test] [Voice Quality] [Per Rx Clip] MOS Value'
+
     try:
-        df = pd.read_csv(file_path)
+        df = read_projected_csv(file_path, [ul_mos_header, dl_mos_header], dtypes={ul_mos_header: 'float64', dl_mos_header: 'float64'})
     except Exception as e:
         print(f"Error reading {file_path}: {e}")
         return None, None
 
-    ul_mos_header = '[Call Test] [Voice Quality] [UL MOS] MOS'
-    dl_mos_header = '[Call Test] [Voice Quality] [Per Rx Clip] MOS Value'
-
     ul_mos_scores = []
     dl_mos_scores = []
 
@@ -60,7 +69,9 @@ def analyze_csv(file_path):
         "file_path": file_path,
         "device_type": device_type,
         "ul_mos_stats": ul_stats,
-        "dl_mos_stats": dl_stats
+        "dl_mos_stats": dl_stats,
+        "ul_mos_histogram": build_histogram(ul_mos_scores, MOS_HISTOGRAM_SPEC),
+        "dl_mos_histogram": build_histogram(dl_mos_scores, MOS_HISTOGRAM_SPEC)
     }
 
 def process_directory(directory_path, subdir_filter=None):
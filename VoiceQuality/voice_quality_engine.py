@@ -0,0 +1,210 @@
+import argparse
+import json
+import os
+import sys
+
+# Add the 'Scripts' directory to sys.path so the VoiceQuality analyzers can be imported as a package
+scripts_parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if scripts_parent_dir not in sys.path:
+    sys.path.append(scripts_parent_dir)
+
+from VoiceQuality import voice_quality_analyzer, audio_delay_analyzer, wb_voice_quality_analyzer, VQEVSanalyzer
+from VoiceQuality.mos_reader import read_mos_summary
+
+NB_VQ = "NB"
+AUDIO_DELAY = "Audio Delay"
+EVS_VQ = "EVS"
+WB_VQ = "WB"
+# Sub-folders of a WB or EVS test folder, in the order they appear in the results
+WB_SUBFOLDERS = ['Base', 'Mobile']
+# Nested folders of NB and Audio Delay test folders are only searched if their names contain these filters
+SUBDIR_FILTERS = {NB_VQ: "VQ", AUDIO_DELAY: "Audio Delay"}
+
+def classify_voice_quality_folder(folder_name):
+    """
+    Returns the kind of voice quality test a folder under 'Voice Quality' holds, or None for unknown folders.
+    """
+    if "5G Auto VoNR Enabled AMR NB VQ" in folder_name:
+        return NB_VQ
+    if "Audio Delay" in folder_name:
+        return AUDIO_DELAY
+    if "EVS" in folder_name:
+        return EVS_VQ
+    if "WB" in folder_name:
+        return WB_VQ
+    return None
+
+def discover_voice_quality_files(base_voice_quality_path):
+    """
+    Finds the logs of every voice quality test folder in a single scan of the 'Voice Quality' tree.
+
+    NB and Audio Delay folders are searched recursively, descending only into nested folders whose names
+    contain the kind's filter ('VQ' or 'Audio Delay'); WB and EVS folders only hold logs in their Base and Mobile folders.
+
+    Returns:
+        list: One (folder name, kind, files) tuple per test folder in listing order; kind is None for unknown folders.
+              files lists (sub-folder, file path) pairs in listing order; the sub-folder is 'Base' or 'Mobile' for WB and EVS.
+              The WB and EVS entries also list every existing Base/Mobile folder with a None file path, so empty ones are reported.
+    """
+    test_folders = []
+    files_by_folder = {}
+    for root, dirs, files in os.walk(base_voice_quality_path):
+        relative_parts = os.path.relpath(root, base_voice_quality_path).replace("\\", "/").split('/')
+        if root == base_voice_quality_path:
+            for folder_name in dirs:
+                test_folders.append((folder_name, classify_voice_quality_folder(folder_name)))
+                files_by_folder[folder_name] = []
+            # Unknown folders are not searched
+            dirs[:] = [folder_name for folder_name, kind in test_folders if kind is not None]
+            continue
+
+        folder_name = relative_parts[0]
+        kind = classify_voice_quality_folder(folder_name)
+        folder_files = files_by_folder[folder_name]
+
+        if kind in (WB_VQ, EVS_VQ):
+            if len(relative_parts) == 1:
+                # Matched case-insensitively, as os.path.isdir does on Windows, and visited in WB_SUBFOLDERS order
+                dirs_by_name = {subfolder.lower(): subfolder for subfolder in dirs}
+                dirs[:] = [dirs_by_name[subfolder.lower()] for subfolder in WB_SUBFOLDERS if subfolder.lower() in dirs_by_name]
+                continue
+            subfolder = next(name for name in WB_SUBFOLDERS if name.lower() == relative_parts[1].lower())
+            dirs[:] = [] # Logs are directly inside Base and Mobile
+            folder_files.append((subfolder, None))
+            folder_files.extend((subfolder, os.path.join(root, file)) for file in files if file.endswith('.csv'))
+        else:
+            # The test folder itself is always searched; nested folders must match the filter
+            if len(relative_parts) > 1 and SUBDIR_FILTERS[kind].lower() not in relative_parts[-1].lower():
+                dirs[:] = []
+                continue
+            folder_files.extend((None, os.path.join(root, file)) for file in files if file.endswith('.csv'))
+
+    return [(folder_name, kind, files_by_folder[folder_name]) for folder_name, kind in test_folders]
+
+def _analyze_voice_quality_file(kind, file_path):
+    """
+    Analyzes one voice quality log with the analyzer of its test kind. Runs in a worker process when a pool is used.
+
+    Returns:
+        tuple: (result, distributions); result is what the kind's analyzer reports (None on failure) and
+               distributions maps metric names to the log's histograms (see voice_quality_histograms).
+    """
+    if kind == NB_VQ:
+        print(f"Processing file: {file_path}")
+        file_stats = voice_quality_analyzer.analyze_csv(file_path)
+        # analyze_csv returns (None, None) when the log cannot be read
+        if not isinstance(file_stats, dict):
+            return None, {}
+        return file_stats, {"UL MOS": file_stats.pop("ul_mos_histogram"), "DL MOS": file_stats.pop("dl_mos_histogram")}
+    if kind == AUDIO_DELAY:
+        print(f"Processing audio delay file: {file_path}")
+        file_stats = audio_delay_analyzer.analyze_audio_delay(file_path)
+        if file_stats is None:
+            return None, {}
+        return file_stats, {"Mouth to Ear Delay (ms)": file_stats.pop("delay_histogram")}
+    print(f"Processing {file_path}...")
+    module = VQEVSanalyzer if kind == EVS_VQ else wb_voice_quality_analyzer
+    metrics, histogram = read_mos_summary(file_path, module.MOS_THRESHOLDS)
+    return metrics, ({"MOS": histogram} if histogram is not None else {})
+
+def _organize_nb_results(file_results):
+    organized_nb_vq_results = {}
+    for _, _, file_stats in file_results:
+        if file_stats is not None:
+            # Directly assign to device_type key, avoiding double nesting
+            organized_nb_vq_results[file_stats["device_type"]] = {
+                "ul_mos_stats": file_stats["ul_mos_stats"],
+                "dl_mos_stats": file_stats["dl_mos_stats"]
+            }
+    return organized_nb_vq_results
+
+def _organize_audio_delay_results(file_results):
+    organized_ad_results = {}
+    for _, _, file_stats in file_results:
+        if file_stats is not None:
+            organized_ad_results.setdefault(file_stats["device_type"], {})[os.path.splitext(os.path.basename(file_stats["file_path"]))[0]] = {
+                "mean": file_stats["mean"],
+                "std_dev": file_stats["std_dev"],
+                "min": file_stats["min"],
+                "max": file_stats["max"],
+                "occurrences": file_stats["occurrences"]
+            }
+    return organized_ad_results
+
+def _organize_mos_results(file_results):
+    organized_mos_results = {}
+    for subfolder in WB_SUBFOLDERS:
+        subfolder_results = [(file_path, metrics) for result_subfolder, file_path, metrics in file_results if result_subfolder == subfolder]
+        if not subfolder_results:
+            continue
+        organized_mos_results[subfolder] = {}
+        for file_path, metrics in subfolder_results:
+            if metrics:
+                organized_mos_results[subfolder][os.path.basename(file_path).replace('.csv', '')] = metrics
+    return organized_mos_results
+
+_ORGANIZERS = {
+    NB_VQ: _organize_nb_results,
+    AUDIO_DELAY: _organize_audio_delay_results,
+    EVS_VQ: _organize_mos_results,
+    WB_VQ: _organize_mos_results,
+}
+
+def analyze_voice_quality(base_voice_quality_path, executor=None, distributions=None):
+    """
+    Analyzes every NB, WB (Base/Mobile), EVS and Audio Delay test folder under 'Voice Quality'.
+    The logs of all folders are discovered in one tree scan and analyzed together, in a process pool if one is given.
+
+    Args:
+        base_voice_quality_path (str): The path to the 'Voice Quality' folder.
+        executor (concurrent.futures.Executor, optional): Pool the logs are analyzed in; serial if None.
+        distributions (dict, optional): Filled with test folder name -> file (path relative to the test folder,
+            without '.csv') -> metric -> histogram, so distributions can later be merged across files, devices and runs.
+
+    Returns:
+        dict: Test folder name -> results, nested as the NB, Audio Delay, WB and EVS analyzers report them.
+              Folders without results are left out.
+    """
+    test_folders = discover_voice_quality_files(base_voice_quality_path)
+
+    tasks = [
+        (kind, file_path)
+        for _, kind, files in test_folders if kind is not None
+        for _, file_path in files if file_path is not None
+    ]
+    map_function = executor.map if executor is not None else map
+    analyzed = dict(zip(tasks, map_function(_analyze_voice_quality_file, *zip(*tasks)))) if tasks else {}
+
+    if distributions is not None:
+        for folder_name, kind, files in test_folders:
+            for _, file_path in files:
+                if file_path is None or (kind, file_path) not in analyzed or not analyzed[(kind, file_path)][1]:
+                    continue
+                file_name = os.path.splitext(os.path.relpath(file_path, os.path.join(base_voice_quality_path, folder_name)))[0].replace("\\", "/")
+                distributions.setdefault(folder_name, {})[file_name] = analyzed[(kind, file_path)][1]
+
+    voice_quality_results = {}
+    for folder_name, kind, files in test_folders:
+        if kind is None:
+            print(f"Skipping subfolder {folder_name}: Does not match any known voice quality analysis type.")
+            continue
+
+        file_results = [(subfolder, file_path, analyzed.get((kind, file_path), (None, {}))[0]) for subfolder, file_path in files]
+        folder_results = _ORGANIZERS[kind](file_results)
+        if folder_results:
+            voice_quality_results[folder_name] = folder_results
+            print(f"{kind} voice quality analysis for {folder_name} completed.")
+        else:
+            print(f"No {kind} voice quality data collected for {folder_name}.")
+
+    return voice_quality_results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Analyze all NB, WB, EVS and Audio Delay voice quality logs under a 'Voice Quality' folder.")
+    parser.add_argument("path", help="Path to the 'Voice Quality' folder.")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.path):
+        print(f"Error: Directory not found at '{args.path}'")
+    else:
+        print(json.dumps(analyze_voice_quality(args.path), indent=4, default=float))
@@ -0,0 +1,182 @@
+import argparse
+import json
+import numpy as np
+
+# Fixed bins shared by every histogram of a metric, so histograms of any files, devices and runs can be merged.
+# Thresholds on a bin edge (every 0.01 MOS, every 1 ms) are answered exactly.
+MOS_HISTOGRAM_SPEC = {"start": 0.0, "bin_width": 0.01, "bin_count": 500}
+DELAY_HISTOGRAM_SPEC_MS = {"start": 0.0, "bin_width": 1.0, "bin_count": 2000}
+# Digits bin positions are rounded to, so a value on a bin edge (e.g. 3.0 / 0.01) is not put one bin lower by float error
+_EDGE_DIGITS = 6
+
+def _bin_positions(values, histogram_spec):
+    return np.round((np.asarray(values, dtype=float) - histogram_spec["start"]) / histogram_spec["bin_width"], _EDGE_DIGITS)
+
+def build_histogram(values, histogram_spec):
+    """
+    Builds a fixed-bin histogram of the finite values. Only non-empty bins are stored, which keeps it compact in JSON.
+
+    Args:
+        values (array-like): The samples.
+        histogram_spec (dict): 'start', 'bin_width' and 'bin_count' of the bins (e.g. MOS_HISTOGRAM_SPEC).
+
+    Returns:
+        dict: The spec, the non-empty 'bins' with their 'counts', the 'underflow'/'overflow' counts of samples outside
+              the bins, and the exact 'count', 'sum', 'sum_squares', 'min' and 'max' (None without samples).
+    """
+    values = np.asarray(values, dtype=float)
+    values = values[np.isfinite(values)]
+    positions = np.floor(_bin_positions(values, histogram_spec)).astype(np.int64)
+    inside = (positions >= 0) & (positions < histogram_spec["bin_count"])
+    bins, counts = np.unique(positions[inside], return_counts=True)
+
+    return {
+        **histogram_spec,
+        "bins": bins.tolist(),
+        "counts": counts.tolist(),
+        "underflow": int(np.count_nonzero(positions < 0)),
+        "overflow": int(np.count_nonzero(positions >= histogram_spec["bin_count"])),
+        "count": len(values),
+        "sum": float(values.sum()),
+        "sum_squares": float(np.square(values).sum()),
+        "min": float(values.min()) if len(values) else None,
+        "max": float(values.max()) if len(values) else None,
+    }
+
+def _dense_counts(histogram):
+    dense = np.zeros(histogram["bin_count"], dtype=np.int64)
+    dense[histogram["bins"]] = histogram["counts"]
+    return dense
+
+def merge_histograms(histograms):
+    """
+    Merges histograms with the same bins, e.g. of several files, devices or runs.
+
+    Raises:
+        ValueError: If no histograms are given or their bins differ.
+
+    Returns:
+        dict: The histogram of all their samples.
+    """
+    histograms = list(histograms)
+    if not histograms:
+        raise ValueError("No histograms to merge.")
+    histogram_spec = {key: histograms[0][key] for key in ("start", "bin_width", "bin_count")}
+    if any({key: histogram[key] for key in histogram_spec} != histogram_spec for histogram in histograms):
+        raise ValueError("Histograms with different bins cannot be merged.")
+
+    dense = sum(_dense_counts(histogram) for histogram in histograms)
+    bins = np.flatnonzero(dense)
+    minimums = [histogram["min"] for histogram in histograms if histogram["min"] is not None]
+    maximums = [histogram["max"] for histogram in histograms if histogram["max"] is not None]
+    return {
+        **histogram_spec,
+        "bins": bins.tolist(),
+        "counts": dense[bins].tolist(),
+        "underflow": sum(histogram["underflow"] for histogram in histograms),
+        "overflow": sum(histogram["overflow"] for histogram in histograms),
+        "count": sum(histogram["count"] for histogram in histograms),
+        "sum": sum(histogram["sum"] for histogram in histograms),
+        "sum_squares": sum(histogram["sum_squares"] for histogram in histograms),
+        "min": min(minimums) if minimums else None,
+        "max": max(maximums) if maximums else None,
+    }
+
+def histogram_percent_below(histogram, threshold):
+    """
+    Returns the percentage of samples below threshold, or None without samples.
+    Exact for thresholds on a bin edge; inside a bin, its samples are assumed to be spread evenly.
+    Samples above the last bin are counted as above any threshold up to their maximum.
+    """
+    if not histogram["count"]:
+        return None
+    if threshold > histogram["max"]:
+        return 100.0
+    if threshold <= histogram["min"]:
+        return 0.0
+
+    position = float(_bin_positions(threshold, histogram))
+    full_bins = int(np.floor(position))
+    dense = _dense_counts(histogram)
+    below = histogram["underflow"] if position > 0 else 0
+    below += dense[:max(0, min(full_bins, histogram["bin_count"]))].sum()
+    if 0 <= full_bins < histogram["bin_count"]:
+        below += dense[full_bins] * (position - full_bins)
+    return float(below / histogram["count"] * 100)
+
+def histogram_percentile(histogram, percentile):
+    """
+    Returns the value below which `percentile` percent of the samples fall, or None without samples.
+    Interpolated linearly inside a bin and clamped to the exact minimum and maximum.
+    """
+    if not histogram["count"]:
+        return None
+    target = percentile / 100 * histogram["count"]
+    if target <= histogram["underflow"]:
+        return histogram["min"]
+
+    cumulative = histogram["underflow"] + np.cumsum(_dense_counts(histogram))
+    bin_index = int(np.searchsorted(cumulative, target))
+    if bin_index >= histogram["bin_count"]:
+        return histogram["max"]
+    before = cumulative[bin_index - 1] if bin_index else histogram["underflow"]
+    in_bin = cumulative[bin_index] - before
+    value = histogram["start"] + (bin_index + (target - before) / in_bin) * histogram["bin_width"]
+    return float(min(max(value, histogram["min"]), histogram["max"]))
+
+def histogram_summary(histogram):
+    """
+    Returns the exact count, mean, standard deviations, min and max of a histogram.
+    'std_dev' is the sample standard deviation (0.0 for a single sample), as the MOS statistics report it;
+    'population_std_dev' is the one analyze_audio_delay reports as its 'std_dev'.
+    """
+    count = histogram["count"]
+    if not count:
+        return {"count": 0, "mean": None, "std_dev": None, "population_std_dev": None, "min": None, "max": None}
+    mean = histogram["sum"] / count
+    squared_deviations = max(histogram["sum_squares"] - count * mean * mean, 0.0)
+    return {
+        "count": count,
+        "mean": mean,
+        "std_dev": float(np.sqrt(squared_deviations / (count - 1))) if count > 1 else 0.0,
+        "population_std_dev": float(np.sqrt(squared_deviations / count)),
+        "min": histogram["min"],
+        "max": histogram["max"],
+    }
+
+def select_histograms(distributions, metric, folder_filter=None, file_filter=None):
+    """
+    Collects the histograms of a metric from the per-file distributions written by run_all_data_analysis.py
+    (test folder -> file -> metric -> histogram), keeping folders and files whose names contain the filters.
+    """
+    return [
+        file_distributions[metric]
+        for folder_name, folder_distributions in distributions.items()
+        if not folder_filter or folder_filter.lower() in folder_name.lower()
+        for file_name, file_distributions in folder_distributions.items()
+        if (not file_filter or file_filter.lower() in file_name.lower()) and metric in file_distributions
+    ]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Answer percentiles and threshold percentages from stored voice quality histograms, without reading the raw logs.")
+    parser.add_argument("distributions_path", help="Path to voice_quality_distributions.json (written to 'Analyze Summary' by run_all_data_analysis.py).")
+    parser.add_argument("--metric", default="DL MOS", help="Metric to query: 'UL MOS', 'DL MOS', 'MOS' (WB/EVS) or 'Mouth to Ear Delay (ms)'.")
+    parser.add_argument("--folder", help="Only merge test folders whose names contain this text.")
+    parser.add_argument("--file", help="Only merge files whose names contain this text (e.g. a device such as DUT1).")
+    parser.add_argument("--below", type=float, nargs="*", default=[], help="Thresholds to report the percentage of samples below.")
+    parser.add_argument("--percentiles", type=float, nargs="*", default=[5, 50, 95], help="Percentiles to report.")
+    args = parser.parse_args()
+
+    with open(args.distributions_path, 'r', encoding='utf-8') as f:
+        stored_distributions = json.load(f)
+
+    selected = select_histograms(stored_distributions, args.metric, args.folder, args.file)
+    if not selected:
+        print(f"No '{args.metric}' histograms match the given filters.")
+    else:
+        merged = merge_histograms(selected)
+        print(f"{args.metric} over {len(selected)} file(s): {histogram_summary(merged)}")
+        for threshold in args.below:
+            print(f"  % < {threshold}: {histogram_percent_below(merged, threshold)}")
+        for percentile in args.percentiles:
+            print(f"  P{percentile:g}: {histogram_percentile(merged, percentile)}")
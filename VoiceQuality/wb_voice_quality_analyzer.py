@@ -3,66 +3,24 @@ import pandas as pd
 import argparse
 import re
 import numpy as np
+import sys
+
+# Add the 'Scripts' directory to sys.path so the shared VoiceQuality.mos_reader module can be imported
+scripts_parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if scripts_parent_dir not in sys.path:
+    sys.path.append(scripts_parent_dir)
+
+from VoiceQuality.mos_reader import read_mos_metrics
+
+# Reported as '% MOS < 3.0' and '% MOS < 2.0'
+MOS_THRESHOLDS = (3.0, 2.0)
 
 def parse_mos_metrics(file_path):
     """
     Parses a CSV file to extract MOS values from the relevant column and calculate metrics.
+    The file is read once by the shared MOS reader.
     """
-    try:
-        # Read the CSV file, skipping initial rows if they are empty or not part of the header
-        # The actual header is the first line that contains '[Call Test] [Voice Quality] [Per Rx Clip] MOS Value'
-        
-        # Find the header row index
-        header_row_index = -1
-        with open(file_path, 'r', encoding='utf-8') as f:
-            for i, line in enumerate(f):
-                if '[Call Test] [Voice Quality] [Per Rx Clip] MOS Value' in line:
-                    header_row_index = i
-                    break
-        
-        if header_row_index == -1:
-            print(f"Warning: Header '[Call Test] [Voice Quality] [Per Rx Clip] MOS Value' not found in {file_path}")
-            return None
-
-        df = pd.read_csv(file_path, skiprows=header_row_index, encoding='utf-8')
-
-        # Identify the correct column for MOS Value
-        mos_value_col = None
-        for col in df.columns:
-            if '[Call Test] [Voice Quality] [Per Rx Clip] MOS Value' in col:
-                mos_value_col = col
-                break
-        
-        if mos_value_col is None:
-            print(f"Warning: Column '[Call Test] [Voice Quality] [Per Rx Clip] MOS Value' not found in {file_path}")
-            return None
-
-        # Extract MOS values, convert to numeric, and drop NaNs
-        mos_values = pd.to_numeric(df[mos_value_col], errors='coerce').dropna()
-
-        if mos_values.empty:
-            print(f"Warning: No valid MOS values found in column '{mos_value_col}' in {file_path}")
-            return None
-
-        # Calculate the required metrics
-        metrics = {
-            'MOS Average': mos_values.mean(),
-            'MOS Stdev': mos_values.std(),
-            'Maximum MOS': mos_values.max(),
-            'Counts': len(mos_values),
-            '% MOS < 3.0': (mos_values < 3.0).sum() / len(mos_values) * 100,
-            '% MOS < 2.0': (mos_values < 2.0).sum() / len(mos_values) * 100
-        }
-        
-        # Handle cases where std might be NaN if there's only one value
-        if pd.isna(metrics['MOS Stdev']):
-            metrics['MOS Stdev'] = 0.0
-
-        return metrics
-
-    except Exception as e:
-        print(f"Error processing file {file_path}: {e}")
-        return None
+    return read_mos_metrics(file_path, thresholds=MOS_THRESHOLDS)
 
 def analyze_wb_voice_quality(base_path):
     """
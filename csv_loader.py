@@ -0,0 +1,392 @@
+import pandas as pd
+import hashlib
+import importlib.util
+import json
+import os
+import re
+
+# Parsed logs are cached next to the scripts, keyed by the source path and validated by its size and mtime
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".log_cache")
+# Parquet keeps the cache columnar when pyarrow is installed; pickle is the dependency-free fallback
+CACHE_FORMAT = "parquet" if importlib.util.find_spec("pyarrow") is not None else "pickle"
+
+_cache_settings = {
+    "enabled": True,
+    "cache_dir": DEFAULT_CACHE_DIR,
+}
+
+def _clean_header(header):
+    """
+    Removes content within square brackets (tags) and strips leading/trailing whitespace from a header string.
+    """
+    # Remove content within square brackets, including the brackets themselves
+    cleaned_header = re.sub(r'\[.*?\]', '', str(header)) # Headerless reads have integer column labels
+    # Strip leading/trailing whitespace
+    return cleaned_header.strip()
+
+def read_csv_header(file_path):
+    """
+    Reads only the header row of a CSV file.
+
+    Args:
+        file_path (str): The path to the CSV file.
+
+    Returns:
+        list: The raw column names, exactly as pandas would name them for a full read.
+    """
+    return pd.read_csv(file_path, nrows=0).columns.tolist()
+
+def _map_requested_columns(raw_columns, columns, clean_headers):
+    """
+    Maps the requested column names back to the raw header names of the file.
+    With clean_headers, every raw column whose cleaned name was requested is kept,
+    so duplicated cleaned names behave exactly like a full read followed by _clean_header.
+    """
+    wanted = set(column for column in columns if column)
+    if clean_headers:
+        return [raw for raw in raw_columns if _clean_header(raw) in wanted]
+    return [raw for raw in raw_columns if raw in wanted]
+
+def _map_requested_dtypes(usecols, dtypes, clean_headers):
+    """
+    Maps explicit dtypes keyed by requested column names to the raw column names in `usecols`.
+    """
+    raw_dtypes = {}
+    for raw in usecols:
+        key = _clean_header(raw) if clean_headers else raw
+        if dtypes and key in dtypes:
+            raw_dtypes[raw] = dtypes[key]
+    return raw_dtypes
+
+def _dtype_tag(dtype):
+    """
+    Returns the name a requested dtype is recorded under in a cache entry ('inferred' when none was given).
+    """
+    if dtype is None:
+        return "inferred"
+    return getattr(dtype, "__name__", str(dtype))
+
+def configure_cache(enabled=True, cache_dir=None):
+    """
+    Enables or disables the parsed-log cache used by read_projected_csv.
+
+    Args:
+        enabled (bool): Whether projected reads should go through the cache.
+        cache_dir (str, optional): Directory holding the cache entries. Defaults to DEFAULT_CACHE_DIR.
+    """
+    _cache_settings["enabled"] = enabled
+    _cache_settings["cache_dir"] = cache_dir or DEFAULT_CACHE_DIR
+
+def _cache_key(file_path):
+    """
+    Returns the name all cache files of a source file start with.
+    """
+    return hashlib.sha1(os.path.abspath(file_path).encode("utf-8")).hexdigest()
+
+def _cache_entry_paths(file_path):
+    """
+    Returns the (data_path, metadata_path) of the cache entry for a source file.
+    """
+    key = _cache_key(file_path)
+    extension = ".parquet" if CACHE_FORMAT == "parquet" else ".pkl"
+    cache_dir = _cache_settings["cache_dir"]
+    return os.path.join(cache_dir, key + extension), os.path.join(cache_dir, key + ".json")
+
+def _remove_cache_entry(*paths):
+    """
+    Deletes the files of a cache entry, ignoring files that are already gone.
+    """
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+def _is_cache_metadata_fresh(metadata):
+    """
+    Checks a cache entry's metadata against the current size and mtime of its source file.
+    """
+    try:
+        source_stat = os.stat(metadata["source"])
+    except (OSError, KeyError):
+        return False
+    return metadata.get("size") == source_stat.st_size and metadata.get("mtime_ns") == source_stat.st_mtime_ns
+
+def _load_fresh_cache_metadata(file_path):
+    """
+    Returns the metadata of a fresh cache entry for the file, or None.
+    A stale entry (the source changed size or mtime) is evicted on the spot.
+    """
+    data_path, metadata_path = _cache_entry_paths(file_path)
+    try:
+        with open(metadata_path, 'r', encoding='utf-8') as f:
+            metadata = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not _is_cache_metadata_fresh(metadata):
+        _remove_cache_entry(data_path, metadata_path)
+        return None
+    return metadata
+
+def _read_cached_columns(file_path, raw_columns):
+    """
+    Reads the given raw columns from the cache entry of a file.
+    """
+    data_path, _ = _cache_entry_paths(file_path)
+    if CACHE_FORMAT == "parquet":
+        return pd.read_parquet(data_path, columns=raw_columns)
+    return pd.read_pickle(data_path)[raw_columns]
+
+def _write_cache_entry(file_path, source_stat, raw_header, data, column_dtypes):
+    """
+    Stores the parsed raw columns of a file in the cache, with the dtype tag (see _dtype_tag) each column was requested with.
+    Files are written under temporary names and then renamed, so a concurrent reader never sees a half-written entry.
+    """
+    data_path, metadata_path = _cache_entry_paths(file_path)
+    os.makedirs(_cache_settings["cache_dir"], exist_ok=True)
+    metadata = {
+        "source": os.path.abspath(file_path),
+        "size": source_stat.st_size,
+        "mtime_ns": source_stat.st_mtime_ns,
+        "raw_header": raw_header,
+        "columns": data.columns.tolist(),
+        "dtypes": {raw: column_dtypes[raw] for raw in data.columns},
+    }
+    temp_suffix = f".{os.getpid()}.tmp"
+    try:
+        if CACHE_FORMAT == "parquet":
+            data.to_parquet(data_path + temp_suffix, index=False)
+        else:
+            data.to_pickle(data_path + temp_suffix)
+        with open(metadata_path + temp_suffix, 'w', encoding='utf-8') as f:
+            json.dump(metadata, f)
+        os.replace(data_path + temp_suffix, data_path)
+        os.replace(metadata_path + temp_suffix, metadata_path)
+    except Exception as e:
+        # Caching is best effort (e.g. mixed-type columns Parquet cannot store); the parsed data is still returned
+        print(f"Warning: Could not cache parsed columns of {file_path}: {e}")
+        _remove_cache_entry(data_path + temp_suffix, metadata_path + temp_suffix)
+
+def evict_stale_cache_entries():
+    """
+    Removes every cache entry (parsed columns or memoized result) whose source file was deleted or changed since it was cached.
+
+    Returns:
+        int: The number of evicted entries.
+    """
+    cache_dir = _cache_settings["cache_dir"]
+    if not os.path.isdir(cache_dir):
+        return 0
+
+    evicted_count = 0
+    for file_name in os.listdir(cache_dir):
+        if not file_name.endswith(".json"):
+            continue
+        metadata_path = os.path.join(cache_dir, file_name)
+        try:
+            with open(metadata_path, 'r', encoding='utf-8') as f:
+                metadata = json.load(f)
+        except (OSError, ValueError):
+            metadata = {}
+        if not _is_cache_metadata_fresh(metadata):
+            key = os.path.splitext(file_name)[0]
+            for extension in (".parquet", ".pkl"):
+                _remove_cache_entry(os.path.join(cache_dir, key + extension), metadata_path)
+            evicted_count += 1
+    return evicted_count
+
+def _result_memo_path(file_path, result_name):
+    """
+    Returns the path of the memoized result `result_name` for a source file, next to its cache entry.
+    """
+    return os.path.join(_cache_settings["cache_dir"], f"{_cache_key(file_path)}.{result_name}.json")
+
+def load_cached_result(file_path, result_name):
+    """
+    Returns the result stored for a file with store_cached_result, or None if there is none,
+    the cache is disabled, or the file changed size or mtime since the result was stored.
+
+    Args:
+        file_path (str): The source file the result was computed from.
+        result_name (str): Names the analysis, e.g. 'call_summary_v1'; bump the suffix when the analysis changes.
+
+    Returns:
+        The stored JSON value, or None.
+    """
+    if not _cache_settings["enabled"]:
+        return None
+    memo_path = _result_memo_path(file_path, result_name)
+    try:
+        with open(memo_path, 'r', encoding='utf-8') as f:
+            memo = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not _is_cache_metadata_fresh(memo):
+        _remove_cache_entry(memo_path)
+        return None
+    return memo.get("result")
+
+def store_cached_result(file_path, result_name, result, source_stat=None):
+    """
+    Stores a JSON-serializable per-file analysis result for load_cached_result.
+    Stale results are dropped by evict_stale_cache_entries like parsed-log entries.
+
+    Args:
+        file_path (str): The source file the result was computed from.
+        result_name (str): Names the analysis, as for load_cached_result.
+        result: The JSON-serializable result.
+        source_stat (os.stat_result, optional): The file's stat taken before the analysis read it,
+                                                so a file changed during the analysis is never marked fresh.
+                                                Defaults to the current stat.
+    """
+    if not _cache_settings["enabled"]:
+        return
+    source_stat = source_stat or os.stat(file_path)
+    memo_path = _result_memo_path(file_path, result_name)
+    memo = {
+        "source": os.path.abspath(file_path),
+        "size": source_stat.st_size,
+        "mtime_ns": source_stat.st_mtime_ns,
+        "result": result,
+    }
+    temp_path = memo_path + f".{os.getpid()}.tmp"
+    try:
+        os.makedirs(_cache_settings["cache_dir"], exist_ok=True)
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(memo, f)
+        os.replace(temp_path, memo_path)
+    except Exception as e:
+        # Memoization is best effort, like the parsed-log cache
+        print(f"Warning: Could not cache {result_name} of {file_path}: {e}")
+        _remove_cache_entry(temp_path)
+
+def _read_raw_columns(file_path, usecols, raw_dtypes):
+    """
+    Parses the given raw columns from the CSV file itself, applying explicit dtypes when possible.
+    A column that does not parse with its explicit dtype (e.g. a numeric column holding a non-numeric token)
+    is read with pandas' own type inference instead; the other columns keep their explicit dtypes.
+    """
+    try:
+        return pd.read_csv(file_path, usecols=usecols, dtype=raw_dtypes or None)
+    except ValueError as e:
+        if not raw_dtypes:
+            raise
+        print(f"Warning: Could not apply explicit dtypes to {file_path} ({e}). Retrying column by column.")
+
+    untyped_columns = [raw for raw in usecols if raw not in raw_dtypes]
+    parsed_columns = [pd.read_csv(file_path, usecols=untyped_columns)] if untyped_columns else []
+    for raw, dtype in raw_dtypes.items():
+        try:
+            parsed_columns.append(pd.read_csv(file_path, usecols=[raw], dtype={raw: dtype}))
+        except ValueError:
+            print(f"Warning: Column '{raw}' of {file_path} does not parse as {_dtype_tag(dtype)}. Reading it with an inferred dtype.")
+            parsed_columns.append(pd.read_csv(file_path, usecols=[raw]))
+    # Back in file order, as a single read would return them
+    return pd.concat(parsed_columns, axis=1)[usecols]
+
+def _read_raw_columns_through_cache(file_path, raw_columns_for, raw_dtypes_for):
+    """
+    Returns the projected raw columns of a file, parsing from the CSV only the columns
+    that are not cached yet, or were cached with another dtype, and adding them to the file's cache entry.
+    `raw_columns_for` and `raw_dtypes_for` map the raw header to the wanted columns and dtypes.
+    """
+    source_stat = os.stat(file_path)
+    metadata = _load_fresh_cache_metadata(file_path)
+    raw_header = metadata["raw_header"] if metadata else read_csv_header(file_path)
+    usecols = raw_columns_for(raw_header)
+    raw_dtypes = raw_dtypes_for(usecols)
+    requested_dtypes = {raw: _dtype_tag(raw_dtypes.get(raw)) for raw in usecols}
+
+    cached_columns = metadata["columns"] if metadata else []
+    # Entries written before dtypes were recorded have no tags, so all their columns are parsed again
+    cached_dtypes = metadata.get("dtypes", {}) if metadata else {}
+    cached_data = None
+    if cached_columns:
+        try:
+            cached_data = _read_cached_columns(file_path, cached_columns)
+        except Exception as e:
+            print(f"Warning: Discarding unreadable cache entry for {file_path}: {e}")
+            _remove_cache_entry(*_cache_entry_paths(file_path))
+            cached_columns = []
+            cached_dtypes = {}
+
+    # A column cached with another dtype than requested is a miss; it is parsed again and replaced in the entry
+    missing_columns = [raw for raw in usecols if raw not in cached_columns or cached_dtypes.get(raw) != requested_dtypes[raw]]
+    if missing_columns or cached_data is None:
+        parsed_data = _read_raw_columns(file_path, missing_columns, {raw: raw_dtypes[raw] for raw in missing_columns if raw in raw_dtypes})
+        if cached_data is not None:
+            parsed_data = pd.concat([cached_data.drop(columns=missing_columns, errors='ignore'), parsed_data], axis=1)
+        # Keep the cache columns in file order so the entry always mirrors the raw header
+        stored_columns = [raw for raw in raw_header if raw in parsed_data.columns]
+        cached_data = parsed_data[stored_columns]
+        column_dtypes = {**cached_dtypes, **{raw: requested_dtypes[raw] for raw in missing_columns}}
+        _write_cache_entry(file_path, source_stat, raw_header, cached_data, column_dtypes)
+
+    return cached_data[usecols].copy()
+
+def read_projected_csv(file_path, columns, dtypes=None, clean_headers=False):
+    """
+    Reads only the requested columns of a CSV file.
+
+    The raw header is read first and the requested names are mapped back to raw column names,
+    so only the primary, fallback and event columns an analyzer actually uses are parsed.
+    Requested columns that are missing from the file are simply absent from the result,
+    which keeps the callers' own "column not found" handling unchanged.
+    Unless disabled with configure_cache, parsed columns are kept in a persistent cache entry
+    for the file, so re-runs on an unchanged log never parse the CSV again.
+
+    Args:
+        file_path (str): The path to the CSV file.
+        columns (list): Column names to load. Cleaned names if clean_headers is True, raw names otherwise.
+                        None entries (unused fallbacks) are ignored.
+        dtypes (dict, optional): Explicit dtypes keyed by the same names as `columns`,
+                                 e.g. str for event columns and 'float64' for numeric ones.
+        clean_headers (bool): If True, match and return columns by their _clean_header names.
+
+    Returns:
+        pandas.DataFrame: The projected data, with cleaned column names if clean_headers is True.
+    """
+    def raw_columns_for(raw_header):
+        return _map_requested_columns(raw_header, columns, clean_headers)
+
+    def raw_dtypes_for(usecols):
+        return _map_requested_dtypes(usecols, dtypes, clean_headers)
+
+    if _cache_settings["enabled"]:
+        data = _read_raw_columns_through_cache(file_path, raw_columns_for, raw_dtypes_for)
+    else:
+        usecols = raw_columns_for(read_csv_header(file_path))
+        data = _read_raw_columns(file_path, usecols, raw_dtypes_for(usecols))
+
+    if clean_headers:
+        data.columns = [_clean_header(col) for col in data.columns]
+    return data
+
+def iter_projected_csv_chunks(file_path, columns, dtypes=None, clean_headers=False, chunksize=200000, skip_blank_lines=True):
+    """
+    Streams only the requested columns of a CSV file in chunks of `chunksize` rows.
+
+    Unlike read_projected_csv this bypasses the parsed-log cache, so memory stays bounded
+    by the chunk size no matter how large the file is. Explicit dtypes are applied as given;
+    a column that does not parse with its dtype raises ValueError from the iteration.
+
+    Args:
+        file_path (str): The path to the CSV file.
+        columns (list): Column names to load, as for read_projected_csv.
+        dtypes (dict, optional): Explicit dtypes keyed by the same names as `columns`.
+        clean_headers (bool): If True, match and return columns by their _clean_header names.
+        chunksize (int): Number of rows per chunk.
+        skip_blank_lines (bool): If False, blank lines are kept as rows of NaN, so row positions map to line numbers.
+
+    Yields:
+        pandas.DataFrame: Consecutive chunks of the projected data, with cleaned column names if clean_headers is True.
+    """
+    usecols = _map_requested_columns(read_csv_header(file_path), columns, clean_headers)
+    raw_dtypes = _map_requested_dtypes(usecols, dtypes, clean_headers)
+    with pd.read_csv(file_path, usecols=usecols, dtype=raw_dtypes or None, chunksize=chunksize, skip_blank_lines=skip_blank_lines) as reader:
+        for chunk in reader:
+            if clean_headers:
+                chunk.columns = [_clean_header(col) for col in chunk.columns]
+            yield chunk
@@ -0,0 +1,100 @@
+import numpy as np
+
+def build_interval_set(values, offsets, line_ranges):
+    """
+    Builds an interval set: the samples of many intervals stored back to back in one array,
+    instead of one Python list (and one boxed float per sample) per interval.
+
+    Args:
+        values (array-like): The samples of all intervals, in interval order.
+        offsets (array-like): Interval i holds values[offsets[i]:offsets[i + 1]]; one more entry than there are intervals.
+        line_ranges (array-like): One (start, end) line or row range per interval, kept for debugging.
+
+    Returns:
+        dict: 'values' (float64), 'offsets' (int64) and 'line_ranges' (int64, shape (intervals, 2)) numpy arrays.
+    """
+    return {
+        "values": np.asarray(values, dtype=float),
+        "offsets": np.asarray(offsets, dtype=np.int64),
+        "line_ranges": np.asarray(line_ranges, dtype=np.int64).reshape(-1, 2),
+    }
+
+def empty_interval_set():
+    """
+    Returns an interval set without intervals.
+    """
+    return build_interval_set(np.empty(0), [0], np.empty((0, 2)))
+
+def interval_set_from_rows(row_values, start_positions, end_positions, first_line=0):
+    """
+    Builds an interval set from a column and the row positions of its intervals.
+    Only the non-NaN values of the rows between each start and end position (inclusive) are kept,
+    so an interval without any valid value is kept with no samples.
+
+    Args:
+        row_values (numpy.ndarray): The float values of the column, one per row.
+        start_positions (numpy.ndarray): The first row of each interval, in increasing order.
+        end_positions (numpy.ndarray): The last row of each interval; intervals must not overlap.
+        first_line (int): Added to the row positions to give the line ranges (e.g. 2 for data rows below a header line).
+    """
+    start_positions = np.asarray(start_positions, dtype=np.int64)
+    end_positions = np.asarray(end_positions, dtype=np.int64)
+    valid_rows = np.flatnonzero(~np.isnan(row_values))
+
+    # The interval each valid row falls in: the last one starting at or before it, if it has not ended yet
+    interval_ids = np.searchsorted(start_positions, valid_rows, side='right') - 1
+    inside_interval = interval_ids >= 0
+    inside_interval[inside_interval] = valid_rows[inside_interval] <= end_positions[interval_ids[inside_interval]]
+
+    counts = np.bincount(interval_ids[inside_interval], minlength=len(start_positions))
+    return build_interval_set(
+        row_values[valid_rows[inside_interval]],
+        np.concatenate(([0], np.cumsum(counts))),
+        np.column_stack((start_positions + first_line, end_positions + first_line)),
+    )
+
+def interval_count(interval_set):
+    """
+    Returns the number of intervals.
+    """
+    return len(interval_set["line_ranges"])
+
+def interval_sizes(interval_set):
+    """
+    Returns the number of samples of each interval.
+    """
+    return np.diff(interval_set["offsets"])
+
+def _reduce_intervals(interval_set, ufunc, empty_value):
+    # reduceat needs strictly increasing start offsets, so only intervals with samples are reduced;
+    # the samples between two consecutive non-empty starts all belong to the first of them
+    reduced = np.full(interval_count(interval_set), empty_value, dtype=float)
+    has_samples = interval_sizes(interval_set) > 0
+    if has_samples.any():
+        reduced[has_samples] = ufunc.reduceat(interval_set["values"], interval_set["offsets"][:-1][has_samples])
+    return reduced
+
+def interval_sums(interval_set):
+    """
+    Returns the sum of each interval (0.0 for intervals without samples).
+    """
+    return _reduce_intervals(interval_set, np.add, 0.0)
+
+def interval_means(interval_set):
+    """
+    Returns the mean of each interval (NaN for intervals without samples).
+    """
+    sizes = interval_sizes(interval_set)
+    return np.divide(interval_sums(interval_set), sizes, out=np.full(len(sizes), np.nan), where=sizes > 0)
+
+def interval_maxima(interval_set):
+    """
+    Returns the maximum of each interval (NaN for intervals without samples).
+    """
+    return _reduce_intervals(interval_set, np.maximum, np.nan)
+
+def interval_minima(interval_set):
+    """
+    Returns the minimum of each interval (NaN for intervals without samples).
+    """
+    return _reduce_intervals(interval_set, np.minimum, np.nan)
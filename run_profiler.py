@@ -0,0 +1,196 @@
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+try:
+    import resource # Not available on Windows
+except ImportError:
+    resource = None
+
+try:
+    import psutil # Optional; used for peak memory where the resource module is missing
+except ImportError:
+    psutil = None
+
+PROFILE_JSON_FILE_NAME = "Profile Report.json"
+PROFILE_TABLE_FILE_NAME = "Profile Report.txt"
+
+_profiler_state = {
+    "enabled": False,
+    "current_file": None,
+    "stages": {}, # Stage name -> {"calls", "seconds", "max_seconds"}
+    "files": {}, # File path -> {stage name: seconds}
+    "peak_rss_bytes": 0,
+}
+
+def enable_profiling(enabled=True):
+    """
+    Turns the stage timers on or off. Profiling is off by default, so instrumented code costs
+    only a flag check per stage unless a run asks for a profile.
+    """
+    _profiler_state["enabled"] = enabled
+
+def is_profiling_enabled():
+    """
+    Returns whether the stage timers are on.
+    """
+    return _profiler_state["enabled"]
+
+def _current_rss_peak_bytes():
+    """
+    Returns the peak resident set size of this process in bytes, or 0 if it cannot be measured.
+    """
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+        return peak if sys.platform == "darwin" else peak * 1024
+    if psutil is not None:
+        memory_info = psutil.Process().memory_info()
+        # peak_wset is the Windows peak working set; fall back to the current RSS elsewhere
+        return getattr(memory_info, "peak_wset", memory_info.rss)
+    return 0
+
+def _children_rss_peak_bytes():
+    """
+    Returns the largest peak resident set size of the finished worker processes in bytes, or 0.
+    """
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+def start_stage(stage_name):
+    """
+    Starts timing a stage. Returns a token for stop_stage, or None when profiling is off.
+    Use this pair for long blocks; profile_stage is the context manager form.
+    """
+    if not _profiler_state["enabled"]:
+        return None
+    return (stage_name, _profiler_state["current_file"], time.perf_counter())
+
+def stop_stage(token):
+    """
+    Stops timing a stage started with start_stage and records its duration,
+    both for the stage and for the file being analyzed when it started.
+    """
+    if token is None:
+        return
+    stage_name, file_path, started_at = token
+    elapsed = time.perf_counter() - started_at
+
+    stage = _profiler_state["stages"].setdefault(stage_name, {"calls": 0, "seconds": 0.0, "max_seconds": 0.0})
+    stage["calls"] += 1
+    stage["seconds"] += elapsed
+    stage["max_seconds"] = max(stage["max_seconds"], elapsed)
+
+    if file_path is not None:
+        file_stages = _profiler_state["files"].setdefault(file_path, {})
+        file_stages[stage_name] = file_stages.get(stage_name, 0.0) + elapsed
+
+    _profiler_state["peak_rss_bytes"] = max(_profiler_state["peak_rss_bytes"], _current_rss_peak_bytes())
+
+@contextmanager
+def profile_stage(stage_name):
+    """
+    Times the enclosed block as one call of the given stage.
+    """
+    token = start_stage(stage_name)
+    try:
+        yield
+    finally:
+        stop_stage(token)
+
+@contextmanager
+def profile_file(file_path):
+    """
+    Attributes the stages timed inside the block to a file and adds the block's duration to the file's "total".
+    A file can be profiled in several blocks (e.g. in a worker and then in the parent); their durations add up.
+    """
+    if not _profiler_state["enabled"]:
+        yield
+        return
+    previous_file = _profiler_state["current_file"]
+    _profiler_state["current_file"] = file_path
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        file_stages = _profiler_state["files"].setdefault(file_path, {})
+        file_stages["total"] = file_stages.get("total", 0.0) + time.perf_counter() - started_at
+        _profiler_state["current_file"] = previous_file
+
+def collect_profile():
+    """
+    Returns the timings recorded in this process as a plain, picklable dict and resets them,
+    so worker processes can hand their share of the profile back to the parent.
+    """
+    profile = {
+        "stages": _profiler_state["stages"],
+        "files": _profiler_state["files"],
+        "peak_rss_bytes": _profiler_state["peak_rss_bytes"],
+    }
+    _profiler_state["stages"] = {}
+    _profiler_state["files"] = {}
+    return profile
+
+def merge_profile(profile):
+    """
+    Adds the timings collected by collect_profile in another process to this process's profile.
+    """
+    if not profile:
+        return
+    for stage_name, stage in profile["stages"].items():
+        merged_stage = _profiler_state["stages"].setdefault(stage_name, {"calls": 0, "seconds": 0.0, "max_seconds": 0.0})
+        merged_stage["calls"] += stage["calls"]
+        merged_stage["seconds"] += stage["seconds"]
+        merged_stage["max_seconds"] = max(merged_stage["max_seconds"], stage["max_seconds"])
+    for file_path, file_stages in profile["files"].items():
+        merged_file_stages = _profiler_state["files"].setdefault(file_path, {})
+        for stage_name, seconds in file_stages.items():
+            merged_file_stages[stage_name] = merged_file_stages.get(stage_name, 0.0) + seconds
+    _profiler_state["peak_rss_bytes"] = max(_profiler_state["peak_rss_bytes"], profile["peak_rss_bytes"])
+
+def write_profile_report(output_dir, top_n=20):
+    """
+    Writes the collected profile as a JSON report and a plain-text top-N table to output_dir.
+
+    Args:
+        output_dir (str): The directory to write the reports to (the "Analyze Summary" folder).
+        top_n (int): How many of the slowest stages and files the table lists.
+
+    Returns:
+        tuple: The paths of the JSON report and the table.
+    """
+    peak_rss_bytes = max(_profiler_state["peak_rss_bytes"], _current_rss_peak_bytes())
+    workers_peak_rss_bytes = _children_rss_peak_bytes()
+    stages = sorted(_profiler_state["stages"].items(), key=lambda item: item[1]["seconds"], reverse=True)
+    files = sorted(_profiler_state["files"].items(), key=lambda item: item[1].get("total", 0.0), reverse=True)
+
+    report = {
+        "peak_rss_bytes": peak_rss_bytes,
+        "workers_peak_rss_bytes": workers_peak_rss_bytes,
+        "stages": {stage_name: stage for stage_name, stage in stages},
+        "files": {file_path: file_stages for file_path, file_stages in files},
+    }
+    json_path = os.path.join(output_dir, PROFILE_JSON_FILE_NAME)
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=4)
+
+    table_path = os.path.join(output_dir, PROFILE_TABLE_FILE_NAME)
+    with open(table_path, 'w', encoding='utf-8') as f:
+        f.write(f"Peak RSS: {peak_rss_bytes / 1024 ** 2:.1f} MiB\n")
+        if workers_peak_rss_bytes:
+            f.write(f"Peak RSS of worker processes: {workers_peak_rss_bytes / 1024 ** 2:.1f} MiB\n")
+        f.write(f"\nTop {top_n} stages by total time:\n")
+        f.write(f"{'Stage':<40}{'Calls':>8}{'Total (s)':>12}{'Max (s)':>10}\n")
+        for stage_name, stage in stages[:top_n]:
+            f.write(f"{stage_name:<40}{stage['calls']:>8}{stage['seconds']:>12.3f}{stage['max_seconds']:>10.3f}\n")
+        f.write(f"\nTop {top_n} files by total time:\n")
+        f.write(f"{'Total (s)':>10}  {'Slowest stage':<30}File\n")
+        for file_path, file_stages in files[:top_n]:
+            inner_stages = {stage_name: seconds for stage_name, seconds in file_stages.items() if stage_name != "total"}
+            slowest_stage = max(inner_stages, key=inner_stages.get) if inner_stages else "-"
+            f.write(f"{file_stages.get('total', 0.0):>10.3f}  {slowest_stage:<30}{file_path}\n")
+    return json_path, table_path
@@ -0,0 +1,106 @@
+import os
+import numpy as np
+import pandas as pd
+
+# Point budgets of the downsampled zoom levels written next to a full series CSV (see React/frontend/src/utils/csvReader.js)
+CHART_POINT_BUDGETS = (500, 2000, 8000)
+
+def lttb_indices(x, y, threshold):
+    """
+    Selects `threshold` points of a series with the Largest-Triangle-Three-Buckets algorithm,
+    which keeps the visual shape (peaks, dips, edges) of a line chart far better than taking every n-th point.
+
+    Args:
+        x (array-like): The x values, in increasing order.
+        y (array-like): The y values.
+        threshold (int): The number of points to keep.
+
+    Returns:
+        numpy.ndarray: The sorted positions of the kept points. All positions if the series has no more than `threshold` points.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    point_count = len(x)
+    if threshold >= point_count or threshold < 3:
+        return np.arange(point_count)
+
+    # The first and last points are always kept; the points between them are split into threshold - 2 buckets
+    bucket_edges = np.linspace(1, point_count - 1, threshold - 1).astype(int)
+    selected = np.empty(threshold, dtype=int)
+    selected[0] = 0
+    selected[-1] = point_count - 1
+
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, end = bucket_edges[bucket], bucket_edges[bucket + 1]
+        # The third triangle corner is the average of the next bucket (the last point for the last bucket)
+        next_start, next_end = (bucket_edges[bucket + 1], bucket_edges[bucket + 2]) if bucket + 2 < len(bucket_edges) else (point_count - 1, point_count)
+        average_x = x[next_start:next_end].mean()
+        average_y = y[next_start:next_end].mean()
+
+        # Keep the point of this bucket forming the largest triangle with the previously kept point and that average
+        areas = np.abs((x[previous] - average_x) * (y[start:end] - y[previous]) - (x[previous] - x[start:end]) * (average_y - y[previous]))
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+    return selected
+
+def downsample_columns(data, point_budget, keep_rows=None):
+    """
+    Downsamples every column of a frame of series that share a row axis, each column on its own.
+
+    Args:
+        data (pandas.DataFrame): One series per column; missing or non-numeric samples are skipped.
+        point_budget (int): The maximum number of points per column, kept rows included.
+        keep_rows (dict, optional): Column name -> row positions that must be kept (e.g. marker points); only
+                                    a column with more kept rows than point_budget exceeds it.
+
+    Returns:
+        pandas.DataFrame: A 'Row' column with the 1-based row position of each sample in `data`,
+                          followed by the columns, blank where a column's sample was not kept.
+    """
+    kept_series = []
+    for column in data.columns:
+        values = pd.to_numeric(data[column], errors='coerce').to_numpy(dtype=float)
+        valid_rows = np.flatnonzero(np.isfinite(values))
+        extra_rows = np.intersect1d(np.asarray((keep_rows or {}).get(column, []), dtype=int), valid_rows)
+        if len(valid_rows) <= point_budget:
+            selected_rows = valid_rows
+        else:
+            # The kept rows count against the budget; LTTB needs at least 3 points, so a smaller remainder keeps only them
+            lttb_budget = point_budget - len(extra_rows)
+            selected_rows = valid_rows[lttb_indices(valid_rows, values[valid_rows], lttb_budget)] if lttb_budget >= 3 else extra_rows
+            selected_rows = np.union1d(selected_rows, extra_rows)
+        # Keep the written values exactly as in the full series
+        kept_series.append(pd.Series(data[column].to_numpy()[selected_rows], index=selected_rows, name=column))
+
+    downsampled = pd.concat(kept_series, axis=1) if kept_series else pd.DataFrame()
+    downsampled.insert(0, 'Row', downsampled.index + 1)
+    return downsampled
+
+def write_downsampled_levels(data, output_path, point_budgets=CHART_POINT_BUDGETS, keep_rows=None):
+    """
+    Writes a downsampled copy of a series CSV for every point budget the series exceeds, as
+    '<name>_<budget>pts.csv' next to output_path. Levels the series does not exceed are removed,
+    so a chart never reads a level left over from an earlier, longer run; it falls back to the full CSV instead.
+
+    Args:
+        data (pandas.DataFrame): The series exactly as written to output_path.
+        output_path (str): The path of the full CSV.
+        point_budgets (tuple): The point budgets of the zoom levels.
+        keep_rows (dict, optional): Column name -> row positions every level keeps, see downsample_columns.
+
+    Returns:
+        list: The paths of the written levels.
+    """
+    base_path, extension = os.path.splitext(output_path)
+    longest_column = int(data.apply(lambda column: pd.to_numeric(column, errors='coerce').notna().sum()).max()) if not data.empty else 0
+
+    written_paths = []
+    for point_budget in point_budgets:
+        level_path = f"{base_path}_{point_budget}pts{extension}"
+        if longest_column > point_budget:
+            downsample_columns(data, point_budget, keep_rows).to_csv(level_path, index=False)
+            written_paths.append(level_path)
+        elif os.path.exists(level_path):
+            os.remove(level_path)
+    return written_paths